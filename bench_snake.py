@@ -0,0 +1,551 @@
+#!/usr/bin/env python3
+"""
+Benchmarks for the Snake Evolution engine
+Run: python bench_snake.py [name ...]
+"""
+
+import sys
+import os
+import random
+import time
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from snake_core.engine import SnakeEngine, Direction
+
+
+def serpentine(width: int, height: int, length: int):
+    """Lay `length` cells boustrophedon-style up from the bottom row, head first"""
+    cells = []
+    y = height - 1
+    while len(cells) < length:
+        row = [(x, y) for x in range(width)]
+        if (height - 1 - y) % 2:
+            row.reverse()
+        cells.extend(row)
+        y -= 1
+    cells = cells[:length]
+    cells.reverse()
+    return cells
+
+
+def list_step(snake, width, height, direction):
+    """The original list-based move, kept as a baseline"""
+    head_x, head_y = snake[0]
+    dx, dy = direction.value
+    new_head = (head_x + dx, head_y + dy)
+    if (new_head[0] < 0 or new_head[0] >= width or
+            new_head[1] < 0 or new_head[1] >= height):
+        return False
+    if new_head in snake:
+        return False
+    snake.insert(0, new_head)
+    snake.pop()
+    return True
+
+
+def bench_snake_length(lengths=(10, 1_000, 100_000), width=1000, steps=400, rounds=5):
+    """Time one move for snakes of each length, engine vs. original list body"""
+    print("🐍 Snake move cost by body length")
+    print(f"{'segments':>10} {'engine µs/step':>16} {'list µs/step':>14}")
+    for length in lengths:
+        # Body fills rows from the bottom; the head climbs one row into free
+        # space and then runs along it towards the farther wall.
+        height = -(-length // width) + 3
+        body = serpentine(width, height, length)
+        head_x = body[0][0]
+        run = Direction.RIGHT if head_x < width // 2 else Direction.LEFT
+        engine = SnakeEngine(width, height, seed=0)
+
+        best_engine = float("inf")
+        for _ in range(rounds):
+            engine.reset()
+            engine.place_snake(body)
+            engine.food_pos = (0, 0)
+            engine.step(Direction.UP)
+            start = time.perf_counter()
+            for _ in range(steps):
+                engine.step(run)
+            best_engine = min(best_engine, (time.perf_counter() - start) / steps)
+            assert engine.alive
+
+        # The list baseline is O(n) per move, so keep its sample small
+        list_steps = steps if length <= 10_000 else 20
+        best_list = float("inf")
+        for _ in range(rounds if length <= 10_000 else 1):
+            snake = list(body)
+            list_step(snake, width, height, Direction.UP)
+            start = time.perf_counter()
+            for _ in range(list_steps):
+                list_step(snake, width, height, run)
+            best_list = min(best_list, (time.perf_counter() - start) / list_steps)
+
+        print(f"{length:>10,} {best_engine * 1e6:>16.2f} {best_list * 1e6:>14.2f}")
+
+
+def bench_food_placement(fills=(0.1, 0.9, 0.999), width=200, height=200, samples=20000):
+    """Time generate_food() on boards filled to each ratio"""
+    print("🍎 Food placement cost by board fill")
+    print(f"{'fill':>8} {'µs/placement':>14}")
+    cells = width * height
+    for fill in fills:
+        engine = SnakeEngine(width, height, seed=0)
+        engine.place_snake(serpentine(width, height, int(cells * fill)))
+        start = time.perf_counter()
+        for _ in range(samples):
+            engine.generate_food()
+        elapsed = (time.perf_counter() - start) / samples
+        print(f"{fill:>8.1%} {elapsed * 1e6:>14.2f}")
+
+
+def bench_batch(num_boards=(100, 1_000, 10_000), steps=200):
+    """Board-steps per second for the NumPy batch environment"""
+    import numpy as np
+    from snake_core.batch import BatchSnakeEnv
+
+    print("🧮 Batched boards (40x30), random play with auto-reset")
+    print(f"{'boards':>8} {'board-steps/s':>15}")
+    for n in num_boards:
+        env = BatchSnakeEnv(n, seed=0)
+        rng = np.random.default_rng(0)
+        actions = rng.integers(-1, 4, size=(steps, n))
+        start = time.perf_counter()
+        for i in range(steps):
+            env.step(actions[i])
+            env.reset(env.done)
+        elapsed = time.perf_counter() - start
+        print(f"{n:>8,} {n * steps / elapsed:>15,.0f}")
+
+
+def bench_autopilot(boards=((40, 30), (80, 60)), games=3, max_ticks=3000):
+    """Decisions per second and average length reached for each autopilot strategy"""
+    from snake_core.autopilot import Autopilot, STRATEGIES
+
+    print(f"🤖 Autopilot strategies ({games} games, up to {max_ticks:,} moves each)")
+    print(f"{'board':>8} {'strategy':>12} {'decisions/s':>13} {'avg length':>11}")
+    for width, height in boards:
+        for strategy in STRATEGIES:
+            decisions = 0
+            lengths = []
+            elapsed = 0.0
+            for seed in range(games):
+                engine = SnakeEngine(width, height, seed=seed)
+                autopilot = Autopilot(strategy, seed=seed)
+                start = time.perf_counter()
+                autopilot.play(engine, max_ticks)
+                elapsed += time.perf_counter() - start
+                decisions += autopilot.decisions
+                lengths.append(len(engine.snake))
+            board = f"{width}x{height}"
+            print(f"{board:>8} {strategy:>12} {decisions / elapsed:>13,.0f} "
+                  f"{sum(lengths) / len(lengths):>11.1f}")
+
+
+def bench_shooter(loads=(250, 500, 1_000), frames=120):
+    """Space Shooter update + draw time with thousands of enemies and bullets"""
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    import snake_evolution
+    from snake_evolution import SnakeGame
+
+    game = SnakeGame()
+    print(f"🚀 Space Shooter stress (budget {1000 / 60:.1f} ms/frame at 60 FPS)")
+    print(f"{'entities':>10} {'update ms':>10} {'draw ms':>9} {'frame ms':>9}")
+    for load in loads:
+        snake_evolution.SHOOTER_STRESS_ENEMIES = snake_evolution.SHOOTER_STRESS_BULLETS = load
+        game.init_space_shooter()
+        game.shooter_stress = True
+        update = draw = 0.0
+        for _ in range(frames):
+            start = time.perf_counter()
+            game.update_space_shooter()
+            middle = time.perf_counter()
+            game.draw_space_shooter()
+            update += middle - start
+            draw += time.perf_counter() - middle
+        update, draw = update * 1000 / frames, draw * 1000 / frames
+        print(f"{load:>5,}+{load:<5,} {update:>9.2f} {draw:>9.2f} {update + draw:>9.2f}")
+    game.question_bank.close()
+
+
+def bench_horde(sizes=(100, 1_000, 10_000), frames=60, width=800, height=600):
+    """Zombie Dash frame time: per-zombie loop vs. the NumPy horde"""
+    import pygame
+    from snake_core.horde import Horde
+    from snake_core.pool import EntityPool
+    from snake_evolution import SnakeGame
+
+    screen = pygame.Surface((width, height))
+    sprite = SnakeGame.make_zombie_sprite()
+    player_x, player_y = width // 2, height - 50
+
+    print("🧟 Zombie Dash frame time, ms (update + draw)")
+    print(f"{'zombies':>8} {'loop update':>12} {'loop draw':>10} {'horde update':>13} {'horde draw':>11}")
+    for n in sizes:
+        # Current path: EntityPool seek/near, three circles per zombie
+        pool = EntityPool(n)
+        loop_update = loop_draw = 0.0
+        for _ in range(frames):
+            start = time.perf_counter()
+            while not pool.full:
+                pool.spawn(random.uniform(0, width), random.uniform(0, height))
+            pool.seek(player_x, player_y, 1)
+            for i in pool.near(player_x, player_y, 30):
+                pool.kill(i)
+            middle = time.perf_counter()
+            for i in pool:
+                zx, zy = int(pool.x[i]), int(pool.y[i])
+                pygame.draw.circle(screen, (0, 255, 0), (zx, zy), 12)
+                pygame.draw.circle(screen, (255, 0, 0), (zx - 5, zy - 3), 2)
+                pygame.draw.circle(screen, (255, 0, 0), (zx + 5, zy - 3), 2)
+            loop_update += middle - start
+            loop_draw += time.perf_counter() - middle
+
+        horde = Horde(n, width, height, seed=0)
+        horde_update = horde_draw = 0.0
+        for _ in range(frames):
+            start = time.perf_counter()
+            horde.spawn(n)
+            horde.update(player_x, player_y)
+            middle = time.perf_counter()
+            corners = (horde.positions - 12).astype(int).tolist()
+            screen.blits([(sprite, corner) for corner in corners], doreturn=False)
+            horde_update += middle - start
+            horde_draw += time.perf_counter() - middle
+
+        scale = 1000 / frames
+        print(f"{n:>8,} {loop_update * scale:>12.2f} {loop_draw * scale:>10.2f} "
+              f"{horde_update * scale:>13.2f} {horde_draw * scale:>11.2f}")
+
+
+def bench_ballrun(minutes=60, fps=10):
+    """Ball Run frame time over a long session: first minute vs. last minute"""
+    from snake_evolution import SnakeGame
+
+    game = SnakeGame()
+    game.init_ball_run()
+    rng = random.Random(0)
+    frames_per_minute = 60 * fps
+    print(f"🏐 Ball Run, {minutes} simulated minutes at {fps} FPS")
+    print(f"{'minute':>7} {'ms/frame':>9} {'obstacles':>10} {'score':>6}")
+    for minute in range(1, minutes + 1):
+        start = time.perf_counter()
+        for _ in range(frames_per_minute):
+            ball = game.ball
+            ball.ax = rng.choice((-1, 0, 1)) * 50
+            ball.ay = rng.choice((-1, 0, 1)) * 50
+            # Spawn every frame, far more often than the game does, to keep the world full
+            game.ball_world.add_obstacle(rng.uniform(50, 750), rng.uniform(50, 550), 20, 8.0)
+            game.ball_score += game.ball_world.step(1 / fps).dodged
+        elapsed = time.perf_counter() - start
+        if minute in (1, minutes) or minute % 10 == 0:
+            print(f"{minute:>7} {elapsed / frames_per_minute * 1000:>9.3f} "
+                  f"{len(game.obstacles_ball):>10} {game.ball_score:>6}")
+    game.question_bank.close()
+
+
+class CountingSurface:
+    """Stands in for a Surface and counts the blit() and blits() calls made on it"""
+
+    def __init__(self, surface):
+        self.surface = surface
+        self.calls = 0
+
+    def blit(self, *args, **kwargs):
+        self.calls += 1
+        return self.surface.blit(*args, **kwargs)
+
+    def blits(self, *args, **kwargs):
+        self.calls += 1
+        return self.surface.blits(*args, **kwargs)
+
+    def __getattr__(self, name):
+        return getattr(self.surface, name)
+
+
+def bench_racing(frames=600):
+    """Car Racing draw time and draw calls: the original primitives path vs. the baked road"""
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    import pygame
+    from snake_core.scenes import CallbackScene, SceneRegistry
+    from snake_evolution import SnakeGame, BLUE, RED, WHITE, YELLOW, WINDOW_HEIGHT, WINDOW_WIDTH
+
+    game = SnakeGame()
+    screen = game.screen
+    calls = {"primitives": 0, "baked": 0}
+
+    def draw_primitives():
+        # The draw_car_racing this replaced, one counted call per fill, rect and blit
+        screen.fill((50, 50, 50))
+        for i in range(-1, WINDOW_HEIGHT // 50 + 2):
+            y = i * 50 + game.road_offset
+            pygame.draw.rect(screen, WHITE, (WINDOW_WIDTH // 2 - 5, y, 10, 30))
+        screen.blit(game.render_text(game.font, "🏎️ Car Racing", True, YELLOW), (10, 10))
+        screen.blit(game.render_text(game.font, f"Score: {game.racing_score}", True, WHITE), (10, 50))
+        pygame.draw.rect(screen, BLUE, (game.car_x - 15, game.car_y - 25, 30, 50))
+        obstacles = game.obstacles
+        for i in obstacles:
+            pygame.draw.rect(screen, RED, (obstacles.x[i] - 15, obstacles.y[i] - 25, 30, 50))
+        inst_text = game.render_text(game.small_font, "Left/Right arrows to steer, ESC to exit", True, WHITE)
+        screen.blit(inst_text, (10, WINDOW_HEIGHT - 30))
+        calls["primitives"] += 1 + (WINDOW_HEIGHT // 50 + 3) + 3 + 1 + len(obstacles)
+
+    counter = CountingSurface(screen)
+
+    def draw_baked():
+        # The real draw_car_racing, drawing through a surface that counts its calls
+        game.screen = counter
+        try:
+            game.draw_car_racing()
+        finally:
+            game.screen = screen
+        calls["baked"] = counter.calls
+
+    scenes = SceneRegistry()
+    scenes.register("primitives", CallbackScene(update=game.update_car_racing, draw=draw_primitives))
+    scenes.register("baked", CallbackScene(update=game.update_car_racing, draw=draw_baked))
+    for key in ("primitives", "baked"):
+        random.seed(0)
+        game.init_car_racing()
+        for _ in range(frames):
+            scenes.frame(key)
+
+    print(f"🏎️ Car Racing, {frames} frames per path (scene frame probe)")
+    for line in scenes.report():
+        print(line)
+    for key in ("primitives", "baked"):
+        print(f"{key:<24}{calls[key] / frames:>8.1f} draw calls/frame")
+    game.question_bank.close()
+
+
+def bench_tictactoe(games=3):
+    """Tic-Tac-Toe win checks (list scan vs. bitboard) and AI positions searched per second"""
+    from snake_core.tictactoe import AlphaBetaAI, TicTacToe
+
+    # Old check_ttt_winner: eight index triples over a list of strings
+    lines = [[0, 1, 2], [3, 4, 5], [6, 7, 8], [0, 3, 6], [1, 4, 7], [2, 5, 8], [0, 4, 8], [2, 4, 6]]
+    board = list("XO XO  OX")
+    game = TicTacToe()
+    for cell in (0, 1, 3, 4, 8, 7):
+        game.play(cell)
+    checks = 100_000
+    start = time.perf_counter()
+    for _ in range(checks):
+        any(board[a] == board[b] == board[c] != ' ' for a, b, c in lines)
+    scan = time.perf_counter() - start
+    start = time.perf_counter()
+    for _ in range(checks):
+        game.wins(game.stones[0], 8)
+    bitboard = time.perf_counter() - start
+    print("⭕ Tic-Tac-Toe")
+    print(f"win checks/s: list scan {checks / scan:,.0f}, bitboard {checks / bitboard:,.0f}")
+
+    print(f"{'variant':>14} {'depth':>6} {'positions':>10} {'positions/s':>12} {'worst move ms':>14}")
+    for size, k, depth in ((3, 3, None), (5, 4, 3), (7, 5, 3), (7, 5, 4)):
+        nodes = 0
+        elapsed = worst = 0.0
+        for seed in range(games):
+            rng = random.Random(seed)
+            game, ai = TicTacToe(size, k), AlphaBetaAI(depth)
+            game.play(rng.choice(game.legal_moves()))
+            while not game.over:
+                start = time.perf_counter()
+                game.play(ai.choose(game))
+                move = time.perf_counter() - start
+                elapsed += move
+                worst = max(worst, move)
+            nodes += ai.nodes
+        variant = f"{size}x{size} k={k}"
+        print(f"{variant:>14} {str(depth or 'full'):>6} {nodes:>10,} {nodes / elapsed:>12,.0f} {worst * 1000:>14.1f}")
+
+
+def bench_bigboard(sizes=((40, 30), (200, 200), (1000, 1000), (2000, 2000)), frames=600):
+    """Reset time and frame time as the board grows past the window"""
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    from snake_evolution import SnakeGame
+
+    print(f"🗺️ Board size scaling ({frames} frames at 60 FPS, snake moving every 6th frame)")
+    print(f"{'board':>10} {'renderer':>18} {'reset ms':>9} {'frame ms':>9} {'chunks painted':>15}")
+    for width, height in sizes:
+        game = SnakeGame(board_size=(width, height))
+        start = time.perf_counter()
+        game.start_game()
+        reset = time.perf_counter() - start
+        engine, renderer = game.engine, game.renderer
+        start = time.perf_counter()
+        for frame in range(frames):
+            if frame % 6 == 0:
+                engine.food_pos = None  # Keep the snake moving without question stops
+                engine.step(Direction.DOWN if frame // 6 % 40 >= 20 else Direction.RIGHT)
+            renderer.present((frame % 6 + 1) / 6)
+        elapsed = time.perf_counter() - start
+        painted = getattr(renderer, "chunks_rendered", "-")
+        board = f"{width}x{height}"
+        print(f"{board:>10} {type(renderer).__name__:>18} {reset * 1000:>9.2f} "
+              f"{elapsed * 1000 / frames:>9.3f} {painted:>15}")
+        game.question_bank.close()
+
+
+def bench_sprites(lengths=(50, 300, 1_000), frames=300):
+    """Full playfield redraw: rects and circles per segment vs. one atlas blits() batch"""
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    import pygame
+    from snake_evolution import SnakeGame, BLACK, GREEN, GRID_HEIGHT, GRID_SIZE, GRID_WIDTH, RED, WHITE
+
+    game = SnakeGame()
+    screen, renderer = game.screen, game.renderer
+    glyph = game.font.render("?", True, WHITE)
+
+    def draw_primitives():
+        # Pre-atlas path: a rect per segment, eye and glow circles, a glyph blit
+        screen.fill(BLACK)
+        for x, y in list(game.engine.snake)[1:]:
+            pygame.draw.rect(screen, (0, 200, 0), (x * GRID_SIZE, y * GRID_SIZE, GRID_SIZE, GRID_SIZE))
+        head = renderer.head_rect()
+        pygame.draw.rect(screen, GREEN, head)
+        pygame.draw.circle(screen, WHITE, (head.x + 5, head.y + 5), 3)
+        pygame.draw.circle(screen, WHITE, (head.x + 15, head.y + 5), 3)
+        center = renderer.cell_rect(game.engine.food_pos).center
+        pygame.draw.circle(screen, RED, center, GRID_SIZE // 2)
+        screen.blit(glyph, glyph.get_rect(center=center))
+        pulse = abs(pygame.time.get_ticks() % 1000 - 500) / 500.0
+        pygame.draw.circle(screen, (255, int(255 * pulse), int(255 * pulse)), center, GRID_SIZE // 2 + 2, 2)
+        return len(game.engine.snake) + 5
+
+    def draw_atlas():
+        screen.fill(BLACK)
+        screen.blits(renderer.sprites(), False)
+        return 1
+
+    print("🖼️ Playfield redraw, HUD excluded")
+    print(f"{'length':>8} {'path':>11} {'frame ms':>9} {'draw calls':>11}")
+    for length in lengths:
+        game.engine.place_snake(serpentine(GRID_WIDTH, GRID_HEIGHT, length))
+        game.engine.generate_food()
+        for name, draw in (("primitives", draw_primitives), ("atlas", draw_atlas)):
+            start = time.perf_counter()
+            for _ in range(frames):
+                calls = draw()
+            elapsed = (time.perf_counter() - start) / frames
+            print(f"{length:>8} {name:>11} {elapsed * 1000:>9.3f} {calls:>11}")
+    game.question_bank.close()
+
+
+def bench_tournament(matches=200, size=(20, 15)):
+    """Arena tournament throughput: one process vs. a worker per core"""
+    from snake_core.autopilot import STRATEGIES
+    from snake_core.tournament import run_tournament
+
+    cores = os.cpu_count() or 1
+    print(f"🏟️ Arena tournament, {matches} matches on {size[0]}x{size[1]} ({cores} cores)")
+    for workers in sorted({1, cores}):
+        result = run_tournament(STRATEGIES, matches, workers, width=size[0], height=size[1])
+        for line in result.lines():
+            print(line)
+
+
+def bench_input(maneuvers=1000, move_ms=100, frame_ms=1000 / 60, gap_ms=40):
+    """Quick U-turns (UP then LEFT, gap_ms apart): overwriting the next direction vs. the turn queue"""
+    print(f"⌨️ U-turns with {gap_ms} ms between keys, {move_ms} ms per move, input polled every {frame_ms:.1f} ms")
+    print(f"{'input':>10} {'U-turns made':>13} {'latency ms':>11} {'worst ms':>9}")
+    for mode in ("overwrite", "queue"):
+        rng = random.Random(0)
+        engine = SnakeEngine(50, 50, seed=1)
+        made, latencies = 0, []
+        for _ in range(maneuvers):
+            engine.place_snake([(25, 25)])
+            engine.direction = engine.next_direction = Direction.RIGHT
+            engine.turn_queue.clear()
+            engine.food_pos = None
+            first = rng.uniform(0, move_ms)
+            presses = [(first, Direction.UP), (first + gap_ms, Direction.LEFT)]
+            waiting = []  # Pressed, not yet moved on: (time, direction)
+            frame, next_move = 0, move_ms
+            while next_move < first + gap_ms + 3 * move_ms:
+                now = frame * frame_ms
+                while presses and presses[0][0] <= now:
+                    pressed_at, direction = presses.pop(0)
+                    if mode == "queue":
+                        engine.queue_turn(direction, pressed_at)
+                    else:
+                        engine.turn(direction)
+                    waiting.append((pressed_at, direction))
+                while next_move <= now:
+                    engine.step()
+                    if mode == "queue" and engine.turned_at is not None:
+                        latencies.append(next_move - engine.turned_at)
+                        waiting.pop(0)
+                    elif mode == "overwrite" and waiting and engine.direction in [d for _, d in waiting]:
+                        # The last press before this move wins; earlier ones are lost
+                        pressed_at = max(t for t, d in waiting if d == engine.direction)
+                        latencies.append(next_move - pressed_at)
+                        waiting = []
+                    next_move += move_ms
+                frame += 1
+            head_x, head_y = engine.snake[0]
+            made += engine.direction == Direction.LEFT and head_y < 25 and head_x < 27
+        mean = sum(latencies) / len(latencies)
+        print(f"{mode:>10} {made / maneuvers:>12.0%} {mean:>11.1f} {max(latencies):>9.1f}")
+
+
+def bench_idle(seconds=5.0, states=("MENU", "PAUSED", "GAME_OVER")):
+    """CPU time on static screens: redraw every frame vs. sleeping until input"""
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    from snake_evolution import SnakeGame, GameState
+
+    game = SnakeGame()
+    game.start_game()
+    print(f"💤 {seconds:.0f} s on each static screen, no input")
+    print(f"{'screen':>10} {'loop':>6} {'frames':>7} {'CPU ms/s':>9} {'CPU %':>6}")
+    for name in states:
+        for idle in (False, True):
+            game.state = GameState[name]
+            game.idle_waits = idle
+            frames = 0
+            wall, cpu = time.perf_counter(), time.process_time()
+            while time.perf_counter() - wall < seconds:
+                game.frame()
+                frames += 1
+            wall, cpu = time.perf_counter() - wall, time.process_time() - cpu
+            print(f"{name.lower():>10} {'idle' if idle else 'busy':>6} {frames:>7} "
+                  f"{cpu * 1000 / wall:>9.1f} {cpu / wall:>6.1%}")
+    game.question_bank.close()
+
+
+def bench_screens(repeats=50):
+    """Draw time of every screen and mini-game, rendered off-screen"""
+    import render_snake
+
+    print(f"🖥️ Off-screen draw time per screen, {repeats} draws each")
+    print(f"{'screen':<24}{'draw ms':>9}{'peak ms':>9}")
+    for result in sorted(render_snake.run(repeats=repeats), key=lambda result: -result.draw_ms):
+        print(f"{result.name:<24}{result.draw_ms:>9.2f}{result.peak_ms:>9.2f}")
+
+
+BENCHMARKS = {
+    "length": bench_snake_length,
+    "food": bench_food_placement,
+    "batch": bench_batch,
+    "autopilot": bench_autopilot,
+    "shooter": bench_shooter,
+    "horde": bench_horde,
+    "ballrun": bench_ballrun,
+    "racing": bench_racing,
+    "tictactoe": bench_tictactoe,
+    "bigboard": bench_bigboard,
+    "sprites": bench_sprites,
+    "tournament": bench_tournament,
+    "input": bench_input,
+    "idle": bench_idle,
+    "screens": bench_screens,
+}
+
+
+def main():
+    names = sys.argv[1:] or list(BENCHMARKS)
+    for name in names:
+        BENCHMARKS[name]()
+        print()
+
+
+if __name__ == "__main__":
+    main()
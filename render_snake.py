@@ -0,0 +1,155 @@
+#!/usr/bin/env python3
+"""
+Offscreen render harness for Snake Evolution
+Draws every screen and mini-game to an off-screen Surface, compares it
+with the golden images in golden/ and reports the draw time per screen
+Run: python render_snake.py [--update] [screen ...]
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+from typing import Callable, Dict, List, NamedTuple
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from snake_core.offscreen import MAX_MISMATCH, RenderTarget, load_image, mismatch
+from snake_evolution import SnakeGame, GameState, WINDOW_HEIGHT, WINDOW_WIDTH
+
+GOLDEN_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "golden")
+GOLDEN_SEED = 2024
+WARMUP_FRAMES = 30  # Update frames run before drawing a mini-game, so it has something on screen
+DRAW_REPEATS = 20
+
+
+def setup_playing(game: SnakeGame):
+    """A snake a few cells long, mid-board"""
+    game.start_game()
+    game.engine.reseed(GOLDEN_SEED)
+    for _ in range(3):
+        game.grow_snake()
+    for _ in range(5):
+        game.step_snake()
+    game.state = GameState.PLAYING
+
+
+def setup_paused(game: SnakeGame):
+    setup_playing(game)
+    game.state = GameState.PAUSED
+
+
+def setup_game_over(game: SnakeGame):
+    setup_playing(game)
+    game.game_over()
+
+
+def state_setup(state: GameState) -> Callable[[SnakeGame], None]:
+    def setup(game: SnakeGame):
+        game.state = state
+    return setup
+
+
+def python_game_setup(key: str) -> Callable[[SnakeGame], None]:
+    def setup(game: SnakeGame):
+        game.current_python_game = key
+        game.start_python_game()
+        for _ in range(WARMUP_FRAMES):
+            game.scenes.update(key)
+    return setup
+
+
+def education_game_setup(key: str) -> Callable[[SnakeGame], None]:
+    def setup(game: SnakeGame):
+        game.current_education_game = key
+        game.start_education_game()
+    return setup
+
+
+def screens(game: SnakeGame) -> Dict[str, Callable[[SnakeGame], None]]:
+    """Every GameState screen, with the *_GAME_PLAYING states expanded into their mini-games"""
+    catalog = {
+        "menu": state_setup(GameState.MENU),
+        "playing": setup_playing,
+        "category_select": state_setup(GameState.CATEGORY_SELECT),
+        "education_game_select": state_setup(GameState.EDUCATION_GAME_SELECT),
+        "python_game_select": state_setup(GameState.PYTHON_GAME_SELECT),
+        "game_over": setup_game_over,
+        "paused": setup_paused,
+    }
+    for key in game.education_games:
+        catalog[key] = education_game_setup(key)
+    for key in game.python_games:
+        catalog[key] = python_game_setup(key)
+    return catalog
+
+
+class ScreenResult(NamedTuple):
+    name: str
+    mismatch: float
+    draw_ms: float
+    peak_ms: float
+    status: str  # "ok", "FAIL", "new" (no golden image yet) or "updated"
+
+
+def render_screen(game: SnakeGame, setup: Callable[[SnakeGame], None], target: RenderTarget,
+                  repeats: int = DRAW_REPEATS):
+    """Set a screen up from the golden seed, draw it `repeats` times; returns (pixels, mean ms, peak ms)"""
+    random.seed(GOLDEN_SEED)
+    setup(game)
+    scene = game.active_scene()
+    timings = []
+    with game.drawing_to(target.surface):
+        for _ in range(repeats):
+            start = time.perf_counter()
+            game.draw_scene(scene)
+            timings.append((time.perf_counter() - start) * 1000)
+    return target.array(), sum(timings) / len(timings), max(timings)
+
+
+def run(names: List[str] = (), update: bool = False, repeats: int = DRAW_REPEATS,
+        golden_dir: str = GOLDEN_DIR) -> List[ScreenResult]:
+    """Render the named screens (all if none) and check or rewrite their golden images"""
+    game = SnakeGame()
+    target = RenderTarget.offscreen((WINDOW_WIDTH, WINDOW_HEIGHT))
+    catalog = screens(game)
+    results = []
+    try:
+        for name in names or catalog:
+            pixels, draw_ms, peak_ms = render_screen(game, catalog[name], target, repeats)
+            path = os.path.join(golden_dir, f"{name}.png")
+            expected = load_image(path)
+            difference = mismatch(pixels, expected)
+            if update:
+                os.makedirs(golden_dir, exist_ok=True)
+                target.save(path)
+                status = "updated"
+            elif expected is None:
+                status = "new"
+            else:
+                status = "ok" if difference <= MAX_MISMATCH else "FAIL"
+            results.append(ScreenResult(name, difference, draw_ms, peak_ms, status))
+    finally:
+        game.question_bank.close()
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Render every Snake Evolution screen off-screen")
+    parser.add_argument("screens", nargs="*", help="screens to render (default: all)")
+    parser.add_argument("--update", action="store_true", help="rewrite the golden images")
+    parser.add_argument("--repeats", type=int, default=DRAW_REPEATS, help="draws timed per screen")
+    args = parser.parse_args()
+
+    results = run(args.screens, args.update, args.repeats)
+    print(f"{'screen':<24}{'status':>8}{'mismatch':>10}{'draw ms':>9}{'peak ms':>9}")
+    for result in sorted(results, key=lambda result: -result.draw_ms):
+        print(f"{result.name:<24}{result.status:>8}{result.mismatch:>10.3%}"
+              f"{result.draw_ms:>9.2f}{result.peak_ms:>9.2f}")
+    sys.exit(any(result.status == "FAIL" for result in results))
+
+
+if __name__ == "__main__":
+    main()
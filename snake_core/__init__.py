@@ -0,0 +1,18 @@
+"""
+Snake Evolution Core Package
+Display-free game logic shared by the pygame front end, bots and tools
+"""
+
+from . import autopilot
+from . import engine
+from . import lazy
+from . import physics
+from . import pool
+from . import profiler
+from . import questions
+from . import scenes
+from . import spatial
+from . import text_cache
+from . import tictactoe
+
+__all__ = ['autopilot', 'engine', 'lazy', 'physics', 'pool', 'profiler', 'questions', 'scenes', 'spatial', 'text_cache', 'tictactoe']
@@ -0,0 +1,235 @@
+"""
+🐍 Snake Evolution - Multi-Snake Arena
+Several snakes, human or bot, moving at once on one shared board
+
+All snakes share one flat occupancy grid holding the owner's number
+(index + 1) in every body cell, so collision checks and the autopilot's
+path searches work exactly as on the single-snake engine. Each tick every
+living snake moves one cell at the same time:
+
+    wall or body   moving off the board or into any body cell (own or
+                   another snake's, tails included) kills the mover
+    head-to-head   heads entering the same cell: the longest snake
+                   survives, equal lengths all die
+    food           eating leaves the tail in place for that move
+
+Dead snakes are taken off the board. The match ends when at most one
+snake is left or max_ticks is reached; on time-out the longest snake
+still alive wins. Nothing here touches pygame.
+"""
+
+import random
+from collections import deque
+from dataclasses import dataclass
+from typing import Deque, Dict, List, Optional, Sequence, Tuple
+
+from .autopilot import Autopilot
+from .engine import Direction, OPPOSITE
+
+ARENA_WIDTH = 40
+ARENA_HEIGHT = 30
+START_LENGTH = 3
+MAX_TICKS = 2000  # A bot can circle forever; the longest snake wins on time-out
+
+
+class ArenaSnake:
+    """One snake in an Arena; reads like a SnakeEngine so an Autopilot can drive it"""
+
+    def __init__(self, arena: "Arena", number: int, segments: Sequence[Tuple[int, int]],
+                 direction: Direction, bot: Optional[Autopilot] = None):
+        self.arena = arena
+        self.number = number  # Owner mark in the occupancy grid
+        self.snake: Deque[Tuple[int, int]] = deque(segments)
+        self.direction = direction
+        self.next_direction = direction
+        self.bot = bot
+        self.alive = True
+        self.eaten = 0
+        self.died_at: Optional[int] = None
+        self.pending_growth = 0  # The autopilot plans growth with this
+
+    # The engine attributes the autopilot reads
+
+    @property
+    def width(self) -> int:
+        return self.arena.width
+
+    @property
+    def height(self) -> int:
+        return self.arena.height
+
+    @property
+    def occupancy(self) -> bytearray:
+        return self.arena.occupancy
+
+    @property
+    def food_pos(self) -> Optional[Tuple[int, int]]:
+        """The food nearest to the head"""
+        foods = self.arena.foods
+        if not foods:
+            return None
+        x, y = self.snake[0]
+        return min(foods, key=lambda food: abs(food[0] - x) + abs(food[1] - y))
+
+    def turn(self, direction: Direction) -> bool:
+        """Queue a direction change, ignoring reversals onto the neck"""
+        if direction == OPPOSITE[self.direction]:
+            return False
+        self.next_direction = direction
+        return True
+
+
+class Arena:
+    """Shared board where several snakes move simultaneously"""
+
+    def __init__(self, players: Sequence[Optional[str]], width: int = ARENA_WIDTH, height: int = ARENA_HEIGHT,
+                 seed: Optional[int] = None, food: Optional[int] = None, start_length: int = START_LENGTH):
+        """players: an autopilot strategy per snake, or None for one steered by turn()"""
+        # Bodies trail from a head width // 4 cells in from a side wall
+        if height < 2 * len(players) + 1 or width // 4 < start_length - 1:
+            raise ValueError(f"A {width}x{height} board is too small for {len(players)} snakes")
+        self.width = width
+        self.height = height
+        self.seed = seed if seed is not None else random.randrange(2 ** 63)
+        self.rng = random.Random(self.seed)
+        self.occupancy = bytearray(width * height)
+        self.foods: List[Tuple[int, int]] = []
+        self.ticks = 0
+
+        # Snakes start on evenly spaced rows, facing alternate ways
+        self.snakes: List[ArenaSnake] = []
+        for i, strategy in enumerate(players):
+            y = (i + 1) * height // (len(players) + 1)
+            if i % 2:
+                head, direction, step = width - 1 - width // 4, Direction.LEFT, 1
+            else:
+                head, direction, step = width // 4, Direction.RIGHT, -1
+            segments = [(head + step * k, y) for k in range(start_length)]
+            bot = None if strategy is None else Autopilot(strategy, seed=self.rng.getrandbits(32))
+            snake = ArenaSnake(self, i + 1, segments, direction, bot)
+            for x, y in segments:
+                self.occupancy[y * width + x] = snake.number
+            self.snakes.append(snake)
+
+        for _ in range(len(players) if food is None else food):
+            self.place_food()
+
+    def alive(self) -> List[ArenaSnake]:
+        """Snakes still on the board"""
+        return [snake for snake in self.snakes if snake.alive]
+
+    @property
+    def over(self) -> bool:
+        """One snake or none left; a lone snake plays until it dies"""
+        left = len(self.alive())
+        return left == 0 or (left == 1 and len(self.snakes) > 1)
+
+    def place_food(self) -> bool:
+        """Drop food on a random empty cell; False when there is none"""
+        width, cells = self.width, self.width * self.height
+        # The board is mostly empty: random probes almost always hit a free cell
+        for _ in range(64):
+            index = self.rng.randrange(cells)
+            pos = (index % width, index // width)
+            if not self.occupancy[index] and pos not in self.foods:
+                self.foods.append(pos)
+                return True
+        free = [index for index in range(cells)
+                if not self.occupancy[index] and (index % width, index // width) not in self.foods]
+        if not free:
+            return False
+        index = self.rng.choice(free)
+        self.foods.append((index % width, index // width))
+        return True
+
+    def _kill(self, snake: ArenaSnake):
+        """Take a dead snake off the board"""
+        snake.alive = False
+        snake.died_at = self.ticks
+        width = self.width
+        for x, y in snake.snake:
+            self.occupancy[y * width + x] = 0
+
+    def step(self) -> List[ArenaSnake]:
+        """Move every living snake one cell; returns the snakes that died"""
+        self.ticks += 1
+        width, height, occupancy = self.width, self.height, self.occupancy
+        movers = self.alive()
+        for snake in movers:
+            if snake.bot is not None:
+                snake.turn(snake.bot.decide(snake))
+
+        # Where each head goes; walls and bodies kill straight away
+        died = []
+        targets: Dict[Tuple[int, int], List[ArenaSnake]] = {}
+        for snake in movers:
+            snake.direction = snake.next_direction
+            dx, dy = snake.direction.value
+            x, y = snake.snake[0][0] + dx, snake.snake[0][1] + dy
+            if x < 0 or x >= width or y < 0 or y >= height or occupancy[y * width + x]:
+                died.append(snake)
+            else:
+                targets.setdefault((x, y), []).append(snake)
+
+        # Heads meeting in one cell: only a strictly longest snake gets through
+        for cell, contenders in list(targets.items()):
+            if len(contenders) > 1:
+                longest = max(len(snake.snake) for snake in contenders)
+                winners = [snake for snake in contenders if len(snake.snake) == longest]
+                survivor = winners[0] if len(winners) == 1 else None
+                died.extend(snake for snake in contenders if snake is not survivor)
+                if survivor is None:
+                    del targets[cell]
+                else:
+                    targets[cell] = [survivor]
+
+        for snake in died:
+            self._kill(snake)
+
+        eaten = 0
+        for (x, y), (snake,) in targets.items():
+            snake.snake.appendleft((x, y))
+            occupancy[y * width + x] = snake.number
+            if (x, y) in self.foods:
+                self.foods.remove((x, y))
+                snake.eaten += 1
+                eaten += 1
+            else:
+                tail_x, tail_y = snake.snake.pop()
+                occupancy[tail_y * width + tail_x] = 0
+        for _ in range(eaten):
+            self.place_food()
+        return died
+
+    def winner(self) -> Optional[ArenaSnake]:
+        """Last snake standing, else the longest one alive; None for a draw"""
+        left = self.alive()
+        if not left:
+            return None
+        longest = max(len(snake.snake) for snake in left)
+        leaders = [snake for snake in left if len(snake.snake) == longest]
+        return leaders[0] if len(leaders) == 1 else None
+
+    def play(self, max_ticks: int = MAX_TICKS) -> Optional[ArenaSnake]:
+        """Run bots-only matches to the end; returns the winner"""
+        while not self.over and self.ticks < max_ticks:
+            self.step()
+        return self.winner()
+
+
+@dataclass
+class MatchResult:
+    seed: int
+    players: Tuple[str, ...]
+    winner: Optional[int]  # Index into players; None for a draw
+    ticks: int
+    lengths: Tuple[int, ...]
+
+
+def play_match(players: Sequence[str], seed: int, width: int = ARENA_WIDTH, height: int = ARENA_HEIGHT,
+               max_ticks: int = MAX_TICKS) -> MatchResult:
+    """One bot-vs-bot match; the same seed always plays out the same way"""
+    arena = Arena(players, width, height, seed=seed)
+    winner = arena.play(max_ticks)
+    return MatchResult(seed, tuple(players), None if winner is None else winner.number - 1,
+                       arena.ticks, tuple(len(snake.snake) for snake in arena.snakes))
@@ -0,0 +1,111 @@
+"""
+🐍 Snake Evolution - Sprite Atlas
+Snake and food sprites pre-rendered once onto a single sheet
+
+Row 0 holds the head for each direction (eyes on the leading side), a
+body piece and the tail for each direction (rounded at the free end).
+Row 1 holds the question-mark food in GLOW_PHASES steps of its pulse.
+The renderer draws a whole frame as one Surface.blits() call of
+(sheet, position, area) entries instead of a rect per segment, circles
+for the eyes and glow, and a font blit for the food.
+"""
+
+from __future__ import annotations
+
+from typing import Dict, List
+
+from .engine import Direction
+from .lazy import lazy_import
+
+pygame = lazy_import("pygame")
+
+BLACK = (0, 0, 0)
+WHITE = (255, 255, 255)
+GREEN = (0, 255, 0)
+RED = (255, 0, 0)
+BODY_GREEN = (0, 200, 0)
+COLORKEY = (255, 0, 255)
+
+GLOW_PHASES = 16  # Food pulse frames per second-long cycle
+FOOD_MARGIN = 4  # Glow ring overhang around the food cell, in pixels
+
+# Unit vector pointing from the tail to the segment ahead of it
+TAIL_DIRECTIONS = {direction.value: direction for direction in Direction}
+
+
+def glow_color(phase: int, phases: int = GLOW_PHASES):
+    """Glow ring colour halfway through a pulse phase (white -> red -> white each second)"""
+    ticks = (phase + 0.5) * 1000 / phases
+    pulse = abs(ticks - 500) / 500.0
+    return (255, int(255 * pulse), int(255 * pulse))
+
+
+class SpriteAtlas:
+    """Area rects of every snake and food sprite on one colorkeyed sheet"""
+
+    def __init__(self, cell_size: int, font: pygame.font.Font, glow_phases: int = GLOW_PHASES):
+        self.cell_size = cell_size
+        self.glow_phases = glow_phases
+        size = cell_size
+        food_size = size + 2 * FOOD_MARGIN
+        self.sheet = pygame.Surface((max(9 * size, glow_phases * food_size), size + food_size))
+        self.sheet.fill(COLORKEY)
+        self.sheet.set_colorkey(COLORKEY, pygame.RLEACCEL)
+
+        directions = list(Direction)
+        self.head: Dict[Direction, pygame.Rect] = {}
+        self.tail: Dict[Direction, pygame.Rect] = {}
+        for i, direction in enumerate(directions):
+            self.head[direction] = self._draw_head(pygame.Rect(i * size, 0, size, size), direction)
+        self.body = pygame.Rect(4 * size, 0, size, size)
+        self.sheet.fill(BODY_GREEN, self.body)
+        for i, direction in enumerate(directions):
+            self.tail[direction] = self._draw_tail(pygame.Rect((5 + i) * size, 0, size, size), direction)
+
+        glyph = font.render("?", True, WHITE)
+        self.food: List[pygame.Rect] = [
+            self._draw_food(pygame.Rect(i * food_size, size, food_size, food_size), glyph, glow_color(i, glow_phases))
+            for i in range(glow_phases)]
+
+    def _draw_head(self, area: pygame.Rect, direction: Direction) -> pygame.Rect:
+        """Bright square with two eyes towards the direction of travel"""
+        self.sheet.fill(GREEN, area)
+        near, far = self.cell_size // 4, self.cell_size - self.cell_size // 4
+        dx, dy = direction.value
+        if dx:
+            x = far if dx > 0 else near
+            eyes = ((x, near), (x, far))
+        else:
+            y = far if dy > 0 else near
+            eyes = ((near, y), (far, y))
+        for x, y in eyes:
+            pygame.draw.circle(self.sheet, WHITE, (area.x + x, area.y + y), 3)
+        return area
+
+    def _draw_tail(self, area: pygame.Rect, direction: Direction) -> pygame.Rect:
+        """Body piece, square towards the body and rounded at the free end"""
+        half = self.cell_size // 2
+        dx, dy = direction.value
+        square = pygame.Rect(area.x + (half if dx > 0 else 0), area.y + (half if dy > 0 else 0),
+                             self.cell_size - half * abs(dx), self.cell_size - half * abs(dy))
+        self.sheet.fill(BODY_GREEN, square)
+        pygame.draw.circle(self.sheet, BODY_GREEN, area.center, half)
+        return area
+
+    def _draw_food(self, area: pygame.Rect, glyph: pygame.Surface, glow) -> pygame.Rect:
+        """Red disc, question mark and one phase of the glow ring"""
+        center = area.center
+        radius = self.cell_size // 2
+        pygame.draw.circle(self.sheet, RED, center, radius)
+        self.sheet.blit(glyph, glyph.get_rect(center=center))
+        pygame.draw.circle(self.sheet, glow, center, radius + 2, 2)
+        return area
+
+    def food_at(self, ticks: int) -> pygame.Rect:
+        """Food sprite for a point in time, in milliseconds"""
+        return self.food[ticks % 1000 * self.glow_phases // 1000]
+
+    def tail_towards(self, tail, ahead) -> pygame.Rect:
+        """Tail sprite for a tail cell and the segment ahead of it"""
+        direction = TAIL_DIRECTIONS.get((ahead[0] - tail[0], ahead[1] - tail[1]))
+        return self.body if direction is None else self.tail[direction]
@@ -0,0 +1,336 @@
+"""
+🐍 Snake Evolution - Autopilot
+Automatic player for soak tests and attract mode
+
+Strategies:
+    greedy       shortest path to the food (BFS), else the roomiest move
+    astar        A* to the food, taken only if the tail is still reachable
+                 afterwards; otherwise chase the tail
+    hamiltonian  follow a Hamiltonian cycle of the board, cutting corners
+                 towards the food while the snake is short; never dies
+
+All searches run on the engine's flat occupancy grid. Questions are
+answered correctly with a configurable probability.
+"""
+
+import heapq
+import random
+from typing import Dict, List, Optional, Tuple
+
+from .engine import Direction, Event, OPPOSITE, Question, SnakeEngine
+
+STRATEGIES = ("greedy", "astar", "hamiltonian")
+
+# Cells kept between head and tail when the cycle strategy cuts corners
+CYCLE_MARGIN = 3
+
+_grid_cache: Dict[Tuple[int, int], List[List[Tuple[Direction, int]]]] = {}
+
+
+def neighbor_table(width: int, height: int) -> List[List[Tuple[Direction, int]]]:
+    """(direction, cell) pairs reachable in one move from every cell"""
+    key = (width, height)
+    table = _grid_cache.get(key)
+    if table is None:
+        table = []
+        for index in range(width * height):
+            x, y = index % width, index // width
+            moves = []
+            for direction in Direction:
+                nx, ny = x + direction.value[0], y + direction.value[1]
+                if 0 <= nx < width and 0 <= ny < height:
+                    moves.append((direction, ny * width + nx))
+            table.append(moves)
+        _grid_cache[key] = table
+    return table
+
+
+def hamiltonian_cycle(width: int, height: int) -> Optional[List[int]]:
+    """Cells of a closed tour visiting every cell once; None on odd x odd boards"""
+    if width < 2 or height < 2:
+        return None
+    if height % 2:
+        if width % 2:
+            return None
+        # Build it on the transposed board
+        cycle = hamiltonian_cycle(height, width)
+        return [(index % height) * width + index // height for index in cycle]
+
+    # Along the top row, zig-zag back over columns 1.., then up column 0
+    cycle = list(range(width))
+    for y in range(1, height):
+        xs = range(width - 1, 0, -1) if y % 2 else range(1, width)
+        cycle.extend(y * width + x for x in xs)
+    cycle.extend(y * width for y in range(height - 1, 0, -1))
+    return cycle
+
+
+class Autopilot:
+    """Chooses moves and answers for a SnakeEngine"""
+
+    def __init__(self, strategy: str = "astar", accuracy: float = 1.0, seed: Optional[int] = None):
+        if strategy not in STRATEGIES:
+            raise ValueError(f"Unknown autopilot strategy: {strategy}")
+        self.strategy = strategy
+        self.accuracy = accuracy
+        self.rng = random.Random(seed)
+        self.decisions = 0
+
+        self._board: Optional[Tuple[int, int]] = None
+        self._order: Optional[List[int]] = None
+        self._cycle: Optional[List[int]] = None
+
+    def _setup(self, engine: SnakeEngine):
+        """Build the per-board tables on first use"""
+        self._board = (engine.width, engine.height)
+        self.neighbors = neighbor_table(engine.width, engine.height)
+        self._cycle = hamiltonian_cycle(engine.width, engine.height) if self.strategy == "hamiltonian" else None
+        if self._cycle is not None:
+            self._order = [0] * (engine.width * engine.height)
+            for position, index in enumerate(self._cycle):
+                self._order[index] = position
+
+    def decide(self, engine: SnakeEngine) -> Direction:
+        """Direction for the next move"""
+        if self._board != (engine.width, engine.height):
+            self._setup(engine)
+        self.decisions += 1
+
+        width = engine.width
+        head = engine.snake[0][1] * width + engine.snake[0][0]
+        food = None if engine.food_pos is None else engine.food_pos[1] * width + engine.food_pos[0]
+        # Reversing onto the neck is refused by the engine, so never plan it
+        moves = [(direction, cell) for direction, cell in self.neighbors[head]
+                 if not engine.occupancy[cell] and direction != OPPOSITE[engine.direction]]
+        if not moves:
+            return engine.direction
+
+        if self._cycle is not None:
+            choice = self._cycle_move(engine, head, food, moves)
+        elif self.strategy == "astar":
+            choice = self._safe_astar_move(engine, head, food, moves)
+        else:
+            choice = self._greedy_move(engine, head, food)
+        return choice or self._roomiest_move(engine, moves)
+
+    def choose_answer(self, question: Question) -> int:
+        """Option index: right with probability `accuracy`, otherwise a wrong one"""
+        right = question.options.index(question.answer) if question.answer in question.options else 0
+        wrong = [i for i in range(len(question.options)) if i != right]
+        if not wrong or self.rng.random() < self.accuracy:
+            return right
+        return self.rng.choice(wrong)
+
+    def play(self, engine: SnakeEngine, max_ticks: int = 100_000) -> List[Event]:
+        """Play until the round ends or max_ticks moves; returns the final events"""
+        events: List[Event] = []
+        while engine.alive and engine.ticks < max_ticks:
+            if engine.current_question is not None:
+                events = engine.answer_question(self.choose_answer(engine.current_question))
+            else:
+                engine.turn(self.decide(engine))
+                events = engine.step()
+        return events
+
+    # Searches
+
+    def _bfs_path(self, occupancy, start: int, goal: int) -> Optional[List[int]]:
+        """Shortest path of cells from start (exclusive) to goal over free cells"""
+        seen = bytearray(occupancy)
+        seen[goal] = 0
+        seen[start] = 1
+        parent = {}
+        frontier = [start]
+        neighbors = self.neighbors
+        while frontier:
+            next_frontier = []
+            for cell in frontier:
+                for _, nxt in neighbors[cell]:
+                    if not seen[nxt]:
+                        seen[nxt] = 1
+                        parent[nxt] = cell
+                        if nxt == goal:
+                            return self._unwind(parent, start, goal)
+                        next_frontier.append(nxt)
+            frontier = next_frontier
+        return None
+
+    def _astar_path(self, occupancy, start: int, goal: int, width: int) -> Optional[List[int]]:
+        """A* with the Manhattan heuristic; same contract as _bfs_path"""
+        gx, gy = goal % width, goal // width
+        blocked = bytearray(occupancy)
+        blocked[goal] = 0
+        cost = {start: 0}
+        parent = {start: start}
+        heap = [(0, 0, start)]
+        neighbors = self.neighbors
+        push, pop = heapq.heappush, heapq.heappop
+        while heap:
+            _, g, cell = pop(heap)
+            if cell == goal:
+                return self._unwind(parent, start, goal)
+            if blocked[cell] and cell != start:
+                continue  # Already expanded through a cheaper entry
+            blocked[cell] = 1
+            g += 1
+            for _, nxt in neighbors[cell]:
+                if not blocked[nxt] and g < cost.get(nxt, g + 1):
+                    cost[nxt] = g
+                    parent[nxt] = cell
+                    push(heap, (g + abs(nxt % width - gx) + abs(nxt // width - gy), g, nxt))
+        return None
+
+    @staticmethod
+    def _unwind(parent: Dict[int, int], start: int, goal: int) -> List[int]:
+        path = []
+        cell = goal
+        while cell != start:
+            path.append(cell)
+            cell = parent[cell]
+        path.reverse()
+        return path
+
+    def _flood(self, occupancy, start: int, limit: int) -> int:
+        """Free cells reachable from start, counting up to limit"""
+        seen = {start}
+        stack = [start]
+        neighbors = self.neighbors
+        while stack and len(seen) < limit:
+            cell = stack.pop()
+            for _, nxt in neighbors[cell]:
+                if nxt not in seen and not occupancy[nxt]:
+                    seen.add(nxt)
+                    stack.append(nxt)
+        return len(seen)
+
+    def _direction_to(self, head: int, cell: int) -> Optional[Direction]:
+        for direction, nxt in self.neighbors[head]:
+            if nxt == cell:
+                return direction
+        return None
+
+    # Strategies
+
+    def _greedy_move(self, engine: SnakeEngine, head: int, food: Optional[int]) -> Optional[Direction]:
+        if food is None:
+            return None
+        path = self._bfs_path(engine.occupancy, head, food)
+        if not path:
+            return None
+        direction = self._direction_to(head, path[0])
+        return None if direction == OPPOSITE[engine.direction] else direction
+
+    def _roomiest_move(self, engine: SnakeEngine, moves) -> Direction:
+        """The move leading into the largest free region"""
+        limit = len(engine.snake) + 1
+        best, best_room = moves[0][0], -1
+        for direction, cell in moves:
+            room = self._flood(engine.occupancy, cell, limit)
+            if room > best_room:
+                best, best_room = direction, room
+        return best
+
+    def _occupancy_after(self, engine: SnakeEngine, path: List[int], ate: bool) -> Tuple[bytearray, int, int]:
+        """Occupancy grid, head and tail cells after following path"""
+        width = engine.width
+        occupancy = bytearray(engine.occupancy)
+        for cell in path:
+            occupancy[cell] = 1
+
+        # Tail segments that move off during the path
+        moves = len(path) - (1 if ate else 0)
+        pops = max(0, moves - engine.pending_growth)
+        snake = engine.snake
+        length = len(snake)
+        for i in range(length - 1, max(length - 1 - pops, -1), -1):
+            x, y = snake[i]
+            occupancy[y * width + x] = 0
+        if pops >= length:
+            # The path is longer than the body: part of it is gone again
+            for cell in path[:pops - length]:
+                occupancy[cell] = 0
+            tail = path[pops - length]
+        else:
+            x, y = snake[length - 1 - pops]
+            tail = y * width + x
+        return occupancy, path[-1], tail
+
+    def _reachable(self, occupancy, start: int, goal: int) -> bool:
+        """Whether the head at start can chase the tail at goal over free cells
+
+        The engine counts the tail cell as occupied even on a move that
+        frees it, so a head right next to its tail cannot step onto it:
+        the route needs at least one free cell in between.
+        """
+        if start == goal:
+            return True
+        seen = bytearray(occupancy)
+        seen[goal] = 0
+        stack = [start]
+        neighbors = self.neighbors
+        while stack:
+            cell = stack.pop()
+            for _, nxt in neighbors[cell]:
+                if not seen[nxt]:
+                    if nxt == goal:
+                        if cell != start:
+                            return True
+                        continue
+                    seen[nxt] = 1
+                    stack.append(nxt)
+        return False
+
+    def _tail_reachable(self, engine: SnakeEngine, path: List[int], ate: bool) -> bool:
+        """Whether the head can still reach the tail after following path"""
+        occupancy, head, tail = self._occupancy_after(engine, path, ate)
+        return self._reachable(occupancy, head, tail)
+
+    def _safe_astar_move(self, engine: SnakeEngine, head: int, food: Optional[int], moves) -> Optional[Direction]:
+        if food is not None:
+            path = self._astar_path(engine.occupancy, head, food, engine.width)
+            if path and self._tail_reachable(engine, path, ate=True):
+                direction = self._direction_to(head, path[0])
+                if direction != OPPOSITE[engine.direction]:
+                    return direction
+
+        # No safe way to the food: stall by following the tail, taking the
+        # move that keeps it reachable and stays farthest from it
+        tail = engine.snake[-1][1] * engine.width + engine.snake[-1][0]
+        best, best_distance = None, -1
+        for direction, cell in moves:
+            if not self._tail_reachable(engine, [cell], ate=cell == food):
+                continue
+            distance = abs(cell % engine.width - tail % engine.width) + abs(cell // engine.width - tail // engine.width)
+            if distance > best_distance:
+                best, best_distance = direction, distance
+        return best
+
+    def _cycle_move(self, engine: SnakeEngine, head: int, food: Optional[int], moves) -> Optional[Direction]:
+        order = self._order
+        size = len(order)
+        here = order[head]
+
+        def ahead(cell: int) -> int:
+            return (order[cell] - here) % size
+
+        # Next cell on the tour; always safe while the body lies along it
+        best, best_distance = None, 0
+        for direction, cell in moves:
+            if ahead(cell) == 1:
+                best, best_distance = direction, 1
+
+        length = len(engine.snake)
+        if food is None or length > size // 2:
+            return best
+
+        # Shortcuts: jump forward along the tour, but not past the food
+        # and not so far that the head laps its own tail
+        tail = engine.snake[-1][1] * engine.width + engine.snake[-1][0]
+        room = ahead(tail) if length > 1 else size
+        room -= engine.pending_growth + 1 + CYCLE_MARGIN
+        target = ahead(food)
+        for direction, cell in moves:
+            distance = ahead(cell)
+            if best_distance < distance <= target and distance < room:
+                best, best_distance = direction, distance
+        return best
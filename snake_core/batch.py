@@ -0,0 +1,238 @@
+"""
+🐍 Snake Evolution - Batched Boards
+Steps thousands of Snake boards in lockstep on NumPy arrays
+
+Mirrors the rules of SnakeEngine: walls and the body (tail included)
+kill, eating grows the snake by one, food lands on a random free cell,
+a full board ends the round, and answering questions applies the same
+score, streak, level and speed rules. Every board is advanced by the
+same handful of array operations, with no per-board Python loop.
+"""
+
+from typing import NamedTuple, Optional
+
+import numpy as np
+
+from .engine import (
+    GRID_WIDTH, GRID_HEIGHT, INITIAL_MOVE_DELAY, MIN_MOVE_DELAY, MOVE_DELAY_STEP,
+    ANSWERS_PER_LEVEL, Direction,
+)
+
+# Action indices follow Direction's declaration order
+DIRECTIONS = list(Direction)
+DX = np.array([d.value[0] for d in DIRECTIONS], dtype=np.int32)
+DY = np.array([d.value[1] for d in DIRECTIONS], dtype=np.int32)
+OPPOSITE_ACTION = np.array([DIRECTIONS.index(Direction.DOWN), DIRECTIONS.index(Direction.UP),
+                            DIRECTIONS.index(Direction.RIGHT), DIRECTIONS.index(Direction.LEFT)],
+                           dtype=np.int8)
+KEEP = -1  # Action meaning "keep going straight"
+
+# Random probes per board before falling back to a masked scan
+FOOD_TRIES = 8
+
+
+class BatchEvents(NamedTuple):
+    """Per-board boolean masks describing one step"""
+    moved: np.ndarray
+    ate_food: np.ndarray
+    died: np.ndarray
+    board_full: np.ndarray
+
+
+class BatchSnakeEnv:
+    """N independent Snake boards stored as arrays and stepped together"""
+
+    def __init__(self, num_boards: int, width: int = GRID_WIDTH, height: int = GRID_HEIGHT,
+                 questions: bool = False, seed: Optional[int] = None):
+        self.num_boards = num_boards
+        self.width = width
+        self.height = height
+        self.cells = width * height
+        self.questions = questions
+        self.rng = np.random.default_rng(seed)
+        self._boards = np.arange(num_boards)
+
+        n, cells = num_boards, self.cells
+        # Body as a ring buffer of flat cell indices; head at head_ptr
+        self.body = np.zeros((n, cells), dtype=np.int32)
+        self.head_ptr = np.zeros(n, dtype=np.int32)
+        self.length = np.zeros(n, dtype=np.int32)
+        self.pending_growth = np.zeros(n, dtype=np.int32)
+        self.occupancy = np.zeros((n, cells), dtype=np.uint8)
+        self.direction = np.zeros(n, dtype=np.int8)
+        self.food = np.zeros(n, dtype=np.int32)
+
+        self.alive = np.zeros(n, dtype=bool)
+        self.won = np.zeros(n, dtype=bool)
+        self.awaiting_answer = np.zeros(n, dtype=bool)
+
+        # Game stats
+        self.score = np.zeros(n, dtype=np.int32)
+        self.level = np.zeros(n, dtype=np.int32)
+        self.questions_correct = np.zeros(n, dtype=np.int32)
+        self.questions_total = np.zeros(n, dtype=np.int32)
+        self.streak = np.zeros(n, dtype=np.int32)
+        self.move_delay = np.zeros(n, dtype=np.int32)
+        self.ticks = np.zeros(n, dtype=np.int64)
+
+        self.reset()
+
+    @property
+    def heads(self) -> np.ndarray:
+        """Flat cell index of every head"""
+        return self.body[self._boards, self.head_ptr]
+
+    @property
+    def done(self) -> np.ndarray:
+        """Boards whose round is over"""
+        return ~self.alive
+
+    def reset(self, mask: Optional[np.ndarray] = None):
+        """Put all boards, or those selected by mask, back to the start"""
+        boards = self._boards if mask is None else np.flatnonzero(mask)
+        if not boards.size:
+            return
+
+        start = (self.height // 2) * self.width + self.width // 2
+        self.occupancy[boards] = 0
+        self.occupancy[boards, start] = 1
+        self.head_ptr[boards] = 0
+        self.body[boards, 0] = start
+        self.length[boards] = 1
+        self.pending_growth[boards] = 0
+        self.direction[boards] = DIRECTIONS.index(Direction.RIGHT)
+
+        self.alive[boards] = True
+        self.won[boards] = False
+        self.awaiting_answer[boards] = False
+        self.score[boards] = 0
+        self.level[boards] = 1
+        self.questions_correct[boards] = 0
+        self.questions_total[boards] = 0
+        self.streak[boards] = 0
+        self.move_delay[boards] = INITIAL_MOVE_DELAY
+        self.ticks[boards] = 0
+
+        self._place_food(boards)
+
+    def _place_food(self, boards: np.ndarray) -> np.ndarray:
+        """Drop food on a random free cell of each board; returns boards that are full"""
+        remaining = boards
+        for _ in range(FOOD_TRIES):
+            if not remaining.size:
+                return remaining
+            candidates = self.rng.integers(0, self.cells, size=remaining.size, dtype=np.int32)
+            free = self.occupancy[remaining, candidates] == 0
+            self.food[remaining[free]] = candidates[free]
+            remaining = remaining[~free]
+
+        if not remaining.size:
+            return remaining
+
+        # Crowded boards: pick uniformly among the free cells in one pass
+        free = self.occupancy[remaining] == 0
+        keys = self.rng.random(free.shape)
+        keys[~free] = -1.0
+        self.food[remaining] = keys.argmax(axis=1)
+
+        full = remaining[~free.any(axis=1)]
+        self.food[full] = -1
+        self.alive[full] = False
+        self.won[full] = True
+        return full
+
+    def step(self, actions: Optional[np.ndarray] = None) -> BatchEvents:
+        """Advance every live board one cell; actions are direction indices or KEEP"""
+        n = self.num_boards
+        moved = np.zeros(n, dtype=bool)
+        ate_food = np.zeros(n, dtype=bool)
+        died = np.zeros(n, dtype=bool)
+        board_full = np.zeros(n, dtype=bool)
+
+        boards = np.flatnonzero(self.alive & ~self.awaiting_answer)
+        if not boards.size:
+            return BatchEvents(moved, ate_food, died, board_full)
+
+        # Turn, ignoring reversals onto the neck
+        direction = self.direction[boards]
+        if actions is not None:
+            wanted = np.asarray(actions, dtype=np.int8)[boards]
+            turn = (wanted != KEEP) & (wanted != OPPOSITE_ACTION[direction])
+            direction = np.where(turn, wanted, direction)
+            self.direction[boards] = direction
+        self.ticks[boards] += 1
+
+        # Calculate new head positions
+        head = self.body[boards, self.head_ptr[boards]]
+        x = head % self.width + DX[direction]
+        y = head // self.width + DY[direction]
+
+        # Walls, then the body (the tail cell still counts)
+        wall = (x < 0) | (x >= self.width) | (y < 0) | (y >= self.height)
+        new_head = np.where(wall, 0, y * self.width + x)
+        hit = wall | (self.occupancy[boards, new_head] != 0)
+        died[boards[hit]] = True
+        self.alive[boards[hit]] = False
+
+        keep = ~hit
+        boards, new_head = boards[keep], new_head[keep]
+        moved[boards] = True
+
+        # Move heads
+        ptr = (self.head_ptr[boards] + 1) % self.cells
+        self.head_ptr[boards] = ptr
+        self.body[boards, ptr] = new_head
+        self.occupancy[boards, new_head] = 1
+
+        # Remove tails unless food was eaten or growth is pending
+        eating = new_head == self.food[boards]
+        growing = ~eating & (self.pending_growth[boards] > 0)
+        self.pending_growth[boards[growing]] -= 1
+        shrink = boards[~eating & ~growing]
+        tail_ptr = (self.head_ptr[shrink] - self.length[shrink]) % self.cells
+        self.occupancy[shrink, self.body[shrink, tail_ptr]] = 0
+        self.length[boards[eating | growing]] += 1
+
+        eaten = boards[eating]
+        ate_food[eaten] = True
+        if self.questions:
+            self.food[eaten] = -1
+            self.awaiting_answer[eaten] = True
+        else:
+            board_full[self._place_food(eaten)] = True
+
+        return BatchEvents(moved, ate_food, died, board_full)
+
+    def answer(self, correct: np.ndarray) -> np.ndarray:
+        """Answer the pending question on every waiting board; returns boards that levelled up"""
+        correct = np.asarray(correct, dtype=bool)
+        waiting = self.awaiting_answer
+        right = waiting & correct
+        wrong = waiting & ~correct
+
+        self.questions_total[waiting] += 1
+        self.streak[wrong] = 0
+
+        # Correct answers score with a streak bonus and grow the snake
+        self.questions_correct[right] += 1
+        self.streak[right] += 1
+        self.score[right] += 10 + np.minimum(self.streak[right] * 2, 20)
+        self.pending_growth[right] += 1
+
+        # Level up every 5 correct answers
+        level_up = right & (self.questions_correct % ANSWERS_PER_LEVEL == 0)
+        self.level[level_up] += 1
+        self.move_delay[level_up] = np.maximum(MIN_MOVE_DELAY, self.move_delay[level_up] - MOVE_DELAY_STEP)
+
+        self.awaiting_answer[waiting] = False
+        self._place_food(np.flatnonzero(waiting))
+        return level_up
+
+    def observe(self) -> np.ndarray:
+        """Observation tensor of shape (N, 3, height, width): body, head, food planes"""
+        planes = np.zeros((self.num_boards, 3, self.cells), dtype=np.uint8)
+        planes[:, 0] = self.occupancy
+        planes[self._boards, 1, self.heads] = 1
+        has_food = self.food >= 0
+        planes[self._boards[has_food], 2, self.food[has_food]] = 1
+        return planes.reshape(self.num_boards, 3, self.height, self.width)
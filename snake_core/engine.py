@@ -0,0 +1,328 @@
+"""
+🐍 Snake Evolution - Headless Engine
+Pure-Python simulation core for Snake Evolution
+
+Holds the board, snake, food, score, level and question state and
+advances them one move at a time with step(). Nothing here touches
+pygame, so bots, replays and load tests can run without a display and
+as fast as the CPU allows.
+"""
+
+import random
+from array import array
+from collections import deque
+from enum import Enum
+from dataclasses import dataclass
+from typing import Callable, Deque, Dict, Iterable, List, Optional, Tuple
+
+# Default board size in cells (800x600 window with 20px cells)
+GRID_WIDTH = 40
+GRID_HEIGHT = 30
+
+# Timing
+INITIAL_MOVE_DELAY = 200  # milliseconds
+MIN_MOVE_DELAY = 100
+MOVE_DELAY_STEP = 10
+
+# Level up every N correct answers
+ANSWERS_PER_LEVEL = 5
+
+# Turns buffered ahead of the snake; keypresses beyond this are dropped
+TURN_QUEUE_SIZE = 3
+
+
+_identity_cache: Dict[int, array] = {}
+
+
+def identity_cells(cells: int) -> array:
+    """array('i', range(cells)), built once per board size; copy before changing it"""
+    every_cell = _identity_cache.get(cells)
+    if every_cell is None:
+        every_cell = _identity_cache[cells] = array('i', range(cells))
+    return every_cell
+
+
+class Direction(Enum):
+    UP = (0, -1)
+    DOWN = (0, 1)
+    LEFT = (-1, 0)
+    RIGHT = (1, 0)
+
+
+OPPOSITE = {
+    Direction.UP: Direction.DOWN,
+    Direction.DOWN: Direction.UP,
+    Direction.LEFT: Direction.RIGHT,
+    Direction.RIGHT: Direction.LEFT,
+}
+
+
+@dataclass
+class Question:
+    question: str
+    answer: int
+    options: List[int]
+    difficulty: int
+    subject: str
+
+
+class Event(Enum):
+    MOVED = 1
+    ATE_FOOD = 2
+    QUESTION = 3
+    CORRECT = 4
+    WRONG = 5
+    LEVEL_UP = 6
+    DIED = 7
+    BOARD_FULL = 8
+
+
+class SnakeEngine:
+    """Display-free Snake simulation driven by step() or an injected tick source"""
+
+    def __init__(self, width: int = GRID_WIDTH, height: int = GRID_HEIGHT,
+                 tick_source: Optional[Callable[[], int]] = None,
+                 question_source: Optional[Callable[[int], Question]] = None,
+                 seed: Optional[int] = None):
+        self.width = width
+        self.height = height
+        self.tick_source = tick_source
+        self.question_source = question_source
+
+        # Renderers subscribe by setting this to a list of changed cell indices
+        self.changed_cells: Optional[List[int]] = None
+        self.layout_version = 0
+
+        # Replay recorder notified of turns, answers and resets
+        self.recorder = None
+
+        self.reseed(seed)
+
+    def reseed(self, seed: Optional[int] = None):
+        """Start over from a fresh RNG; a random seed is picked and kept if none is given"""
+        self.seed = seed if seed is not None else random.randrange(2 ** 63)
+        self.rng = random.Random(self.seed)
+        self.best_streak = 0
+        self.reset()
+
+    def reset(self):
+        """Put the board back into its starting position"""
+        if self.recorder is not None:
+            self.recorder.on_reset(self.ticks)
+        self.place_snake([(self.width // 2, self.height // 2)])
+        self.direction = Direction.RIGHT
+        self.next_direction = Direction.RIGHT
+        self.alive = True
+
+        # Buffered (direction, timestamp) turns, one applied per step
+        self.turn_queue: Deque[Tuple[Direction, float]] = deque()
+        self.turned_at: Optional[float] = None
+
+        # Food and questions
+        self.food_pos: Optional[Tuple[int, int]] = None
+        self.current_question: Optional[Question] = None
+
+        # Game stats
+        self.score = 0
+        self.level = 1
+        self.questions_correct = 0
+        self.questions_total = 0
+        self.streak = 0
+
+        # Timing
+        self.ticks = 0
+        self.last_move_time = 0
+        self.move_delay = INITIAL_MOVE_DELAY
+
+        self.generate_food()
+
+    def place_snake(self, segments: Iterable[Tuple[int, int]]):
+        """Replace the body (head first) and rebuild the occupancy grid"""
+        self.snake: Deque[Tuple[int, int]] = deque(segments)
+        cells = self.width * self.height
+        self.occupancy = bytearray(cells)
+        self.pending_growth = 0
+
+        # Free cells as a swap-remove array plus each cell's slot in it;
+        # copied from the empty board's, then the body is taken out, so a
+        # reset stays cheap on very large boards
+        every_cell = identity_cells(cells)
+        self.free_cells = every_cell[:]
+        self.free_slot = every_cell[:]
+        journal, self.changed_cells = self.changed_cells, None
+        for x, y in self.snake:
+            self._occupy(y * self.width + x)
+        self.changed_cells = journal
+        self.layout_version += 1
+
+    def _occupy(self, index: int):
+        """Mark a cell as snake and drop it from the free-cell array"""
+        self.occupancy[index] = 1
+        slot = self.free_slot[index]
+        last = self.free_cells.pop()
+        if last != index:
+            self.free_cells[slot] = last
+            self.free_slot[last] = slot
+        self.free_slot[index] = -1
+        if self.changed_cells is not None:
+            self.changed_cells.append(index)
+
+    def _vacate(self, index: int):
+        """Mark a cell as empty and append it to the free-cell array"""
+        self.occupancy[index] = 0
+        self.free_slot[index] = len(self.free_cells)
+        self.free_cells.append(index)
+        if self.changed_cells is not None:
+            self.changed_cells.append(index)
+
+    def is_occupied(self, pos: Tuple[int, int]) -> bool:
+        """Check whether a snake segment covers the cell"""
+        return self.occupancy[pos[1] * self.width + pos[0]] != 0
+
+    def generate_food(self) -> bool:
+        """Place food on a random free cell; False when the board is full"""
+        if not self.free_cells:
+            self.food_pos = None
+            return False
+
+        index = self.free_cells[self.rng.randrange(len(self.free_cells))]
+        self.food_pos = (index % self.width, index // self.width)
+        return True
+
+    def _board_full(self, events: List[Event]) -> List[Event]:
+        """The snake covers every cell: the round is won"""
+        self.alive = False
+        events.append(Event.BOARD_FULL)
+        return events
+
+    def turn(self, direction: Direction) -> bool:
+        """Queue a direction change, ignoring reversals onto the neck"""
+        if direction == OPPOSITE[self.direction]:
+            return False
+        if self.recorder is not None and direction != self.next_direction:
+            self.recorder.on_turn(self.ticks, direction)
+        self.next_direction = direction
+        return True
+
+    def queue_turn(self, direction: Direction, stamp: float = 0.0) -> bool:
+        """Buffer a turn for a coming step; steps apply them one at a time, in order"""
+        last = self.turn_queue[-1][0] if self.turn_queue else self.next_direction
+        if len(self.turn_queue) >= TURN_QUEUE_SIZE or direction == last or direction == OPPOSITE[last]:
+            return False
+        self.turn_queue.append((direction, stamp))
+        return True
+
+    def grow_snake(self):
+        """Add segment to snake (the tail stays put on the next move)"""
+        self.pending_growth += 1
+
+    def step(self, direction: Optional[Direction] = None) -> List[Event]:
+        """Advance the snake by exactly one cell and report what happened"""
+        if not self.alive or self.current_question is not None:
+            return []
+
+        # An explicit direction wins; otherwise take the oldest buffered turn
+        self.turned_at = None
+        if direction is not None:
+            self.turn(direction)
+        elif self.turn_queue:
+            queued, self.turned_at = self.turn_queue.popleft()
+            self.turn(queued)
+
+        self.ticks += 1
+        self.direction = self.next_direction
+
+        # Calculate new head position
+        head_x, head_y = self.snake[0]
+        dx, dy = self.direction.value
+        x, y = head_x + dx, head_y + dy
+
+        # Check wall collision
+        if x < 0 or x >= self.width or y < 0 or y >= self.height:
+            self.alive = False
+            return [Event.DIED]
+
+        # Check self collision (the tail cell still counts, as before)
+        index = y * self.width + x
+        if self.occupancy[index]:
+            self.alive = False
+            return [Event.DIED]
+
+        # Move snake
+        new_head = (x, y)
+        self.snake.appendleft(new_head)
+        self._occupy(index)
+
+        if new_head != self.food_pos:
+            # Remove tail if no food eaten
+            if self.pending_growth:
+                self.pending_growth -= 1
+            else:
+                tail_x, tail_y = self.snake.pop()
+                self._vacate(tail_y * self.width + tail_x)
+            return [Event.MOVED]
+
+        events = [Event.MOVED, Event.ATE_FOOD]
+        self.food_pos = None
+        if self.question_source is not None:
+            self.current_question = self.question_source(self.level)
+            events.append(Event.QUESTION)
+        elif not self.generate_food():
+            return self._board_full(events)
+        return events
+
+    def update(self) -> List[Event]:
+        """Step once if the tick source says the move delay has elapsed"""
+        current_time = self.tick_source()
+        if current_time - self.last_move_time < self.move_delay:
+            return []
+
+        self.last_move_time = current_time
+        return self.step()
+
+    def ask(self, question: Question):
+        """Pose a question; the snake is frozen until it is answered"""
+        self.current_question = question
+
+    def answer_question(self, option_index: int) -> List[Event]:
+        """Handle question answer"""
+        if not self.current_question or option_index >= len(self.current_question.options):
+            return []
+
+        question = self.current_question
+        selected_answer = question.options[option_index]
+        correct = selected_answer == question.answer
+        self.questions_total += 1
+        self.current_question = None
+        if self.recorder is not None:
+            self.recorder.on_answer(self.ticks, option_index, correct)
+
+        if not correct:
+            # Wrong answer
+            self.streak = 0
+            if self.food_pos is None and not self.generate_food():
+                return self._board_full([Event.WRONG])
+            return [Event.WRONG]
+
+        # Correct answer
+        self.questions_correct += 1
+        self.streak += 1
+        self.best_streak = max(self.best_streak, self.streak)
+
+        # Bonus points for streak
+        bonus = min(self.streak * 2, 20)
+        self.score += 10 + bonus
+
+        # Grow snake
+        self.grow_snake()
+        events = [Event.CORRECT]
+        if not self.generate_food():
+            self._board_full(events)
+
+        # Level up every 5 correct answers
+        if self.questions_correct % ANSWERS_PER_LEVEL == 0:
+            self.level += 1
+            self.move_delay = max(MIN_MOVE_DELAY, self.move_delay - MOVE_DELAY_STEP)  # Increase speed
+            events.append(Event.LEVEL_UP)
+
+        return events
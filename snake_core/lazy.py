@@ -0,0 +1,31 @@
+"""
+🐍 Snake Evolution - Lazy Imports
+Defer heavy optional imports until first use
+
+`import pygame` alone pulls in numpy, pkg_resources and every pygame
+submodule, a few hundred milliseconds before any window exists. A lazy
+module stands in for it in sys.modules and runs the real import on the
+first attribute access, so tools and tests that only import the game
+module for its constants or the headless engine never pay for it.
+"""
+
+import importlib.util
+import sys
+from types import ModuleType
+
+
+def lazy_import(name: str) -> ModuleType:
+    """The module `name`, imported on first attribute access; already imported modules are returned as is"""
+    module = sys.modules.get(name)
+    if module is not None:
+        return module
+    spec = importlib.util.find_spec(name)
+    if spec is None:
+        raise ModuleNotFoundError(f"No module named {name!r}", name=name)
+    loader = importlib.util.LazyLoader(spec.loader)
+    spec.loader = loader
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    loader.exec_module(module)
+    return module
+
@@ -0,0 +1,75 @@
+"""
+🐍 Snake Evolution - Offscreen Rendering
+Draw screens to an off-screen Surface and read them back as NumPy arrays
+
+A RenderTarget is the surface a frame is drawn to: the window, or a
+plain Surface of the same size, which works under the SDL dummy video
+driver on CI. array() exports its pixels through pygame.surfarray as a
+width x height x RGB uint8 array.
+
+Golden images are stored as PNG and compared with a tolerance: a pixel
+only counts as different if a channel is off by more than
+CHANNEL_TOLERANCE, and an image matches if at most MAX_MISMATCH of its
+pixels differ. That absorbs the pulsing food glow and small font
+rasterizer differences, but not a moved or missing element.
+"""
+
+from __future__ import annotations
+
+import os
+from typing import Optional, Tuple
+
+import numpy as np
+
+from .lazy import lazy_import
+
+pygame = lazy_import("pygame")
+
+CHANNEL_TOLERANCE = 24  # Per-channel difference (0-255) still counted as equal
+MAX_MISMATCH = 0.002  # Share of pixels allowed to differ
+
+
+class RenderTarget:
+    """A surface to draw a frame on, exportable as a NumPy array"""
+
+    def __init__(self, surface: pygame.Surface):
+        self.surface = surface
+
+    @classmethod
+    def offscreen(cls, size: Tuple[int, int]) -> "RenderTarget":
+        """A new off-screen target; needs no window or display mode"""
+        return cls(pygame.Surface(size))
+
+    @property
+    def size(self) -> Tuple[int, int]:
+        return self.surface.get_size()
+
+    def array(self) -> np.ndarray:
+        """Copy of the pixels, indexed [x, y, channel]"""
+        return pygame.surfarray.array3d(self.surface)
+
+    def save(self, path: str):
+        """Write the target as a PNG"""
+        pygame.image.save(self.surface, path)
+
+
+def load_image(path: str) -> Optional[np.ndarray]:
+    """Pixels of an image file, indexed [x, y, channel]; None if it does not exist"""
+    if not os.path.exists(path):
+        return None
+    return pygame.surfarray.array3d(pygame.image.load(path))
+
+
+def mismatch(actual: np.ndarray, expected: Optional[np.ndarray],
+             channel_tolerance: int = CHANNEL_TOLERANCE) -> float:
+    """Share of pixels differing by more than channel_tolerance; 1.0 if the sizes differ"""
+    if expected is None or actual.shape != expected.shape:
+        return 1.0
+    difference = np.abs(actual.astype(np.int16) - expected.astype(np.int16)).max(axis=2)
+    return float(np.count_nonzero(difference > channel_tolerance)) / difference.size
+
+
+def matches(actual: np.ndarray, expected: Optional[np.ndarray], max_mismatch: float = MAX_MISMATCH,
+            channel_tolerance: int = CHANNEL_TOLERANCE) -> bool:
+    """Whether two images are the same within the tolerances"""
+    return mismatch(actual, expected, channel_tolerance) <= max_mismatch
@@ -0,0 +1,209 @@
+"""
+🐍 Snake Evolution - Physics
+Small 2D physics world for the pygame mini-games
+
+Moving circles (bodies) bounce off the arena walls, off each other and off
+static circular obstacles. Time advances in fixed substeps, so results do
+not depend on the frame rate and fast bodies do not tunnel. Obstacles sit
+in a fixed-capacity EntityPool with a lifetime each, and a spatial hash
+keeps body-vs-obstacle checks local, so the cost of a frame stays flat
+however long the game runs.
+"""
+
+import math
+from array import array
+from typing import List, NamedTuple
+
+from .pool import EntityPool
+from .spatial import SpatialHash
+
+
+class Body:
+    """A moving circle"""
+
+    __slots__ = ("x", "y", "vx", "vy", "ax", "ay", "radius", "inv_mass")
+
+    def __init__(self, x: float, y: float, radius: float, mass: float = 1.0):
+        self.x = x
+        self.y = y
+        self.vx = 0.0
+        self.vy = 0.0
+        self.ax = 0.0  # Acceleration applied every substep (player input, gravity)
+        self.ay = 0.0
+        self.radius = radius
+        self.inv_mass = 1.0 / mass
+
+
+class StepResult(NamedTuple):
+    """What happened to the obstacles during one step"""
+    hits: List[int]  # Obstacle slots touched by a body
+    dodged: int      # Obstacles that timed out without being touched
+
+
+class PhysicsWorld:
+    """Bodies, walls and short-lived obstacles advanced with a fixed substep"""
+
+    def __init__(self, width: float, height: float, substep: float = 1 / 120,
+                 max_substeps: int = 32, damping: float = 1.0, restitution: float = 0.8,
+                 max_obstacles: int = 32, cell_size: float = 64.0):
+        self.width = width
+        self.height = height
+        self.substep = substep
+        self.max_substeps = max_substeps
+        self.damping = damping  # Fraction of velocity kept after one second
+        self.restitution = restitution
+
+        self.bodies: List[Body] = []
+        self.obstacles = EntityPool(max_obstacles)
+        self.obstacle_radius = array('d', bytes(8 * max_obstacles))
+        self.obstacle_ttl = array('d', bytes(8 * max_obstacles))
+        self.touched = bytearray(max_obstacles)
+        self._max_radius = 0.0
+        self.grid = SpatialHash(cell_size)
+
+        self.time = 0.0
+        self._accumulator = 0.0
+
+    def clear(self):
+        """Remove every body and obstacle"""
+        self.bodies.clear()
+        self.obstacles.clear()
+        self._max_radius = 0.0
+        self.time = 0.0
+        self._accumulator = 0.0
+
+    def add_body(self, x: float, y: float, radius: float, mass: float = 1.0) -> Body:
+        body = Body(x, y, radius, mass)
+        self.bodies.append(body)
+        return body
+
+    def add_obstacle(self, x: float, y: float, radius: float, lifetime: float) -> int:
+        """Place a static circle for `lifetime` seconds; -1 if the world is full"""
+        slot = self.obstacles.spawn(x, y)
+        if slot >= 0:
+            self.obstacle_radius[slot] = radius
+            self.obstacle_ttl[slot] = lifetime
+            self.touched[slot] = 0
+            self._max_radius = max(self._max_radius, radius)
+        return slot
+
+    def step(self, elapsed: float) -> StepResult:
+        """Advance by `elapsed` seconds in fixed substeps"""
+        obstacles = self.obstacles
+        self.grid.build_columns(obstacles, obstacles.x, obstacles.y)
+
+        self._accumulator += elapsed
+        substeps = min(int(self._accumulator / self.substep), self.max_substeps)
+        self._accumulator -= substeps * self.substep
+        if substeps == self.max_substeps:
+            self._accumulator = min(self._accumulator, self.substep)
+
+        hits: List[int] = []
+        for _ in range(substeps):
+            self._integrate(self.substep)
+            self._collide_bodies()
+            for body in self.bodies:
+                self._collide_walls(body)
+                self._collide_obstacles(body, hits)
+        dt = substeps * self.substep
+        self.time += dt
+        return StepResult(hits, self._age(dt))
+
+    def _integrate(self, h: float):
+        """Semi-implicit Euler with exponential damping"""
+        keep = self.damping ** h
+        for body in self.bodies:
+            body.vx = (body.vx + body.ax * h) * keep
+            body.vy = (body.vy + body.ay * h) * keep
+            body.x += body.vx * h
+            body.y += body.vy * h
+
+    def _bounce(self, body: Body, nx: float, ny: float):
+        """Reflect the velocity component going into the normal"""
+        along = body.vx * nx + body.vy * ny
+        if along < 0:
+            impulse = (1 + self.restitution) * along
+            body.vx -= impulse * nx
+            body.vy -= impulse * ny
+
+    def _collide_walls(self, body: Body):
+        r = body.radius
+        if body.x < r:
+            body.x = r
+            self._bounce(body, 1.0, 0.0)
+        elif body.x > self.width - r:
+            body.x = self.width - r
+            self._bounce(body, -1.0, 0.0)
+        if body.y < r:
+            body.y = r
+            self._bounce(body, 0.0, 1.0)
+        elif body.y > self.height - r:
+            body.y = self.height - r
+            self._bounce(body, 0.0, -1.0)
+
+    def _collide_obstacles(self, body: Body, hits: List[int]):
+        """Push the body out of any obstacle it overlaps"""
+        obstacles = self.obstacles
+        ox, oy, radius = obstacles.x, obstacles.y, self.obstacle_radius
+        for bucket in self.grid.query(body.x, body.y, body.radius + self._max_radius):
+            for i in bucket:
+                if not obstacles.alive[i]:
+                    continue
+                dx = body.x - ox[i]
+                dy = body.y - oy[i]
+                reach = body.radius + radius[i]
+                distance_sq = dx * dx + dy * dy
+                if distance_sq >= reach * reach:
+                    continue
+                distance = math.sqrt(distance_sq)
+                if distance == 0.0:
+                    nx, ny, distance = 0.0, -1.0, 0.0
+                else:
+                    nx, ny = dx / distance, dy / distance
+                body.x += nx * (reach - distance)
+                body.y += ny * (reach - distance)
+                self._bounce(body, nx, ny)
+                if not self.touched[i]:
+                    self.touched[i] = 1
+                    hits.append(i)
+
+    def _collide_bodies(self):
+        """Separate overlapping bodies and exchange momentum along the contact normal"""
+        bodies = self.bodies
+        for a_index in range(len(bodies)):
+            a = bodies[a_index]
+            for b in bodies[a_index + 1:]:
+                dx = b.x - a.x
+                dy = b.y - a.y
+                reach = a.radius + b.radius
+                distance_sq = dx * dx + dy * dy
+                if distance_sq >= reach * reach:
+                    continue
+                distance = math.sqrt(distance_sq) or 1e-9
+                nx, ny = dx / distance, dy / distance
+                total = a.inv_mass + b.inv_mass
+                overlap = (reach - distance) / total
+                a.x -= nx * overlap * a.inv_mass
+                a.y -= ny * overlap * a.inv_mass
+                b.x += nx * overlap * b.inv_mass
+                b.y += ny * overlap * b.inv_mass
+
+                closing = (b.vx - a.vx) * nx + (b.vy - a.vy) * ny
+                if closing < 0:
+                    impulse = -(1 + self.restitution) * closing / total
+                    a.vx -= impulse * a.inv_mass * nx
+                    a.vy -= impulse * a.inv_mass * ny
+                    b.vx += impulse * b.inv_mass * nx
+                    b.vy += impulse * b.inv_mass * ny
+
+    def _age(self, dt: float) -> int:
+        """Count down obstacle lifetimes; returns how many expired untouched"""
+        obstacles, ttl = self.obstacles, self.obstacle_ttl
+        dodged = 0
+        for i in obstacles:
+            ttl[i] -= dt
+            if ttl[i] <= 0:
+                if not self.touched[i]:
+                    dodged += 1
+                obstacles.kill(i)
+        return dodged
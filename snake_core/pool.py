@@ -0,0 +1,110 @@
+"""
+🐍 Snake Evolution - Entity Pools
+Fixed-capacity struct-of-arrays storage for mini-game entities
+
+Bullets, enemies, obstacles and zombies live in flat x/y/vx/vy/alive
+columns allocated once. Dead slots go on a free list and are handed out
+again before untouched ones, so live entities stay packed near the front
+and the memory used never grows past the capacity, however long a session
+runs.
+"""
+
+from array import array
+from typing import Iterator, List
+
+
+class EntityPool:
+    """Fixed number of entity slots with per-column arrays and free-list reuse"""
+
+    def __init__(self, capacity: int):
+        self.capacity = capacity
+        self.x = array('d', bytes(8 * capacity))
+        self.y = array('d', bytes(8 * capacity))
+        self.vx = array('d', bytes(8 * capacity))
+        self.vy = array('d', bytes(8 * capacity))
+        self.alive = bytearray(capacity)
+        self.clear()
+
+    def clear(self):
+        """Kill every entity"""
+        self.alive[:] = bytes(self.capacity)
+        self._free: List[int] = list(range(self.capacity - 1, -1, -1))
+        self.count = 0
+        self.high = 0  # One past the highest live slot
+
+    def __len__(self) -> int:
+        return self.count
+
+    @property
+    def full(self) -> bool:
+        return self.count == self.capacity
+
+    def __iter__(self) -> Iterator[int]:
+        """Slot indices of live entities"""
+        alive = self.alive
+        for i in range(self.high):
+            if alive[i]:
+                yield i
+
+    def spawn(self, x: float, y: float, vx: float = 0.0, vy: float = 0.0) -> int:
+        """Take a free slot; returns its index, or -1 when the pool is full"""
+        if not self._free:
+            return -1
+        i = self._free.pop()
+        self.x[i] = x
+        self.y[i] = y
+        self.vx[i] = vx
+        self.vy[i] = vy
+        self.alive[i] = 1
+        self.count += 1
+        if i >= self.high:
+            self.high = i + 1
+        return i
+
+    def kill(self, i: int):
+        """Free a slot for reuse"""
+        if not self.alive[i]:
+            return
+        self.alive[i] = 0
+        self.count -= 1
+        self._free.append(i)
+        if i == self.high - 1:
+            alive = self.alive
+            high = i
+            while high and not alive[high - 1]:
+                high -= 1
+            self.high = high
+
+    def move(self):
+        """Advance every live entity by its velocity"""
+        x, y, vx, vy, alive = self.x, self.y, self.vx, self.vy, self.alive
+        for i in range(self.high):
+            if alive[i]:
+                x[i] += vx[i]
+                y[i] += vy[i]
+
+    def cull(self, left: float, top: float, right: float, bottom: float) -> int:
+        """Kill entities outside the rectangle; returns how many went"""
+        x, y, alive = self.x, self.y, self.alive
+        culled = 0
+        for i in range(self.high):
+            if alive[i] and not (left <= x[i] <= right and top <= y[i] <= bottom):
+                self.kill(i)
+                culled += 1
+        return culled
+
+    def seek(self, target_x: float, target_y: float, step: float):
+        """Move every live entity up to `step` along each axis towards a point"""
+        x, y, alive = self.x, self.y, self.alive
+        for i in range(self.high):
+            if alive[i]:
+                dx = target_x - x[i]
+                dy = target_y - y[i]
+                x[i] += step if dx > 0 else -step if dx < 0 else 0
+                y[i] += step if dy > 0 else -step if dy < 0 else 0
+
+    def near(self, px: float, py: float, reach: float) -> List[int]:
+        """Live entities closer than `reach` to (px, py) on both axes"""
+        x, y, alive = self.x, self.y, self.alive
+        return [i for i in range(self.high)
+                if alive[i] and abs(x[i] - px) < reach and abs(y[i] - py) < reach]
@@ -0,0 +1,173 @@
+"""
+🐍 Snake Evolution - Frame Profiler
+Per-frame phase timings, FPS percentiles and allocation counts
+
+The main loop calls start_frame(), then lap(phase) after each part of
+the frame, then end_frame(scene). Every frame becomes one sample:
+
+    event   input handling
+    update  game logic
+    draw    drawing to the screen surface
+    flip    pushing the surface to the display
+    wait    sleeping in clock.tick() to hold the frame rate
+
+plus the net change in allocated memory blocks and the number of garbage
+collections. input_latency(ms) reports how long a keypress waited before
+the move it asked for was simulated; a frame's sample keeps the worst of
+them. The last `window` samples and latencies of each scene are kept for
+the overlay; with a trace file open, every sample is also written out as a
+CSV row or a JSON line for offline stutter analysis.
+"""
+
+import csv
+import gc
+import json
+import sys
+import time
+from collections import deque
+from typing import Callable, Deque, Dict, Hashable, List, Optional
+
+PROFILE_PHASES = ("event", "update", "draw", "flip", "wait")
+TRACE_FIELDS = ("frame", "time", "scene") + tuple(f"{phase}_ms" for phase in PROFILE_PHASES) + (
+    "frame_ms", "alloc_blocks", "gc_runs", "input_ms")
+
+
+def scene_name(key: Hashable) -> str:
+    """GameState.PLAYING -> 'playing'; game keys stay as they are"""
+    return str(getattr(key, "name", key)).lower()
+
+
+def percentile(sorted_values: List[float], fraction: float) -> float:
+    """Nearest-rank percentile of an already sorted list"""
+    if not sorted_values:
+        return 0.0
+    index = min(len(sorted_values) - 1, max(0, int(round(fraction * (len(sorted_values) - 1)))))
+    return sorted_values[index]
+
+
+def _gc_runs() -> int:
+    return sum(generation["collections"] for generation in gc.get_stats())
+
+
+class FrameProfiler:
+    """Rolling per-scene frame samples with optional CSV/JSONL trace"""
+
+    def __init__(self, window: int = 240, clock: Callable[[], float] = time.perf_counter,
+                 trace_path: Optional[str] = None):
+        self.window = window
+        self.clock = clock
+        self.samples: Dict[str, Deque[dict]] = {}
+        self.latencies: Dict[str, Deque[float]] = {}
+        self._inputs: List[float] = []
+        self.frames = 0
+        self._origin = clock()
+        self._start = self._last = self._origin
+        self._phases = dict.fromkeys(PROFILE_PHASES, 0.0)
+        self._blocks = sys.getallocatedblocks()
+        self._gc = _gc_runs()
+
+        self.trace_path = trace_path
+        self._trace = None
+        self._writer = None
+        if trace_path:
+            self.open_trace(trace_path)
+
+    def open_trace(self, path: str):
+        """Stream every sample to path: CSV, or JSON lines if it ends in .jsonl"""
+        self.close()
+        self.trace_path = path
+        self._trace = open(path, "w", newline="", encoding="utf-8")
+        if path.endswith(".jsonl"):
+            self._writer = None
+        else:
+            self._writer = csv.DictWriter(self._trace, fieldnames=TRACE_FIELDS)
+            self._writer.writeheader()
+
+    def close(self):
+        """Flush and close the trace file, if any"""
+        if self._trace is not None:
+            self._trace.close()
+            self._trace = None
+            self._writer = None
+
+    def start_frame(self):
+        now = self.clock()
+        self._start = self._last = now
+        for phase in PROFILE_PHASES:
+            self._phases[phase] = 0.0
+
+    def lap(self, phase: str):
+        """Charge the time since the previous lap to phase"""
+        now = self.clock()
+        self._phases[phase] += now - self._last
+        self._last = now
+
+    def input_latency(self, ms: float):
+        """Record the delay from a keypress to the move it caused, in this frame"""
+        self._inputs.append(ms)
+
+    def end_frame(self, scene: Hashable) -> dict:
+        """Close the frame as a sample of scene; returns the sample"""
+        blocks, runs = sys.getallocatedblocks(), _gc_runs()
+        name = scene_name(scene)
+        sample = {"frame": self.frames, "time": round(self._start - self._origin, 6), "scene": name}
+        for phase in PROFILE_PHASES:
+            sample[f"{phase}_ms"] = round(self._phases[phase] * 1000, 4)
+        sample["frame_ms"] = round((self._last - self._start) * 1000, 4)
+        sample["alloc_blocks"] = blocks - self._blocks
+        sample["gc_runs"] = runs - self._gc
+        sample["input_ms"] = round(max(self._inputs), 4) if self._inputs else None
+        self._blocks, self._gc = blocks, runs
+        self.frames += 1
+
+        history = self.samples.get(name)
+        if history is None:
+            history = self.samples[name] = deque(maxlen=self.window)
+            self.latencies[name] = deque(maxlen=self.window)
+        history.append(sample)
+        self.latencies[name].extend(self._inputs)
+        self._inputs = []
+        if self._trace is not None:
+            if self._writer is None:
+                self._trace.write(json.dumps(sample) + "\n")
+            else:
+                self._writer.writerow(sample)
+        return sample
+
+    def summary(self, scene: Hashable) -> Dict[str, float]:
+        """Means per phase, FPS percentiles and allocations over the rolling window"""
+        history = self.samples.get(scene_name(scene))
+        if not history:
+            return {}
+        count = len(history)
+        stats = {"frames": count}
+        for phase in PROFILE_PHASES:
+            stats[f"{phase}_ms"] = sum(sample[f"{phase}_ms"] for sample in history) / count
+        frame_times = sorted(sample["frame_ms"] for sample in history)
+        stats["frame_ms"] = sum(frame_times) / count
+        # Slow frames set the low percentiles: the 1% low FPS is the 99th percentile frame time
+        for label, fraction in (("fps_p50", 0.5), ("fps_p5", 0.95), ("fps_p1", 0.99)):
+            frame_ms = percentile(frame_times, fraction)
+            stats[label] = 1000 / frame_ms if frame_ms else 0.0
+        stats["alloc_blocks"] = sum(sample["alloc_blocks"] for sample in history) / count
+        stats["gc_runs"] = sum(sample["gc_runs"] for sample in history)
+        latencies = sorted(self.latencies[scene_name(scene)])
+        if latencies:
+            stats["turns"] = len(latencies)
+            stats["input_ms"] = sum(latencies) / len(latencies)
+            stats["input_p95_ms"] = percentile(latencies, 0.95)
+        return stats
+
+    def lines(self, scene: Hashable) -> List[str]:
+        """Overlay text for a scene"""
+        stats = self.summary(scene)
+        if not stats:
+            return [f"{scene_name(scene)}: no samples yet"]
+        lines = [f"{scene_name(scene)}  ({stats['frames']} frames)"]
+        lines.extend(f"{phase:<7}{stats[f'{phase}_ms']:>8.2f} ms" for phase in PROFILE_PHASES)
+        lines.append(f"frame  {stats['frame_ms']:>8.2f} ms")
+        lines.append(f"FPS p50 {stats['fps_p50']:.0f}  5% {stats['fps_p5']:.0f}  1% {stats['fps_p1']:.0f}")
+        lines.append(f"alloc {stats['alloc_blocks']:+.0f} blocks/frame  gc {stats['gc_runs']}")
+        if "input_ms" in stats:
+            lines.append(f"input {stats['input_ms']:.1f} ms  p95 {stats['input_p95_ms']:.1f}  ({stats['turns']} turns)")
+        return lines
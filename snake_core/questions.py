@@ -0,0 +1,294 @@
+"""
+🐍 Snake Evolution - Questions
+Question generators and a prefetching question bank
+
+The generators build Question objects from module-level tables, so nothing
+is rebuilt per call. QuestionBank keeps a ring buffer of ready, shuffled
+questions per (subject, difficulty), topped up by a background worker, so
+answering a question never waits on generation.
+"""
+
+import random
+import threading
+from collections import deque
+from typing import Callable, Deque, Dict, Iterable, Optional, Tuple
+
+from .engine import Question
+
+# (question, correct answer, options) by difficulty band
+PYTHON_QUESTIONS = {
+    "basic": [
+        ("What does 'print()' do in Python?", "Displays output",
+         ["Displays output", "Creates variables", "Imports modules", "Defines functions"]),
+        ("Which symbol starts a comment in Python?", "#",
+         ["#", "//", "/*", "--"]),
+        ("What is the correct way to create a list?", "[]",
+         ["[]", "{}", "()", "<>"]),
+    ],
+    "intermediate": [
+        ("What does 'len()' function return?", "Length of object",
+         ["Length of object", "Type of object", "Value of object", "Name of object"]),
+        ("Which loop is used for iteration in Python?", "for",
+         ["for", "while", "do", "repeat"]),
+        ("What is the result of 5 // 2 in Python?", "2",
+         ["2", "2.5", "3", "1"]),
+    ],
+    "advanced": [
+        ("What is a lambda function?", "Anonymous function",
+         ["Anonymous function", "Class method", "Module import", "Error handler"]),
+        ("Which method adds an item to a list?", "append()",
+         ["append()", "add()", "insert()", "push()"]),
+        ("What does 'self' refer to in a class?", "Current instance",
+         ["Current instance", "Parent class", "Global variable", "Function name"]),
+    ],
+}
+
+SCIENCE_QUESTIONS = [
+    ("What is H2O?", "Water", ["Water", "Hydrogen", "Oxygen", "Salt"]),
+    ("How many planets are in our solar system?", "8", ["8", "9", "7", "10"]),
+    ("What gas do plants absorb from the atmosphere?", "Carbon dioxide",
+     ["Carbon dioxide", "Oxygen", "Nitrogen", "Hydrogen"]),
+]
+
+GEOGRAPHY_QUESTIONS = [
+    ("What is the capital of France?", "Paris", ["Paris", "London", "Berlin", "Madrid"]),
+    ("Which is the largest continent?", "Asia", ["Asia", "Africa", "Europe", "America"]),
+    ("What is the longest river in the world?", "Nile", ["Nile", "Amazon", "Ganges", "Mississippi"]),
+]
+
+HISTORY_QUESTIONS = [
+    ("Who was the first President of the United States?", "George Washington",
+     ["George Washington", "Thomas Jefferson", "Abraham Lincoln", "John Adams"]),
+    ("In which year did World War II end?", "1945", ["1945", "1944", "1946", "1943"]),
+    ("Which ancient wonder was located in Egypt?", "Great Pyramid",
+     ["Great Pyramid", "Hanging Gardens", "Colossus", "Lighthouse"]),
+]
+
+LANGUAGE_QUESTIONS = [
+    ("What is the opposite of 'hot'?", "Cold", ["Cold", "Warm", "Cool", "Mild"]),
+    ("Which word is a noun?", "Book", ["Book", "Run", "Quick", "Slowly"]),
+    ("What is the plural of 'child'?", "Children", ["Children", "Childs", "Childes", "Child"]),
+]
+
+# Draws per question before a recent repeat is accepted anyway
+REPEAT_TRIES = 16
+
+PERFECT_SQUARES = [4, 9, 16, 25, 36, 49, 64, 81, 100]
+DISTRACTOR_OFFSETS = [offset for offset in range(-10, 11) if offset]
+
+
+def difficulty_band(difficulty: int) -> str:
+    """Map a level to the basic/intermediate/advanced band"""
+    if difficulty <= 3:
+        return "basic"
+    if difficulty <= 6:
+        return "intermediate"
+    return "advanced"
+
+
+def _from_table(table, subject: str, difficulty: int, rng) -> Question:
+    question_text, correct_answer, options = rng.choice(table)
+    return Question(
+        question=question_text,
+        answer=correct_answer,
+        options=list(options),
+        difficulty=difficulty,
+        subject=subject
+    )
+
+
+def generate_python_question(difficulty: int, rng=random) -> Question:
+    """Generate Python programming questions"""
+    return _from_table(PYTHON_QUESTIONS[difficulty_band(difficulty)], "python", difficulty, rng)
+
+
+def generate_math_question(difficulty: int, rng=random) -> Question:
+    """Generate math questions"""
+    band = difficulty_band(difficulty)
+    if band == "basic":
+        # Basic arithmetic
+        a = rng.randint(1, 20)
+        b = rng.randint(1, 20)
+        if rng.choice(['+', '-']) == '+':
+            question = f"{a} + {b} = ?"
+            answer = a + b
+        else:
+            if a < b:
+                a, b = b, a  # Ensure positive result
+            question = f"{a} - {b} = ?"
+            answer = a - b
+
+    elif band == "intermediate":
+        # Multiplication and division
+        a = rng.randint(2, 12)
+        b = rng.randint(2, 12)
+        if rng.choice(['×', '÷']) == '×':
+            question = f"{a} × {b} = ?"
+            answer = a * b
+        else:
+            answer = a
+            question = f"{a * b} ÷ {b} = ?"
+
+    else:
+        # Advanced math
+        if rng.random() < 0.5:
+            n = rng.randint(1, 20)
+            question, answer = f"{n}² = ?", n ** 2
+        else:
+            square = rng.choice(PERFECT_SQUARES)
+            question, answer = f"√{square} = ?", int(square ** 0.5)
+
+    # Three distinct non-negative wrong options, drawn without retries
+    offsets = [offset for offset in DISTRACTOR_OFFSETS if answer + offset >= 0]
+    options = [answer] + [answer + offset for offset in rng.sample(offsets, 3)]
+    rng.shuffle(options)
+
+    return Question(
+        question=question,
+        answer=answer,
+        options=options,
+        difficulty=difficulty,
+        subject="math"
+    )
+
+
+def generate_science_question(difficulty: int, rng=random) -> Question:
+    """Generate science questions"""
+    return _from_table(SCIENCE_QUESTIONS, "science", difficulty, rng)
+
+
+def generate_geography_question(difficulty: int, rng=random) -> Question:
+    """Generate geography questions"""
+    return _from_table(GEOGRAPHY_QUESTIONS, "geography", difficulty, rng)
+
+
+def generate_history_question(difficulty: int, rng=random) -> Question:
+    """Generate history questions"""
+    return _from_table(HISTORY_QUESTIONS, "history", difficulty, rng)
+
+
+def generate_language_question(difficulty: int, rng=random) -> Question:
+    """Generate language questions"""
+    return _from_table(LANGUAGE_QUESTIONS, "language", difficulty, rng)
+
+
+GENERATORS: Dict[str, Callable[..., Question]] = {
+    "math": generate_math_question,
+    "science": generate_science_question,
+    "geography": generate_geography_question,
+    "history": generate_history_question,
+    "language": generate_language_question,
+    "python": generate_python_question,
+}
+
+EDUCATION_SUBJECTS = ["math", "science", "geography", "history", "language"]
+
+
+class QuestionBank:
+    """Per-(subject, difficulty) ring buffers of ready questions, refilled in the background"""
+
+    def __init__(self, generators: Optional[Dict[str, Callable[..., Question]]] = None,
+                 capacity: int = 16, low_water: int = 4, recent: int = 2,
+                 background: bool = True, seed: Optional[int] = None):
+        self.generators = generators or GENERATORS
+        self.capacity = capacity
+        self.low_water = low_water
+        self.recent = recent
+        self.rng = random.Random(seed)
+
+        self._buffers: Dict[Tuple[str, int], Deque[Question]] = {}
+        self._recent: Dict[Tuple[str, int], Deque[str]] = {}
+        self._lock = threading.Lock()
+        # rng, the recent windows and `generated` are shared by the worker and get()
+        self._generate_lock = threading.Lock()
+        self._wake = threading.Event()
+        self._closed = False
+
+        # Stats
+        self.served = 0
+        self.underruns = 0
+        self.generated = 0
+
+        self._worker: Optional[threading.Thread] = None
+        if background:
+            self._worker = threading.Thread(target=self._run, name="QuestionBank", daemon=True)
+            self._worker.start()
+
+    def _generate(self, key: Tuple[str, int]) -> Question:
+        """Make one shuffled question, avoiding the last few served for this key"""
+        subject, difficulty = key
+        with self._generate_lock:
+            recent = self._recent.setdefault(key, deque(maxlen=self.recent))
+            for _ in range(REPEAT_TRIES):
+                question = self.generators[subject](difficulty, self.rng)
+                if question.question not in recent:
+                    break
+            recent.append(question.question)
+            self.rng.shuffle(question.options)
+            self.generated += 1
+        return question
+
+    def _fill(self, key: Tuple[str, int]):
+        """Top a buffer up to capacity; questions are generated outside the buffer lock"""
+        with self._lock:
+            buffer = self._buffers.setdefault(key, deque(maxlen=self.capacity))
+            missing = self.capacity - len(buffer)
+        while missing > 0 and not self._closed:
+            question = self._generate(key)
+            with self._lock:
+                if len(buffer) < self.capacity:
+                    buffer.append(question)
+                missing = self.capacity - len(buffer)
+
+    def _run(self):
+        """Background worker: refill buffers that ran low"""
+        while not self._closed:
+            self._wake.wait()
+            self._wake.clear()
+            # get() may add keys meanwhile, so pick the low buffers under the lock
+            with self._lock:
+                low = [key for key, buffer in self._buffers.items() if len(buffer) <= self.low_water]
+            for key in low:
+                self._fill(key)
+
+    def prefetch(self, keys: Iterable[Tuple[str, int]]):
+        """Fill the buffers for these keys now"""
+        for key in keys:
+            self._fill(key)
+
+    def get(self, subject: str, difficulty: int) -> Question:
+        """Take the next question; generated on the spot only if the buffer ran dry"""
+        key = (subject, difficulty)
+        with self._lock:
+            buffer = self._buffers.setdefault(key, deque(maxlen=self.capacity))
+            if buffer:
+                question = buffer.popleft()
+            else:
+                self.underruns += 1
+                question = self._generate(key)
+            self.served += 1
+
+        if len(buffer) <= self.low_water:
+            if self._worker is not None:
+                self._wake.set()
+            else:
+                self._fill(key)
+        return question
+
+    def stats(self) -> Dict[str, int]:
+        """Served/underrun counters and buffered question count"""
+        with self._lock:
+            buffered = sum(len(buffer) for buffer in self._buffers.values())
+        return {
+            'served': self.served,
+            'underruns': self.underruns,
+            'generated': self.generated,
+            'buffered': buffered,
+        }
+
+    def close(self):
+        """Stop the background worker"""
+        self._closed = True
+        self._wake.set()
+        if self._worker is not None:
+            self._worker.join(timeout=1)
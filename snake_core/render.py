@@ -0,0 +1,404 @@
+"""
+🐍 Snake Evolution - Playfield Renderer
+Draws the snake board and pushes only the cells that changed
+
+The engine journals every cell it occupies or vacates; each frame the
+renderer repaints those cells plus the old and new head, the food and
+the HUD if its values changed, then hands just those rects to
+pygame.display.update(). A full redraw + flip is kept as a fallback.
+
+present(alpha) slides the head from the previous cell into the current
+one, so a fixed-step simulation can render smoothly at any frame rate.
+
+Snake and food come from a SpriteAtlas built once: a frame, full or
+partial, is one Surface.blits() batch of sheet areas.
+
+Boards bigger than the window use ChunkedRenderer instead: a Camera
+follows the head, the body is cached as square chunk surfaces patched
+cell by cell from the same journal, and a frame is a few chunk blits
+however large the board is.
+"""
+
+from __future__ import annotations
+
+from collections import OrderedDict
+from itertools import islice
+from typing import Callable, Dict, List, Optional, Tuple
+
+from .atlas import SpriteAtlas
+from .engine import SnakeEngine
+from .lazy import lazy_import
+
+pygame = lazy_import("pygame")
+
+BLACK = (0, 0, 0)
+WHITE = (255, 255, 255)
+RED = (255, 0, 0)
+BODY_GREEN = (0, 200, 0)
+
+# Area the HUD text may cover in the top-left corner of the board
+HUD_RECT = (0, 0, 320, 160)
+
+# Large boards
+OFF_BOARD = (40, 40, 40)
+CHUNK_CELLS = 16  # Chunk edge in cells
+CHUNK_CACHE = 48  # Chunk surfaces kept; a full 800x600 view needs at most 12
+
+
+class PlayfieldRenderer:
+    """Dirty-rectangle renderer for the snake board"""
+
+    def __init__(self, screen: pygame.Surface, engine: SnakeEngine, cell_size: int,
+                 font: pygame.font.Font, hud_draw: Callable[[], None],
+                 hud_key: Callable[[], Tuple], dirty_rects: bool = True,
+                 atlas: Optional[SpriteAtlas] = None):
+        self.screen = screen
+        self.engine = engine
+        self.cell_size = cell_size
+        self.font = font
+        self.hud_draw = hud_draw
+        self.hud_key = hud_key
+        self.dirty_rects = dirty_rects
+        self.hud_rect = pygame.Rect(HUD_RECT)
+        self.atlas = atlas if atlas is not None else SpriteAtlas(cell_size, font)
+
+        self.attach(engine)
+        self._head: Optional[Tuple[int, int]] = None
+        self._tail: Optional[Tuple[int, int]] = None
+        self._head_rect: Optional[pygame.Rect] = None
+        self.alpha = 1.0
+        self._food_rect: Optional[pygame.Rect] = None
+        self._hud_value: Optional[Tuple] = None
+        self._layout = -1
+
+        # Stats
+        self.full_redraws = 0
+        self.partial_updates = 0
+        self.rects_pushed = 0
+
+    def attach(self, engine: SnakeEngine):
+        """Draw a different engine from the next frame on"""
+        self.engine = engine
+        # Subscribe to the engine's cell journal
+        self.engine.changed_cells = []
+        self.needs_full = True
+
+    def invalidate(self):
+        """Force a full redraw on the next present()"""
+        self.needs_full = True
+
+    def cell_rect(self, pos: Tuple[int, int]) -> pygame.Rect:
+        """Screen rect of a board cell"""
+        x, y = pos
+        return pygame.Rect(x * self.cell_size, y * self.cell_size, self.cell_size, self.cell_size)
+
+    def food_rect(self) -> Optional[pygame.Rect]:
+        """Screen rect covered by the food, its glow ring and the "?" glyph"""
+        if not self.engine.food_pos:
+            return None
+        return self.cell_rect(self.engine.food_pos).inflate(8, 8)
+
+    def head_rect(self) -> pygame.Rect:
+        """Screen rect of the head, interpolated from the cell it left"""
+        dx, dy = self.engine.direction.value
+        back = (1.0 - self.alpha) * self.cell_size
+        return self.cell_rect(self.engine.snake[0]).move(round(-dx * back), round(-dy * back))
+
+    def neck_cell(self) -> Tuple[int, int]:
+        """The cell the head moved in from"""
+        x, y = self.engine.snake[0]
+        dx, dy = self.engine.direction.value
+        return (x - dx, y - dy)
+
+    def tail_sprite(self) -> Optional[Tuple[pygame.Surface, pygame.Rect, pygame.Rect]]:
+        """Blit for the rounded tail, or None for a one-cell snake"""
+        snake = self.engine.snake
+        if len(snake) < 2:
+            return None
+        tail = snake[-1]
+        return (self.atlas.sheet, self.cell_rect(tail), self.atlas.tail_towards(tail, snake[-2]))
+
+    def head_sprite(self) -> Tuple[pygame.Surface, pygame.Rect, pygame.Rect]:
+        """Blit for the head, eyes facing the direction of travel"""
+        return (self.atlas.sheet, self.head_rect(), self.atlas.head[self.engine.direction])
+
+    def food_sprite(self) -> Optional[Tuple[pygame.Surface, pygame.Rect, pygame.Rect]]:
+        """Blit for the food in the current phase of its pulse"""
+        rect = self.food_rect()
+        if rect is None:
+            return None
+        return (self.atlas.sheet, rect, self.atlas.food_at(pygame.time.get_ticks()))
+
+    def sprites(self) -> List[Tuple[pygame.Surface, pygame.Rect, pygame.Rect]]:
+        """Every snake and food blit, in drawing order"""
+        sheet, body = self.atlas.sheet, self.atlas.body
+        snake = self.engine.snake
+        blits = [(sheet, self.cell_rect(segment), body) for segment in islice(snake, 1, len(snake) - 1)]
+        blits.extend(blit for blit in (self.tail_sprite(), self.head_sprite(), self.food_sprite()) if blit)
+        return blits
+
+    def draw_full(self):
+        """Redraw the whole board, food and HUD"""
+        self.screen.fill(BLACK)
+        self.screen.blits(self.sprites(), False)
+        self.hud_draw()
+        self._remember()
+        self.full_redraws += 1
+
+    def _remember(self):
+        """Record what is on screen now and drop the journal"""
+        self._head = self.engine.snake[0]
+        self._tail = self.engine.snake[-1]
+        self._head_rect = self.head_rect()
+        self._food_rect = self.food_rect()
+        self._hud_value = self.hud_key()
+        self._layout = self.engine.layout_version
+        del self.engine.changed_cells[:]
+        self.needs_full = False
+
+    def _repaint(self, rects: List[pygame.Rect]):
+        """Clear the rects, then redraw what overlaps them as one clipped blits batch"""
+        size = self.cell_size
+        engine = self.engine
+        sheet, body = self.atlas.sheet, self.atlas.body
+        head, tail = engine.snake[0], engine.snake[-1]
+        extras = [blit for blit in (self.tail_sprite(), self.head_sprite(), self.food_sprite()) if blit]
+
+        blits = []
+        for rect in rects:
+            self.screen.fill(BLACK, rect)
+            x0 = max(0, rect.left // size)
+            x1 = min(engine.width, (rect.right - 1) // size + 1)
+            y0 = max(0, rect.top // size)
+            y1 = min(engine.height, (rect.bottom - 1) // size + 1)
+            for y in range(y0, y1):
+                row = y * engine.width
+                for x in range(x0, x1):
+                    if engine.occupancy[row + x] and (x, y) != head and (x, y) != tail:
+                        blits.append(_clipped(sheet, self.cell_rect((x, y)), body, rect))
+            blits.extend(_clipped(source, dest, area, rect) for source, dest, area in extras)
+        self.screen.blits([blit for blit in blits if blit], False)
+
+        if self.hud_rect in rects:
+            self.screen.set_clip(self.hud_rect)
+            self.hud_draw()
+            self.screen.set_clip(None)
+
+    def dirty_rect_list(self) -> List[pygame.Rect]:
+        """Screen rects that changed since the last present()"""
+        engine = self.engine
+        width = engine.width
+        rects = [self.cell_rect((index % width, index // width)) for index in engine.changed_cells]
+
+        # The old head loses its eyes, the new one gains them; while the
+        # head slides, the cells it spans are repainted every frame
+        head_rect = self.head_rect()
+        if self._head != engine.snake[0] or self._head_rect != head_rect:
+            rects.append(self._head_rect)
+            rects.append(head_rect)
+            rects.append(self.cell_rect(engine.snake[0]))
+            rects.append(self.cell_rect(self.neck_cell()))
+
+        # The segment behind the old tail is rounded off
+        if self._tail != engine.snake[-1]:
+            rects.append(self.cell_rect(engine.snake[-1]))
+
+        # Food pulses every frame and may have moved
+        if self._food_rect:
+            rects.append(self._food_rect)
+        food = self.food_rect()
+        if food and food != self._food_rect:
+            rects.append(food)
+
+        # HUD text is blended, so it is only ever drawn over a cleared HUD area
+        if self.hud_key() != self._hud_value or any(self.hud_rect.colliderect(rect) for rect in rects):
+            rects.append(self.hud_rect)
+        return [pygame.Rect(rect) for rect in dict.fromkeys(tuple(rect) for rect in rects)]
+
+    def present(self, alpha: float = 1.0) -> int:
+        """Draw the board and push it to the display; returns rects pushed"""
+        self.alpha = alpha
+        if (not self.dirty_rects or self.needs_full or
+                self._layout != self.engine.layout_version):
+            self.draw_full()
+            pygame.display.flip()
+            return 1
+
+        rects = self.dirty_rect_list()
+        self._repaint(rects)
+        self._remember()
+        pygame.display.update(rects)
+
+        self.partial_updates += 1
+        self.rects_pushed += len(rects)
+        return len(rects)
+
+
+def _clipped(source: pygame.Surface, dest: pygame.Rect, area: pygame.Rect, clip: pygame.Rect):
+    """The part of a (source, dest, area) blit that lands inside clip, or None"""
+    visible = pygame.Rect(dest.topleft, area.size).clip(clip)
+    if not visible:
+        return None
+    return (source, visible.topleft,
+            pygame.Rect(area.x + visible.x - dest.x, area.y + visible.y - dest.y, visible.w, visible.h))
+
+
+class Camera:
+    """Viewport onto a board bigger than the screen, in board pixels"""
+
+    def __init__(self, view_width: int, view_height: int, world_width: int, world_height: int):
+        self.view_width = view_width
+        self.view_height = view_height
+        self.resize(world_width, world_height)
+
+    def resize(self, world_width: int, world_height: int):
+        self.world_width = world_width
+        self.world_height = world_height
+        self.x = self.y = 0
+
+    @staticmethod
+    def _clamp(value: float, world: int, view: int) -> int:
+        if world <= view:
+            return -(view - world) // 2  # Centre boards narrower than the view
+        return int(min(max(value, 0), world - view))
+
+    def follow(self, px: float, py: float):
+        """Centre on a board pixel without showing past the board edges"""
+        self.x = self._clamp(px - self.view_width / 2, self.world_width, self.view_width)
+        self.y = self._clamp(py - self.view_height / 2, self.world_height, self.view_height)
+
+    def visible(self) -> pygame.Rect:
+        """Board pixels currently on screen"""
+        return pygame.Rect(self.x, self.y, self.view_width, self.view_height)
+
+
+class ChunkedRenderer(PlayfieldRenderer):
+    """Camera-following renderer for boards of any size, drawn from cached chunks"""
+
+    def __init__(self, screen: pygame.Surface, engine: SnakeEngine, cell_size: int,
+                 font: pygame.font.Font, hud_draw: Callable[[], None],
+                 hud_key: Callable[[], Tuple], chunk_cells: int = CHUNK_CELLS,
+                 cache_size: int = CHUNK_CACHE, atlas: Optional[SpriteAtlas] = None):
+        self.chunk_cells = chunk_cells
+        self.cache_size = cache_size
+        self.chunks: Dict[Tuple[int, int], pygame.Surface] = OrderedDict()
+        self.camera = Camera(*screen.get_size(), engine.width * cell_size, engine.height * cell_size)
+        super().__init__(screen, engine, cell_size, font, hud_draw, hud_key, dirty_rects=False, atlas=atlas)
+
+        # Stats
+        self.chunks_rendered = 0
+        self.cells_patched = 0
+
+    def attach(self, engine: SnakeEngine):
+        super().attach(engine)
+        self.chunks.clear()
+        self.camera.resize(engine.width * self.cell_size, engine.height * self.cell_size)
+
+    def cell_rect(self, pos: Tuple[int, int]) -> pygame.Rect:
+        """Screen rect of a board cell, through the camera"""
+        x, y = pos
+        return pygame.Rect(x * self.cell_size - self.camera.x, y * self.cell_size - self.camera.y,
+                           self.cell_size, self.cell_size)
+
+    def _chunk(self, key: Tuple[int, int]) -> pygame.Surface:
+        """Cached surface of a chunk's body cells (not head or tail), painted on first use"""
+        chunk = self.chunks.get(key)
+        if chunk is not None:
+            self.chunks.move_to_end(key)
+            return chunk
+
+        engine, size, cells = self.engine, self.cell_size, self.chunk_cells
+        x0, y0 = key[0] * cells, key[1] * cells
+        x1, y1 = min(engine.width, x0 + cells), min(engine.height, y0 + cells)
+        chunk = pygame.Surface(((x1 - x0) * size, (y1 - y0) * size))
+        chunk.fill(BLACK)
+        head, tail = engine.snake[0], engine.snake[-1]
+        occupancy, width = engine.occupancy, engine.width
+        for y in range(y0, y1):
+            row = y * width
+            for x in range(x0, x1):
+                if occupancy[row + x] and (x, y) != head and (x, y) != tail:
+                    chunk.fill(BODY_GREEN, ((x - x0) * size, (y - y0) * size, size, size))
+
+        self.chunks[key] = chunk
+        if len(self.chunks) > self.cache_size:
+            self.chunks.popitem(last=False)
+        self.chunks_rendered += 1
+        return chunk
+
+    def _patch(self, x: int, y: int):
+        """Repaint one cell in its chunk, if that chunk is cached"""
+        cells, size = self.chunk_cells, self.cell_size
+        chunk = self.chunks.get((x // cells, y // cells))
+        if chunk is None:
+            return
+        engine = self.engine
+        body = engine.occupancy[y * engine.width + x] and (x, y) not in (engine.snake[0], engine.snake[-1])
+        chunk.fill(BODY_GREEN if body else BLACK, (x % cells * size, y % cells * size, size, size))
+        self.cells_patched += 1
+
+    def _sync(self):
+        """Bring cached chunks up to date with the engine's cell journal"""
+        engine = self.engine
+        if self._layout != engine.layout_version:
+            self.chunks.clear()
+        else:
+            width = engine.width
+            for index in engine.changed_cells:
+                self._patch(index % width, index // width)
+            if self._head is not None and self._head != engine.snake[0]:
+                # The old head cell is plain body now
+                self._patch(*self._head)
+            if self._tail is not None and self._tail != engine.snake[-1]:
+                # The new tail is drawn as a sprite on top of the chunk
+                self._patch(*self._tail)
+                self._patch(*engine.snake[-1])
+        self._head = engine.snake[0]
+        self._tail = engine.snake[-1]
+        self._layout = engine.layout_version
+        del engine.changed_cells[:]
+
+    def draw_food_marker(self):
+        """Point at food outside the view from the nearest screen edge"""
+        food = self.engine.food_pos
+        if not food:
+            return
+        center = self.cell_rect(food).center
+        if self.screen.get_rect().collidepoint(center):
+            return
+        width, height = self.screen.get_size()
+        x = min(max(center[0], 12), width - 12)
+        y = min(max(center[1], 12), height - 12)
+        pygame.draw.circle(self.screen, RED, (x, y), 8)
+        pygame.draw.circle(self.screen, WHITE, (x, y), 8, 2)
+
+    def draw_full(self):
+        """Blit the chunks in view with the tail, head and food in one batch, then the HUD"""
+        self._sync()
+        size = self.cell_size
+        dx, dy = self.engine.direction.value
+        back = (1.0 - self.alpha) * size
+        head_x, head_y = self.engine.snake[0]
+        self.camera.follow(head_x * size - dx * back + size / 2, head_y * size - dy * back + size / 2)
+
+        view = self.camera.visible()
+        span = self.chunk_cells * size
+        self.screen.fill(OFF_BOARD)
+        blits = []
+        for cy in range(max(0, view.top // span), min(self.engine.height * size, view.bottom) // span + 1):
+            for cx in range(max(0, view.left // span), min(self.engine.width * size, view.right) // span + 1):
+                if cx * span < self.engine.width * size and cy * span < self.engine.height * size:
+                    blits.append((self._chunk((cx, cy)), (cx * span - view.x, cy * span - view.y)))
+        blits.extend(blit for blit in (self.tail_sprite(), self.head_sprite(), self.food_sprite()) if blit)
+        self.screen.blits(blits, False)
+
+        self.draw_food_marker()
+        self.hud_draw()
+        self.full_redraws += 1
+
+    def present(self, alpha: float = 1.0) -> int:
+        """Draw the view and flip; the camera moves, so the whole screen changes"""
+        self.alpha = alpha
+        self.draw_full()
+        pygame.display.flip()
+        return 1
@@ -0,0 +1,209 @@
+"""
+🐍 Snake Evolution - Session Replays
+Compact binary recording of a session and deterministic playback
+
+A replay is the RNG seed plus every input that changed the game: direction
+changes, question answers and restarts, each stamped with the engine tick
+it happened on. Feeding those inputs back into a SnakeEngine seeded the same
+way reproduces the session exactly, with or without rendering.
+
+File layout (little endian):
+    b"SNKR", version:u8, flags:u8, seed:u64, width:u16, height:u16
+    records: varint tick delta, then one byte = kind << 4 | payload
+"""
+
+import struct
+from typing import BinaryIO, Callable, Iterator, List, Optional, Tuple, Union
+
+from .engine import Direction, Event, Question, SnakeEngine
+
+MAGIC = b"SNKR"
+VERSION = 1
+HEADER = struct.Struct("<4sBBQHH")
+
+# Header flags
+FLAG_QUESTIONS = 0x1  # eating food poses a question and freezes the snake
+
+# Record kinds
+TURN = 1     # payload: direction index
+ANSWER = 2   # payload: option index (bits 0-2) | correct (bit 3)
+RESET = 3    # engine.reset(); tick numbering starts again from 0
+END = 4      # last tick of the recording
+
+DIRECTIONS = list(Direction)
+
+
+def _write_varint(out: bytearray, value: int):
+    """Append an unsigned LEB128 integer"""
+    while value >= 0x80:
+        out.append((value & 0x7F) | 0x80)
+        value >>= 7
+    out.append(value)
+
+
+def _read_varint(data: bytes, pos: int) -> Tuple[int, int]:
+    """Read an unsigned LEB128 integer; returns (value, next position)"""
+    value = shift = 0
+    while True:
+        byte = data[pos]
+        pos += 1
+        value |= (byte & 0x7F) << shift
+        if not byte & 0x80:
+            return value, pos
+        shift += 7
+
+
+class ReplayRecorder:
+    """Collects a SnakeEngine's inputs into the compact replay format"""
+
+    def __init__(self):
+        self.engine: Optional[SnakeEngine] = None
+        self.records = bytearray()
+        self._last_tick = 0
+
+    def start(self, engine: SnakeEngine, seed: Optional[int] = None):
+        """Reseed the engine, start a fresh game and record everything from here"""
+        engine.recorder = None
+        engine.reseed(seed)
+        engine.recorder = self
+        self.engine = engine
+        self.records = bytearray()
+        self._last_tick = 0
+
+    def stop(self):
+        """Detach from the engine"""
+        if self.engine is not None:
+            self.engine.recorder = None
+
+    def _record(self, tick: int, kind: int, payload: int = 0):
+        _write_varint(self.records, tick - self._last_tick)
+        self.records.append(kind << 4 | payload)
+        self._last_tick = tick
+
+    def on_turn(self, tick: int, direction: Direction):
+        self._record(tick, TURN, DIRECTIONS.index(direction))
+
+    def on_answer(self, tick: int, option_index: int, correct: bool):
+        self._record(tick, ANSWER, (option_index & 0x7) | (0x8 if correct else 0))
+
+    def on_reset(self, tick: int):
+        self._record(tick, RESET)
+        self._last_tick = 0
+
+    def to_bytes(self) -> bytes:
+        """The full replay, ending at the engine's current tick"""
+        engine = self.engine
+        flags = FLAG_QUESTIONS if engine.question_source is not None else 0
+        out = bytearray(HEADER.pack(MAGIC, VERSION, flags, engine.seed, engine.width, engine.height))
+        out += self.records
+        _write_varint(out, engine.ticks - self._last_tick)
+        out.append(END << 4)
+        return bytes(out)
+
+    def save(self, path: str):
+        """Write the replay to a file"""
+        with open(path, "wb") as f:
+            f.write(self.to_bytes())
+
+
+class ReplayPlayer:
+    """Feeds a recorded session back through a SnakeEngine"""
+
+    def __init__(self, data: Union[bytes, BinaryIO]):
+        if not isinstance(data, (bytes, bytearray)):
+            data = data.read()
+        magic, version, self.flags, self.seed, self.width, self.height = HEADER.unpack_from(data)
+        if magic != MAGIC or version != VERSION:
+            raise ValueError("Not a Snake Evolution replay")
+
+        # Decode into (tick, kind, payload) with absolute ticks per game
+        self.records: List[Tuple[int, int, int]] = []
+        pos, tick = HEADER.size, 0
+        while pos < len(data):
+            delta, pos = _read_varint(data, pos)
+            byte = data[pos]
+            pos += 1
+            tick += delta
+            kind = byte >> 4
+            self.records.append((tick, kind, byte & 0xF))
+            if kind == RESET:
+                tick = 0
+
+        self.engine: Optional[SnakeEngine] = None
+        self._next = 0
+
+    @classmethod
+    def load(cls, path: str) -> "ReplayPlayer":
+        with open(path, "rb") as f:
+            return cls(f.read())
+
+    def start(self, tick_source: Optional[Callable[[], int]] = None) -> SnakeEngine:
+        """Create the engine in its recorded starting state"""
+        question_source = None
+        if self.flags & FLAG_QUESTIONS:
+            # The recorded answer replaces this placeholder when it is replayed
+            question_source = lambda level: Question(question="", answer=0, options=[0],
+                                                     difficulty=level, subject="replay")
+        self.engine = SnakeEngine(self.width, self.height, tick_source=tick_source,
+                                  question_source=question_source, seed=self.seed)
+        self._next = 0
+        return self.engine
+
+    @property
+    def finished(self) -> bool:
+        return self._next >= len(self.records)
+
+    def _apply_due(self) -> bool:
+        """Apply every record stamped with the current tick; False once the replay ends"""
+        engine = self.engine
+        while self._next < len(self.records):
+            tick, kind, payload = self.records[self._next]
+            if tick > engine.ticks:
+                return True
+            if tick < engine.ticks:
+                raise ValueError(f"Replay out of sync at tick {engine.ticks}")
+            self._next += 1
+
+            if kind == TURN:
+                engine.turn(DIRECTIONS[payload])
+            elif kind == ANSWER:
+                # Only whether the answer was right affects the game
+                option, correct = payload & 0x7, bool(payload & 0x8)
+                engine.ask(Question(question="", answer=option if correct else -1,
+                                    options=list(range(option + 1)), difficulty=engine.level,
+                                    subject="replay"))
+                engine.answer_question(option)
+            elif kind == RESET:
+                engine.reset()
+            elif kind == END:
+                self._next = len(self.records)
+                return False
+        return False
+
+    def step(self) -> Optional[List[Event]]:
+        """Apply due inputs and advance one tick; None when the replay is over"""
+        if not self._apply_due():
+            return None
+
+        ticks = self.engine.ticks
+        events = self.engine.step()
+        if self.engine.ticks == ticks:
+            # The game is frozen (dead or waiting for an answer) but the
+            # next input lies in the future: the log does not fit this game
+            raise ValueError(f"Replay out of sync at tick {ticks}")
+        return events
+
+    def frames(self) -> Iterator[List[Event]]:
+        """Yield the events of every replayed tick"""
+        while True:
+            events = self.step()
+            if events is None:
+                return
+            yield events
+
+    def run(self) -> SnakeEngine:
+        """Replay the whole session at full speed without rendering"""
+        self.start()
+        for _ in self.frames():
+            pass
+        return self.engine
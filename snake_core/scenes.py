@@ -0,0 +1,151 @@
+"""
+🐍 Snake Evolution - Scenes
+Scene registry with per-scene timing probes
+
+Every screen (menu, snake playfield, each mini-game) is a Scene with
+handle_event, update and draw. The main loop looks the active scene up by
+key and calls it through the registry, which times each phase so the
+scene eating the frame budget shows up in stats().
+"""
+
+import time
+from typing import Any, Callable, Dict, Hashable, List, Optional
+
+PHASES = ("event", "update", "draw")
+
+
+class Scene:
+    """One screen of the game; subclasses override what they need"""
+
+    def enter(self):
+        """Called when the scene becomes active"""
+
+    def handle_event(self, event) -> bool:
+        """React to one input event; returning False quits the game"""
+        return True
+
+    def update(self):
+        """Advance the scene by one frame"""
+
+    def draw(self):
+        """Draw the scene"""
+
+
+class CallbackScene(Scene):
+    """Scene assembled from plain callables, e.g. bound methods of the game"""
+
+    def __init__(self, handle_event: Optional[Callable[[Any], Optional[bool]]] = None,
+                 update: Optional[Callable[[], None]] = None,
+                 draw: Optional[Callable[[], None]] = None,
+                 enter: Optional[Callable[[], None]] = None):
+        self._handle_event = handle_event
+        self._update = update
+        self._draw = draw
+        self._enter = enter
+
+    def enter(self):
+        if self._enter is not None:
+            self._enter()
+
+    def handle_event(self, event) -> bool:
+        if self._handle_event is None:
+            return True
+        return self._handle_event(event) is not False
+
+    def update(self):
+        if self._update is not None:
+            self._update()
+
+    def draw(self):
+        if self._draw is not None:
+            self._draw()
+
+
+class TimingProbe:
+    """Accumulated wall time per phase for one scene"""
+
+    __slots__ = ("frames", "total", "peak", "_frame")
+
+    def __init__(self):
+        self.frames = 0
+        self.total = dict.fromkeys(PHASES, 0.0)
+        self.peak = 0.0
+        self._frame = 0.0
+
+    def record(self, phase: str, seconds: float):
+        self.total[phase] += seconds
+        self._frame += seconds
+        if phase == "draw":
+            # A frame ends with its draw
+            self.frames += 1
+            self.peak = max(self.peak, self._frame)
+            self._frame = 0.0
+
+    def stats(self) -> Dict[str, float]:
+        """Frame count, total and per-frame milliseconds"""
+        frames = max(self.frames, 1)
+        stats = {'frames': self.frames,
+                 'total_ms': sum(self.total.values()) * 1000,
+                 'peak_ms': self.peak * 1000}
+        for phase in PHASES:
+            stats[f'{phase}_ms'] = self.total[phase] * 1000 / frames
+        return stats
+
+
+class SceneRegistry:
+    """Scenes by key; dispatch is a dict lookup plus a timing probe"""
+
+    def __init__(self, clock: Callable[[], float] = time.perf_counter):
+        self.clock = clock
+        self.scenes: Dict[Hashable, Scene] = {}
+        self.probes: Dict[Hashable, TimingProbe] = {}
+
+    def register(self, key: Hashable, scene: Scene) -> Scene:
+        """Add or replace the scene for key"""
+        self.scenes[key] = scene
+        self.probes.setdefault(key, TimingProbe())
+        return scene
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self.scenes
+
+    def __getitem__(self, key: Hashable) -> Scene:
+        return self.scenes[key]
+
+    def enter(self, key: Hashable):
+        self.scenes[key].enter()
+
+    def handle_event(self, key: Hashable, event) -> bool:
+        start = self.clock()
+        result = self.scenes[key].handle_event(event)
+        self.probes[key].record("event", self.clock() - start)
+        return result
+
+    def update(self, key: Hashable):
+        start = self.clock()
+        self.scenes[key].update()
+        self.probes[key].record("update", self.clock() - start)
+
+    def draw(self, key: Hashable):
+        start = self.clock()
+        self.scenes[key].draw()
+        self.probes[key].record("draw", self.clock() - start)
+
+    def frame(self, key: Hashable):
+        """Update then draw one frame of a scene"""
+        self.update(key)
+        self.draw(key)
+
+    def stats(self) -> Dict[Hashable, Dict[str, float]]:
+        """Timing stats of every scene that ran at least one frame"""
+        return {key: probe.stats() for key, probe in self.probes.items() if probe.frames}
+
+    def report(self) -> List[str]:
+        """Scene timings as text lines, most expensive scene first"""
+        stats = sorted(self.stats().items(), key=lambda item: -item[1]['total_ms'])
+        lines = [f"{'scene':<24}{'frames':>8}{'event':>9}{'update':>9}{'draw':>9}{'peak':>9}"]
+        for key, s in stats:
+            name = getattr(key, "name", key)
+            lines.append(f"{str(name).lower():<24}{s['frames']:>8}{s['event_ms']:>9.3f}"
+                         f"{s['update_ms']:>9.3f}{s['draw_ms']:>9.3f}{s['peak_ms']:>9.3f}")
+        return lines
@@ -0,0 +1,75 @@
+"""
+🐍 Snake Evolution - Fixed-Step Scheduler
+Accumulator-based fixed timestep decoupled from the render rate
+
+Each frame the caller hands in the current time; the scheduler says how
+many whole simulation steps are due and how far (0..1) the simulation is
+into the next one, so the renderer can interpolate. Frames that take too
+long are counted as late, and steps beyond max_steps_per_frame are
+dropped instead of snowballing into ever longer catch-up frames.
+"""
+
+from typing import Callable, Dict, Optional
+
+
+class FixedStepScheduler:
+    """Turns wall-clock frame times into a whole number of fixed simulation steps"""
+
+    def __init__(self, step_ms: float, tick_source: Optional[Callable[[], float]] = None,
+                 max_steps_per_frame: int = 5, late_ms: float = 1000 / 30):
+        self.step_ms = step_ms
+        self.tick_source = tick_source
+        self.max_steps_per_frame = max_steps_per_frame
+        self.late_ms = late_ms
+
+        self.accumulator = 0.0
+        self.last_time: Optional[float] = None
+
+        # Stats
+        self.frames = 0
+        self.steps = 0
+        self.late_frames = 0
+        self.dropped_ticks = 0
+
+    def resync(self, now: Optional[float] = None):
+        """Forget elapsed time, e.g. after a pause, so nothing bursts on resume"""
+        self.last_time = self.tick_source() if now is None else now
+        self.accumulator = 0.0
+
+    def advance(self, now: Optional[float] = None) -> int:
+        """Account for the time since the last frame and return the steps due"""
+        if now is None:
+            now = self.tick_source()
+        if self.last_time is None:
+            self.last_time = now
+
+        elapsed = now - self.last_time
+        self.last_time = now
+        self.frames += 1
+        if elapsed > self.late_ms:
+            self.late_frames += 1
+
+        self.accumulator += elapsed
+        due = int(self.accumulator // self.step_ms)
+        self.accumulator -= due * self.step_ms
+
+        if due > self.max_steps_per_frame:
+            self.dropped_ticks += due - self.max_steps_per_frame
+            due = self.max_steps_per_frame
+
+        self.steps += due
+        return due
+
+    @property
+    def alpha(self) -> float:
+        """How far into the next step we are, for render interpolation"""
+        return min(1.0, self.accumulator / self.step_ms)
+
+    def stats(self) -> Dict[str, int]:
+        """Frame and step counters"""
+        return {
+            'frames': self.frames,
+            'steps': self.steps,
+            'late_frames': self.late_frames,
+            'dropped_ticks': self.dropped_ticks,
+        }
@@ -0,0 +1,48 @@
+"""
+🐍 Snake Evolution - Spatial Hash
+Uniform-grid broadphase for the arcade mini-games
+
+Entities are bucketed by the grid cell their position falls in, so a
+collision query only looks at the few buckets around a point instead of
+every entity on screen. The grid is cheap enough to rebuild every frame.
+"""
+
+from typing import Dict, Iterable, List, Sequence, Tuple
+
+
+class SpatialHash:
+    """Buckets of entity indices keyed by grid cell"""
+
+    def __init__(self, cell_size: float):
+        self.cell_size = cell_size
+        self.buckets: Dict[Tuple[int, int], List[int]] = {}
+
+    def clear(self):
+        self.buckets.clear()
+
+    def build_columns(self, indices: Iterable[int], xs: Sequence[float], ys: Sequence[float]):
+        """Rebuild from column storage; entity i is at (xs[i], ys[i])"""
+        buckets = self.buckets
+        buckets.clear()
+        size = self.cell_size
+        for index in indices:
+            key = (int(xs[index] // size), int(ys[index] // size))
+            bucket = buckets.get(key)
+            if bucket is None:
+                buckets[key] = [index]
+            else:
+                bucket.append(index)
+
+    def query(self, x: float, y: float, radius: float) -> List[List[int]]:
+        """Buckets (lists of entity indices) overlapping the square around (x, y)"""
+        size = self.cell_size
+        buckets = self.buckets
+        x0, x1 = int((x - radius) // size), int((x + radius) // size)
+        y0, y1 = int((y - radius) // size), int((y + radius) // size)
+        found = []
+        for cx in range(x0, x1 + 1):
+            for cy in range(y0, y1 + 1):
+                bucket = buckets.get((cx, cy))
+                if bucket:
+                    found.append(bucket)
+        return found
@@ -0,0 +1,67 @@
+"""
+🐍 Snake Evolution - Text Surface Cache
+Bounded LRU cache for rendered font surfaces
+
+Most strings on screen never change between frames, so rendering them
+once and blitting the cached surface removes the per-frame allocation
+churn of font.render(). Entries are keyed by font, text, antialias,
+colour and language; switching language clears the cache.
+"""
+
+from collections import OrderedDict
+from typing import Any, Dict, Tuple
+
+
+class TextCache:
+    """LRU cache of rendered text surfaces with hit/miss counters"""
+
+    def __init__(self, maxsize: int = 512, language: str = "english"):
+        self.maxsize = maxsize
+        self.language = language
+        self._surfaces: "OrderedDict[Tuple, Any]" = OrderedDict()
+
+        # Stats
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def render(self, font, text: str, antialias: bool, color) -> Any:
+        """Return font.render(text, antialias, color), reusing earlier surfaces"""
+        key = (id(font), text, antialias, tuple(color), self.language)
+        surface = self._surfaces.get(key)
+        if surface is not None:
+            self._surfaces.move_to_end(key)
+            self.hits += 1
+            return surface
+
+        self.misses += 1
+        surface = font.render(text, antialias, color)
+        self._surfaces[key] = surface
+        if len(self._surfaces) > self.maxsize:
+            self._surfaces.popitem(last=False)
+            self.evictions += 1
+        return surface
+
+    def set_language(self, language: str):
+        """Switch language and drop every cached surface"""
+        if language != self.language:
+            self.language = language
+            self.clear()
+
+    def clear(self):
+        """Drop every cached surface"""
+        self._surfaces.clear()
+
+    def stats(self) -> Dict[str, float]:
+        """Hit/miss counters for checking per-frame churn"""
+        lookups = self.hits + self.misses
+        return {
+            'size': len(self._surfaces),
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions,
+            'hit_rate': self.hits / lookups if lookups else 0.0,
+        }
+
+    def __len__(self) -> int:
+        return len(self._surfaces)
@@ -0,0 +1,253 @@
+"""
+🐍 Snake Evolution - Tic-Tac-Toe
+Bitboard k-in-a-row engine with an alpha-beta computer opponent
+
+Each player's stones are one int with bit (row * size + col) set per
+stone, and every winning line is a precomputed mask, so "did that move
+win" is a few ANDs over the lines through the cell just played. Works
+for any N x N board and k in a row: classic 3x3, or 7x7 connect-5.
+
+The AI is negamax with alpha-beta pruning, iterative deepening and a
+transposition table keyed by the two bitboards. Small boards are
+searched to the end; on big ones the search stops at a depth limit,
+scores open lines, and only looks at cells next to a stone.
+"""
+
+from typing import Dict, List, NamedTuple, Optional, Tuple
+
+PLAYERS = ("X", "O")
+TIE = "Tie"
+
+WIN_SCORE = 1_000_000  # Minus the stones on the board, so faster wins score higher
+PRUNE_ABOVE = 16  # Boards with more cells only consider moves next to a stone
+TABLE_LIMIT = 1 << 20  # Transposition table entries before it is cleared
+
+EXACT, LOWER, UPPER = 0, 1, 2
+
+
+def popcount(bits: int) -> int:
+    return bin(bits).count("1")
+
+
+class Geometry(NamedTuple):
+    """Precomputed masks for one (size, k) board"""
+    lines: List[int]               # Every k-in-a-row mask
+    lines_through: List[List[int]]  # Masks containing each cell
+    order: List[int]               # Cells, most lines through them first
+    not_left: int                  # Every cell but the left column
+    not_right: int                 # Every cell but the right column
+
+
+_geometry_cache: Dict[Tuple[int, int], Geometry] = {}
+
+
+def geometry(size: int, k: int) -> Geometry:
+    """Win masks and move order for a size x size board, k in a row"""
+    key = (size, k)
+    geo = _geometry_cache.get(key)
+    if geo is None:
+        lines = []
+        for row in range(size):
+            for col in range(size):
+                for dr, dc in ((0, 1), (1, 0), (1, 1), (1, -1)):
+                    end_row, end_col = row + dr * (k - 1), col + dc * (k - 1)
+                    if 0 <= end_row < size and 0 <= end_col < size:
+                        lines.append(sum(1 << ((row + dr * i) * size + col + dc * i) for i in range(k)))
+        cells = size * size
+        lines_through = [[line for line in lines if line >> cell & 1] for cell in range(cells)]
+        centre = (size - 1) / 2
+        order = sorted(range(cells), key=lambda cell: (-len(lines_through[cell]),
+                                                       abs(cell // size - centre) + abs(cell % size - centre)))
+        left = sum(1 << (row * size) for row in range(size))
+        everything = (1 << cells) - 1
+        geo = Geometry(lines, lines_through, order, everything & ~left,
+                       everything & ~(left << (size - 1)))
+        _geometry_cache[key] = geo
+    return geo
+
+
+class TicTacToe:
+    """N x N board, k in a row wins; X moves first"""
+
+    def __init__(self, size: int = 3, k: int = 3):
+        if not 1 <= k <= size:
+            raise ValueError(f"Cannot play {k} in a row on a {size}x{size} board")
+        self.size = size
+        self.k = k
+        self.geometry = geometry(size, k)
+        self.full = (1 << (size * size)) - 1
+        self.reset()
+
+    def reset(self):
+        self.stones = [0, 0]  # Bitboards of X and O
+        self.turn = 0  # Index into PLAYERS
+        self.history: List[int] = []
+        self.winner: Optional[str] = None  # "X", "O", TIE, or None while playing
+
+    @property
+    def current(self) -> str:
+        return PLAYERS[self.turn]
+
+    @property
+    def over(self) -> bool:
+        return self.winner is not None
+
+    @property
+    def occupied(self) -> int:
+        return self.stones[0] | self.stones[1]
+
+    def cell(self, index: int) -> str:
+        """'X', 'O' or ' '"""
+        bit = 1 << index
+        if self.stones[0] & bit:
+            return "X"
+        if self.stones[1] & bit:
+            return "O"
+        return " "
+
+    def legal(self, index: int) -> bool:
+        return not self.over and 0 <= index < self.size * self.size and not self.occupied >> index & 1
+
+    def legal_moves(self) -> List[int]:
+        return [index for index in self.geometry.order if self.legal(index)]
+
+    def wins(self, stones: int, index: int) -> bool:
+        """Whether `stones` complete a line through `index`"""
+        for line in self.geometry.lines_through[index]:
+            if stones & line == line:
+                return True
+        return False
+
+    def play(self, index: int) -> Optional[str]:
+        """Place the current player's stone; returns the winner if the game just ended"""
+        if not self.legal(index):
+            raise ValueError(f"Illegal move: {index}")
+        stones = self.stones[self.turn] | (1 << index)
+        self.stones[self.turn] = stones
+        self.history.append(index)
+        if self.wins(stones, index):
+            self.winner = PLAYERS[self.turn]
+        elif self.occupied == self.full:
+            self.winner = TIE
+        else:
+            self.turn ^= 1
+        return self.winner
+
+    def undo(self):
+        """Take back the last move"""
+        index = self.history.pop()
+        if self.winner is None:
+            self.turn ^= 1
+        self.winner = None
+        self.stones[self.turn] &= ~(1 << index)
+
+
+class AlphaBetaAI:
+    """Negamax computer player with a transposition table"""
+
+    def __init__(self, max_depth: Optional[int] = None):
+        self.max_depth = max_depth  # None searches to the end of the game
+        self.table: Dict[Tuple[int, int], Tuple[int, int, int, int]] = {}
+        self.nodes = 0  # Positions visited, for benchmarks
+
+    def choose(self, game: TicTacToe) -> int:
+        """Best move for the player to move"""
+        if game.over:
+            raise ValueError("Game is over")
+        self._game = game
+        self._geo = game.geometry
+        self._weights = [4 ** count if count else 0 for count in range(game.k + 1)]
+        if len(self.table) > TABLE_LIMIT:
+            self.table.clear()
+
+        me, opp = game.stones[game.turn], game.stones[game.turn ^ 1]
+        stones = len(game.history)
+        empty = game.size * game.size - stones
+        limit = empty if self.max_depth is None else min(self.max_depth, empty)
+        for depth in range(1, limit + 1):
+            value = self._search(me, opp, stones, depth, -WIN_SCORE, WIN_SCORE)
+            if abs(value) > WIN_SCORE // 2:
+                break  # Forced result found; deeper search cannot change it
+        return self.table[(me, opp)][3]
+
+    def _moves(self, me: int, opp: int, first: int) -> List[int]:
+        """Empty cells worth trying, best guess first"""
+        game, geo = self._game, self._geo
+        occupied = me | opp
+        free = game.full & ~occupied
+        if game.size * game.size > PRUNE_ABOVE and occupied:
+            # Cells touching a stone (8-neighbourhood)
+            row = occupied | (occupied << 1 & geo.not_left) | (occupied >> 1 & geo.not_right)
+            free &= row | (row << game.size) | (row >> game.size)
+        moves = [cell for cell in geo.order if free >> cell & 1]
+        if first >= 0 and free >> first & 1:
+            moves.remove(first)
+            moves.insert(0, first)
+        return moves
+
+    def _evaluate(self, me: int, opp: int) -> int:
+        """Open lines for the side to move minus open lines for the opponent"""
+        weights = self._weights
+        score = 0
+        for line in self._geo.lines:
+            mine, theirs = me & line, opp & line
+            if mine:
+                if not theirs:
+                    score += weights[popcount(mine)]
+            elif theirs:
+                score -= weights[popcount(theirs)]
+        return score
+
+    def _search(self, me: int, opp: int, stones: int, depth: int, alpha: int, beta: int) -> int:
+        """Negamax value of the position for `me`, the side to move"""
+        self.nodes += 1
+        key = (me, opp)
+        entry = self.table.get(key)
+        first = -1
+        if entry is not None:
+            entry_depth, flag, value, first = entry
+            if entry_depth >= depth:
+                if flag == EXACT:
+                    return value
+                if flag == LOWER:
+                    alpha = max(alpha, value)
+                else:
+                    beta = min(beta, value)
+                if alpha >= beta:
+                    return value
+
+        moves = self._moves(me, opp, first)
+        if not moves:
+            return 0  # Full board
+        lines_through = self._geo.lines_through
+
+        # Win on the spot if possible; stored as exact at any depth
+        for move in moves:
+            placed = me | (1 << move)
+            for line in lines_through[move]:
+                if placed & line == line:
+                    value = WIN_SCORE - stones - 1
+                    self.table[key] = (1 << 30, EXACT, value, move)
+                    return value
+        if depth == 0:
+            return self._evaluate(me, opp)
+
+        # If the opponent threatens to win, only blocking moves matter
+        blocks = [move for move in moves
+                  if any((opp | (1 << move)) & line == line for line in lines_through[move])]
+        if blocks:
+            moves = blocks
+
+        start_alpha = alpha
+        best, best_move = -WIN_SCORE - 1, moves[0]
+        for move in moves:
+            value = -self._search(opp, me | (1 << move), stones + 1, depth - 1, -beta, -alpha)
+            if value > best:
+                best, best_move = value, move
+                if value > alpha:
+                    alpha = value
+                    if alpha >= beta:
+                        break
+        flag = UPPER if best <= start_alpha else LOWER if best >= beta else EXACT
+        self.table[key] = (depth, flag, best, best_move)
+        return best
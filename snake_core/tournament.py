@@ -0,0 +1,112 @@
+"""
+🐍 Snake Evolution - Arena Tournament
+Thousands of bot-vs-bot arena matches spread over every core
+
+Every match gets its own seed, derived from the tournament's base seed
+and the match number alone, and lineups rotate through every ordering of
+the strategies so no bot always starts on the same row. A tournament
+therefore gives the same results whether it runs in one process or
+across a ProcessPoolExecutor with any number of workers.
+"""
+
+import itertools
+import os
+import random
+import time
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from .arena import ARENA_HEIGHT, ARENA_WIDTH, MAX_TICKS, MatchResult, play_match
+from .autopilot import STRATEGIES
+
+
+def check_strategies(strategies: Sequence[str], size: int = 2):
+    """Raise ValueError unless there are at least `size` distinct, known strategies"""
+    unknown = [name for name in strategies if name not in STRATEGIES]
+    if unknown:
+        raise ValueError(f"Unknown autopilot strategy: {', '.join(unknown)} "
+                         f"(choose from {', '.join(STRATEGIES)})")
+    if len(set(strategies)) != len(strategies):
+        raise ValueError("Each strategy can only be entered once")
+    if len(strategies) < size:
+        raise ValueError(f"A tournament needs at least {size} strategies, got {len(strategies)}")
+
+
+def match_seed(base_seed: int, match: int) -> int:
+    """Seed of one match; depends only on the base seed and the match number"""
+    return random.Random(f"{base_seed}:{match}").getrandbits(63)
+
+
+def lineups(strategies: Sequence[str], matches: int, size: int = 2) -> List[Tuple[str, ...]]:
+    """Players of each match, cycling through every ordering of `size` strategies"""
+    orderings = list(itertools.permutations(strategies, size))
+    return [orderings[match % len(orderings)] for match in range(matches)]
+
+
+def _play(job: Tuple[Tuple[str, ...], int, int, int, int]) -> MatchResult:
+    """Worker entry point; module level so the process pool can pickle it"""
+    return play_match(*job)
+
+
+@dataclass
+class TournamentResult:
+    strategies: Tuple[str, ...]
+    results: List[MatchResult] = field(default_factory=list)
+    elapsed: float = 0.0
+    workers: int = 1
+
+    def tally(self) -> Dict[str, Dict[str, int]]:
+        """Matches played, won and drawn per strategy"""
+        table = {strategy: {"played": 0, "won": 0, "drawn": 0} for strategy in self.strategies}
+        for result in self.results:
+            for seat, strategy in enumerate(result.players):
+                row = table[strategy]
+                row["played"] += 1
+                if result.winner is None:
+                    row["drawn"] += 1
+                elif result.winner == seat:
+                    row["won"] += 1
+        return table
+
+    def win_rates(self) -> Dict[str, float]:
+        """Share of its matches each strategy won"""
+        return {strategy: row["won"] / row["played"] if row["played"] else 0.0
+                for strategy, row in self.tally().items()}
+
+    def lines(self) -> List[str]:
+        """Report table, best win rate first"""
+        tally, rates = self.tally(), self.win_rates()
+        ticks = sum(result.ticks for result in self.results)
+        lines = [f"{len(self.results)} matches on {self.workers} worker(s) in {self.elapsed:.2f} s "
+                 f"({len(self.results) / max(self.elapsed, 1e-9):.0f} matches/s, "
+                 f"{ticks / max(self.elapsed, 1e-9):.0f} ticks/s)",
+                 f"{'strategy':<12}{'played':>8}{'won':>7}{'drawn':>7}{'win rate':>10}"]
+        for strategy in sorted(self.strategies, key=lambda name: -rates[name]):
+            row = tally[strategy]
+            lines.append(f"{strategy:<12}{row['played']:>8}{row['won']:>7}{row['drawn']:>7}"
+                         f"{rates[strategy]:>10.1%}")
+        return lines
+
+
+def run_tournament(strategies: Sequence[str], matches: int = 1000, workers: Optional[int] = None,
+                   base_seed: int = 0, size: int = 2, width: int = ARENA_WIDTH, height: int = ARENA_HEIGHT,
+                   max_ticks: int = MAX_TICKS) -> TournamentResult:
+    """Play `matches` arena matches of `size` bots each; workers=None uses every core, 1 stays in-process"""
+    # Fail here rather than inside a worker process
+    check_strategies(strategies, size)
+    workers = workers or os.cpu_count() or 1
+    jobs = [(lineup, match_seed(base_seed, match), width, height, max_ticks)
+            for match, lineup in enumerate(lineups(strategies, matches, size))]
+
+    start = time.perf_counter()
+    if workers == 1:
+        results = [_play(job) for job in jobs]
+    else:
+        # Loaded here so the arena mini-game never pulls in multiprocessing
+        from concurrent.futures import ProcessPoolExecutor
+
+        # Matches are short: hand them out in batches to keep pickling overhead down
+        chunksize = max(1, len(jobs) // (workers * 8))
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            results = list(pool.map(_play, jobs, chunksize=chunksize))
+    return TournamentResult(tuple(strategies), results, time.perf_counter() - start, workers)
@@ -8,19 +8,44 @@ A classic Snake game enhanced with educational elements:
 - Progressive difficulty levels
 - Score tracking and achievements
 - Multilingual support (English/Tamil)
+
+Importing this module is cheap: pygame is loaded on first use and only
+the display and font subsystems are started, when SnakeGame opens its
+window.
 """
 
-import pygame
+from __future__ import annotations
+
+import itertools
 import random
 import sys
 import json
 import time
+from contextlib import contextmanager
 from enum import Enum
-from dataclasses import dataclass
-from typing import List, Tuple, Optional
+from typing import Dict, List, Sequence, Tuple, Optional
+
+from snake_core.lazy import lazy_import
 
-# Initialize Pygame
-pygame.init()
+# Real import happens on first attribute access, e.g. when the window opens
+pygame = lazy_import("pygame")
+
+from snake_core import questions
+from snake_core.arena import Arena
+from snake_core.autopilot import Autopilot, STRATEGIES
+from snake_core.engine import SnakeEngine, Direction, Event, Question
+from snake_core.questions import QuestionBank
+from snake_core.physics import PhysicsWorld
+from snake_core.pool import EntityPool
+from snake_core.profiler import FrameProfiler
+from snake_core.atlas import SpriteAtlas
+from snake_core.render import ChunkedRenderer, PlayfieldRenderer
+from snake_core.scenes import CallbackScene, Scene, SceneRegistry
+from snake_core.scheduler import FixedStepScheduler
+from snake_core.spatial import SpatialHash
+from snake_core.tictactoe import AlphaBetaAI, TicTacToe, TIE
+from snake_core.replay import ReplayRecorder, ReplayPlayer
+from snake_core.text_cache import TextCache
 
 # Game Constants
 WINDOW_WIDTH = 800
@@ -28,6 +53,7 @@ WINDOW_HEIGHT = 600
 GRID_SIZE = 20
 GRID_WIDTH = WINDOW_WIDTH // GRID_SIZE
 GRID_HEIGHT = WINDOW_HEIGHT // GRID_SIZE
+MAX_BOARD_SIZE = 4096  # Cells per side; replay files store sizes as 16-bit values
 
 # Colors
 BLACK = (0, 0, 0)
@@ -39,16 +65,72 @@ YELLOW = (255, 255, 0)
 PURPLE = (128, 0, 128)
 ORANGE = (255, 165, 0)
 CYAN = (0, 255, 255)
+MAGENTA = (255, 0, 255)  # Sprite colorkey
 
 # Game Settings
 FPS = 10
+RENDER_FPS = 60  # Playfield frame rate; the snake itself moves every move_delay ms
+MAX_STEPS_PER_FRAME = 5  # Catch-up limit after a long frame; the rest are dropped
 INITIAL_SPEED = 5
+TEXT_CACHE_SIZE = 512  # Rendered text surfaces kept between frames
+SHOOTER_BULLET_SPEED = 10
+SHOOTER_ENEMY_SPEED = 3
+SHOOTER_HIT_RADIUS = 20  # Bullet/enemy overlap distance per axis
+SHOOTER_GRID_CELL = 40  # Spatial hash cell size in pixels
+SHOOTER_STRESS_ENEMIES = 1000  # Stress mode load; fits the 60 FPS budget (bench_snake.py shooter)
+SHOOTER_STRESS_BULLETS = 1000
+
+# Entity pool capacities; spawns beyond these are dropped
+SHOOTER_MAX_BULLETS = 1024
+SHOOTER_MAX_ENEMIES = 1024
+RACING_MAX_OBSTACLES = 64
+MAX_ZOMBIES = 256
+BALL_MAX_OBSTACLES = 32
+
+# Snake Arena: you (arrow keys) against autopilot bots on one board
+ARENA_BOTS = ("astar", "greedy", "greedy")
+ARENA_COLORS = [GREEN, ORANGE, CYAN, PURPLE]  # Player first
+ARENA_TOP = 60  # Header strip above the board
+
+# Tic-Tac-Toe variants: (board size, stones in a row to win)
+TTT_VARIANTS = [(3, 3), (5, 4), (7, 5)]
+TTT_AI_DEPTH = 3  # Plies searched on boards too big to solve; depth 4 can take over a second on 7x7
+
+# Car Racing road, baked once and scrolled
+ROAD_TILE = 50  # Road markings repeat every ROAD_TILE pixels
+ROAD_SCROLL_SPEED = 5
+ROAD_COLOR = (50, 50, 50)
+
+# Ball Run physics (pixels and seconds)
+BALL_RADIUS = 15
+BALL_ACCELERATION = 50  # px/s² while an arrow key is held
+BALL_DAMPING = 0.6  # Share of velocity left after one second of rolling
+BALL_OBSTACLE_RADIUS = 20
+BALL_OBSTACLE_LIFETIME = 8.0  # Seconds before a bumper disappears
+
+# Zombie Dash horde mode
+HORDE_SIZE = 5000
+HORDE_SPAWN_PER_FRAME = 100
+QUESTION_BUFFER_SIZE = 16  # Ready questions kept per (subject, level)
+PROFILER_REFRESH = 10  # Frames between overlay text refreshes
+DIRTY_RECTS = True  # Push only changed playfield cells; False = full redraw every frame
+
+# Key code -> Direction; filled in by init_pygame(), key codes need pygame loaded
+ARROW_KEYS: Dict[int, Direction] = {}
 
-class Direction(Enum):
-    UP = (0, -1)
-    DOWN = (0, 1)
-    LEFT = (-1, 0)
-    RIGHT = (1, 0)
+def init_pygame():
+    """Start the SDL subsystems the game uses (display and font), nothing else"""
+    if not pygame.display.get_init():
+        pygame.display.init()
+    if not pygame.font.get_init():
+        pygame.font.init()
+    if not ARROW_KEYS:
+        ARROW_KEYS.update({
+            pygame.K_UP: Direction.UP,
+            pygame.K_DOWN: Direction.DOWN,
+            pygame.K_LEFT: Direction.LEFT,
+            pygame.K_RIGHT: Direction.RIGHT,
+        })
 
 class GameState(Enum):
     MENU = 1
@@ -61,22 +143,50 @@ class GameState(Enum):
     GAME_OVER = 8
     PAUSED = 9
 
-@dataclass
-class Question:
-    question: str
-    answer: int
-    options: List[int]
-    difficulty: int
-    subject: str
+# Screens that only change on input, and how often (ms) they still redraw for
+# animation; the pause screen shows the board, whose food keeps pulsing
+IDLE_REDRAW_MS = {
+    GameState.MENU: 1000,
+    GameState.CATEGORY_SELECT: 1000,
+    GameState.EDUCATION_GAME_SELECT: 1000,
+    GameState.PYTHON_GAME_SELECT: 1000,
+    GameState.GAME_OVER: 1000,
+    GameState.PAUSED: 250,
+}
+IDLE_POLL_MS = 50  # Input check interval while idle; menus used to react once per 100 ms frame
+
+def _engine_field(name: str) -> property:
+    """Expose an engine attribute directly on SnakeGame"""
+    return property(lambda self: getattr(self.engine, name),
+                    lambda self, value: setattr(self.engine, name, value))
 
 class SnakeGame:
-    def __init__(self):
+    # Simulation state lives in the headless engine
+    snake = _engine_field("snake")
+    direction = _engine_field("direction")
+    next_direction = _engine_field("next_direction")
+    food_pos = _engine_field("food_pos")
+    current_question = _engine_field("current_question")
+    score = _engine_field("score")
+    level = _engine_field("level")
+    questions_correct = _engine_field("questions_correct")
+    questions_total = _engine_field("questions_total")
+    streak = _engine_field("streak")
+    best_streak = _engine_field("best_streak")
+    last_move_time = _engine_field("last_move_time")
+    move_delay = _engine_field("move_delay")
+
+    def __init__(self, record_path: Optional[str] = None, show_scene_stats: bool = False,
+                 autopilot: Optional[Autopilot] = None, show_profiler: bool = False,
+                 trace_path: Optional[str] = None, board_size: Tuple[int, int] = (GRID_WIDTH, GRID_HEIGHT)):
+        init_pygame()
         self.screen = pygame.display.set_mode((WINDOW_WIDTH, WINDOW_HEIGHT))
         pygame.display.set_caption("🐍 Snake Evolution - EduVerse")
         self.clock = pygame.time.Clock()
         self.font = pygame.font.Font(None, 36)
         self.small_font = pygame.font.Font(None, 24)
         self.large_font = pygame.font.Font(None, 48)
+        self.text_cache = TextCache(maxsize=TEXT_CACHE_SIZE)
         
         # Game state
         self.state = GameState.MENU
@@ -85,31 +195,62 @@ class SnakeGame:
         self.current_education_game = None  # For education games
         self.current_python_game = None  # For python games
         self.current_education_game = None  # For education games
-        
-        # Snake properties
-        self.snake = [(GRID_WIDTH // 2, GRID_HEIGHT // 2)]
-        self.direction = Direction.RIGHT
-        self.next_direction = Direction.RIGHT
-        
-        # Food and questions
-        self.food_pos = None
-        self.current_question = None
+        self.selected_subject = None
+        self.selected_level = 1
+        
+        # Pre-generated questions, refilled in the background
+        self.question_bank = QuestionBank(capacity=QUESTION_BUFFER_SIZE)
+        
+        # Board, snake, food, stats and timing
+        self.engine = SnakeEngine(*board_size, tick_source=pygame.time.get_ticks)
+        self.scheduler = FixedStepScheduler(self.move_delay, tick_source=pygame.time.get_ticks,
+                                            max_steps_per_frame=MAX_STEPS_PER_FRAME,
+                                            late_ms=2000 / RENDER_FPS)
+        self.atlas = SpriteAtlas(GRID_SIZE, self.font)
+        self.renderer = self.make_renderer(self.engine)
         self.question_answered = False
         
-        # Game stats
-        self.score = 0
-        self.level = 1
-        self.questions_correct = 0
-        self.questions_total = 0
-        self.streak = 0
-        self.best_streak = 0
-        
-        # Timing
-        self.last_move_time = 0
-        self.move_delay = 200  # milliseconds
+        # Mini-game entities, allocated once and reused across rounds
+        self.bullets = EntityPool(SHOOTER_MAX_BULLETS)
+        self.enemies = EntityPool(SHOOTER_MAX_ENEMIES)
+        self.obstacles = EntityPool(RACING_MAX_OBSTACLES)
+        self.zombies = EntityPool(MAX_ZOMBIES)
+        self.ball_world = PhysicsWorld(WINDOW_WIDTH, WINDOW_HEIGHT, damping=BALL_DAMPING,
+                                       restitution=0.8, max_obstacles=BALL_MAX_OBSTACLES)
+        self.obstacles_ball = self.ball_world.obstacles
+        
+        self.zombie_sprite = self.make_zombie_sprite()
+        self.road_surface = self.make_road_surface()
+        self.car_sprite = self.make_car_sprite(BLUE)
+        self.rival_sprite = self.make_car_sprite(RED)
+        
+        # Tic-Tac-Toe settings, kept between rounds
+        self.ttt_variant = 0
+        self.ttt_vs_computer = True
+        
+        # Automatic player (soak tests and attract mode)
+        self.autopilot = autopilot
+        
+        # Session recording
+        self.record_path = record_path
+        self.recorder: Optional[ReplayRecorder] = None
+        
+        # Screens and mini-games, looked up by state or game key
+        self.scenes = SceneRegistry()
+        self.show_scene_stats = show_scene_stats
+        self.education_games: List[str] = []
+        self.python_games: List[str] = []
+        self.register_scenes()
+        
+        # Frame profiler: overlay toggled with F3, optional per-frame trace file
+        self.profiler = FrameProfiler(trace_path=trace_path)
+        self.show_profiler = show_profiler
+        self.profiler_panel: Optional[pygame.Surface] = None
+        
+        # Block on input in IDLE_REDRAW_MS screens instead of redrawing every frame
+        self.idle_waits = True
         
         # Initialize game
-        self.generate_food()
         self.load_translations()
         
     def load_translations(self):
@@ -149,7 +290,8 @@ class SnakeGame:
                 "space_shooter": "Space Shooter",
                 "car_racing": "Car Racing",
                 "zombie_dash": "Zombie Dash",
-                "ball_run": "Ball Run"
+                "ball_run": "Ball Run",
+                "snake_arena": "Snake Arena"
             },
             "tamil": {
                 "title": "🐍 பாம்பு பரிணாமம்",
@@ -185,7 +327,8 @@ class SnakeGame:
                 "space_shooter": "ஸ்பேஸ் ஷூட்டர்",
                 "car_racing": "கார் ரேசிங்",
                 "zombie_dash": "ஜாம்பி டாஷ்",
-                "ball_run": "பால் ரன்"
+                "ball_run": "பால் ரன்",
+                "snake_arena": "பாம்பு அரங்கம்"
             }
         }
     
@@ -193,333 +336,195 @@ class SnakeGame:
         """Get translated text"""
         return self.translations[self.language].get(key, key)
     
+    def render_text(self, font, text: str, antialias: bool, color):
+        """Render text through the surface cache"""
+        return self.text_cache.render(font, text, antialias, color)
+    
+    def toggle_language(self):
+        """Switch between English and Tamil"""
+        self.language = "tamil" if self.language == "english" else "english"
+        self.text_cache.set_language(self.language)
+    
     def generate_question(self) -> Question:
         """Generate educational questions based on selected subject and level"""
-        if self.selected_subject == "math":
-            return self.generate_math_question(self.selected_level)
-        elif self.selected_subject == "science":
-            return self.generate_science_question(self.selected_level)
-        elif self.selected_subject == "geography":
-            return self.generate_geography_question(self.selected_level)
-        elif self.selected_subject == "history":
-            return self.generate_history_question(self.selected_level)
-        elif self.selected_subject == "language":
-            return self.generate_language_question(self.selected_level)
-        else:
-            # Default to math if no subject selected
-            return self.generate_math_question(self.selected_level)
+        # Default to math if no subject selected
+        subject = self.selected_subject if self.selected_subject in questions.GENERATORS else "math"
+        return self.question_bank.get(subject, self.selected_level)
     
     def generate_education_question(self, difficulty: int) -> Question:
         """Generate educational questions (Math, Science, Geography, History, Language)"""
-        subjects = ["math", "science", "geography", "history", "language"]
-        subject = random.choice(subjects)
-        
-        if subject == "math":
-            return self.generate_math_question(difficulty)
-        elif subject == "science":
-            return self.generate_science_question(difficulty)
-        elif subject == "geography":
-            return self.generate_geography_question(difficulty)
-        elif subject == "history":
-            return self.generate_history_question(difficulty)
-        else:  # language
-            return self.generate_language_question(difficulty)
+        return self.question_bank.get(random.choice(questions.EDUCATION_SUBJECTS), difficulty)
     
     def generate_python_question(self, difficulty: int) -> Question:
         """Generate Python programming questions"""
-        if difficulty <= 3:
-            # Basic Python concepts
-            questions = [
-                ("What does 'print()' do in Python?", "Displays output", 
-                 ["Displays output", "Creates variables", "Imports modules", "Defines functions"]),
-                ("Which symbol starts a comment in Python?", "#", 
-                 ["#", "//", "/*", "--"]),
-                ("What is the correct way to create a list?", "[]", 
-                 ["[]", "{}", "()", "<>"]),
-            ]
-        elif difficulty <= 6:
-            # Intermediate concepts
-            questions = [
-                ("What does 'len()' function return?", "Length of object", 
-                 ["Length of object", "Type of object", "Value of object", "Name of object"]),
-                ("Which loop is used for iteration in Python?", "for", 
-                 ["for", "while", "do", "repeat"]),
-                ("What is the result of 5 // 2 in Python?", "2", 
-                 ["2", "2.5", "3", "1"]),
-            ]
-        else:
-            # Advanced concepts
-            questions = [
-                ("What is a lambda function?", "Anonymous function", 
-                 ["Anonymous function", "Class method", "Module import", "Error handler"]),
-                ("Which method adds an item to a list?", "append()", 
-                 ["append()", "add()", "insert()", "push()"]),
-                ("What does 'self' refer to in a class?", "Current instance", 
-                 ["Current instance", "Parent class", "Global variable", "Function name"]),
-            ]
-        
-        question_data = random.choice(questions)
-        question_text, correct_answer, options = question_data
-        
-        return Question(
-            question=question_text,
-            answer=correct_answer,
-            options=options,
-            difficulty=difficulty,
-            subject="python"
-        )
+        return self.question_bank.get("python", difficulty)
     
     def generate_math_question(self, difficulty: int) -> Question:
         """Generate math questions"""
-        if difficulty <= 3:
-            # Basic arithmetic
-            a = random.randint(1, 20)
-            b = random.randint(1, 20)
-            operation = random.choice(['+', '-'])
-            
-            if operation == '+':
-                question = f"{a} + {b} = ?"
-                answer = a + b
-            else:
-                if a < b:
-                    a, b = b, a  # Ensure positive result
-                question = f"{a} - {b} = ?"
-                answer = a - b
-                
-        elif difficulty <= 6:
-            # Multiplication and division
-            a = random.randint(2, 12)
-            b = random.randint(2, 12)
-            operation = random.choice(['×', '÷'])
-            
-            if operation == '×':
-                question = f"{a} × {b} = ?"
-                answer = a * b
-            else:
-                answer = a
-                question = f"{a * b} ÷ {b} = ?"
-                
-        else:
-            # Advanced math
-            operations = [
-                lambda: (f"{random.randint(1, 20)}² = ?", random.randint(1, 20)**2),
-                lambda: (f"√{random.choice([4, 9, 16, 25, 36, 49, 64, 81, 100])} = ?", 
-                        int(random.choice([4, 9, 16, 25, 36, 49, 64, 81, 100])**0.5))
-            ]
-            question, answer = random.choice(operations)()
-        
-        # Generate wrong options
-        options = [answer]
-        while len(options) < 4:
-            wrong = answer + random.randint(-10, 10)
-            if wrong != answer and wrong not in options and wrong >= 0:
-                options.append(wrong)
-        
-        random.shuffle(options)
-        
-        return Question(
-            question=question,
-            answer=answer,
-            options=options,
-            difficulty=difficulty,
-            subject="math"
-        )
+        return self.question_bank.get("math", difficulty)
     
     def generate_science_question(self, difficulty: int) -> Question:
         """Generate science questions"""
-        questions = [
-            ("What is H2O?", "Water", ["Water", "Hydrogen", "Oxygen", "Salt"]),
-            ("How many planets are in our solar system?", "8", ["8", "9", "7", "10"]),
-            ("What gas do plants absorb from the atmosphere?", "Carbon dioxide", 
-             ["Carbon dioxide", "Oxygen", "Nitrogen", "Hydrogen"]),
-        ]
-        
-        question_data = random.choice(questions)
-        question_text, correct_answer, options = question_data
-        
-        return Question(
-            question=question_text,
-            answer=correct_answer,
-            options=options,
-            difficulty=difficulty,
-            subject="science"
-        )
+        return self.question_bank.get("science", difficulty)
     
     def generate_geography_question(self, difficulty: int) -> Question:
         """Generate geography questions"""
-        questions = [
-            ("What is the capital of France?", "Paris", ["Paris", "London", "Berlin", "Madrid"]),
-            ("Which is the largest continent?", "Asia", ["Asia", "Africa", "Europe", "America"]),
-            ("What is the longest river in the world?", "Nile", ["Nile", "Amazon", "Ganges", "Mississippi"]),
-        ]
-        
-        question_data = random.choice(questions)
-        question_text, correct_answer, options = question_data
-        
-        return Question(
-            question=question_text,
-            answer=correct_answer,
-            options=options,
-            difficulty=difficulty,
-            subject="geography"
-        )
+        return self.question_bank.get("geography", difficulty)
     
     def generate_history_question(self, difficulty: int) -> Question:
         """Generate history questions"""
-        questions = [
-            ("Who was the first President of the United States?", "George Washington", 
-             ["George Washington", "Thomas Jefferson", "Abraham Lincoln", "John Adams"]),
-            ("In which year did World War II end?", "1945", ["1945", "1944", "1946", "1943"]),
-            ("Which ancient wonder was located in Egypt?", "Great Pyramid", 
-             ["Great Pyramid", "Hanging Gardens", "Colossus", "Lighthouse"]),
-        ]
-        
-        question_data = random.choice(questions)
-        question_text, correct_answer, options = question_data
-        
-        return Question(
-            question=question_text,
-            answer=correct_answer,
-            options=options,
-            difficulty=difficulty,
-            subject="history"
-        )
+        return self.question_bank.get("history", difficulty)
     
     def generate_language_question(self, difficulty: int) -> Question:
         """Generate language questions"""
-        questions = [
-            ("What is the opposite of 'hot'?", "Cold", ["Cold", "Warm", "Cool", "Mild"]),
-            ("Which word is a noun?", "Book", ["Book", "Run", "Quick", "Slowly"]),
-            ("What is the plural of 'child'?", "Children", ["Children", "Childs", "Childes", "Child"]),
-        ]
-        
-        question_data = random.choice(questions)
-        question_text, correct_answer, options = question_data
-        
-        return Question(
-            question=question_text,
-            answer=correct_answer,
-            options=options,
-            difficulty=difficulty,
-            subject="language"
-        )
+        return self.question_bank.get("language", difficulty)
     
     def generate_food(self):
         """Generate food at random position"""
-        while True:
-            x = random.randint(0, GRID_WIDTH - 1)
-            y = random.randint(0, GRID_HEIGHT - 1)
-            if (x, y) not in self.snake:
-                self.food_pos = (x, y)
-                break
-    
-    def handle_input(self):
-        """Handle keyboard input"""
-        for event in pygame.event.get():
+        self.engine.generate_food()
+    
+    def register_scenes(self):
+        """Register the core screens and the bundled mini-games"""
+        self.scenes.register(GameState.MENU, CallbackScene(self.handle_menu_input, draw=self.draw_menu))
+        self.scenes.register(GameState.PLAYING, CallbackScene(self.handle_playing_input,
+                                                              self.update_snake, self.present_playfield))
+        self.scenes.register(GameState.CATEGORY_SELECT, CallbackScene(self.handle_category_input,
+                                                                      draw=self.draw_category_select))
+        self.scenes.register(GameState.EDUCATION_GAME_SELECT, CallbackScene(
+            self.handle_education_select_input, draw=self.draw_education_game_select))
+        self.scenes.register(GameState.PYTHON_GAME_SELECT, CallbackScene(
+            self.handle_python_select_input, draw=self.draw_python_game_select))
+        self.scenes.register(GameState.PAUSED, CallbackScene(self.handle_paused_input, draw=self.draw_paused))
+        self.scenes.register(GameState.GAME_OVER, CallbackScene(self.handle_game_over_input,
+                                                                draw=self.draw_game_over))
+        
+        self.register_education_game("math_wizard", CallbackScene(
+            self.handle_math_input, draw=self.draw_math_wizard, enter=self.init_math_wizard))
+        self.register_education_game("science_lab", CallbackScene(
+            self.handle_science_input, draw=self.draw_science_lab, enter=self.init_science_lab))
+        self.register_education_game("geography_quest", CallbackScene(
+            self.handle_geography_input, draw=self.draw_geography_quest, enter=self.init_geography_quest))
+        self.register_education_game("history_hunter", CallbackScene(
+            self.handle_history_input, draw=self.draw_history_hunter, enter=self.init_history_hunter))
+        self.register_education_game("word_master", CallbackScene(
+            self.handle_word_input, draw=self.draw_word_master, enter=self.init_word_master))
+        
+        self.register_python_game("tic_tac_toe", CallbackScene(
+            self.handle_ttt_input, draw=self.draw_tic_tac_toe, enter=self.init_tic_tac_toe))
+        self.register_python_game("space_shooter", CallbackScene(
+            self.handle_shooter_input, self.update_space_shooter, self.draw_space_shooter,
+            self.init_space_shooter))
+        self.register_python_game("car_racing", CallbackScene(
+            self.handle_racing_input, self.update_car_racing, self.draw_car_racing, self.init_car_racing))
+        self.register_python_game("zombie_dash", CallbackScene(
+            self.handle_zombie_dash_input, self.update_zombie_dash, self.draw_zombie_dash,
+            self.init_zombie_dash))
+        self.register_python_game("ball_run", CallbackScene(
+            self.handle_ball_run_input, self.update_ball_run, self.draw_ball_run, self.init_ball_run))
+        self.register_python_game("snake_arena", CallbackScene(
+            self.handle_arena_input, self.update_snake_arena, self.draw_snake_arena, self.init_snake_arena))
+    
+    def register_education_game(self, key: str, scene: Scene):
+        """Add an education mini-game; it is picked with the next number key"""
+        self.scenes.register(key, scene)
+        self.education_games.append(key)
+    
+    def register_python_game(self, key: str, scene: Scene):
+        """Add a Python mini-game; it is picked with the next number key"""
+        self.scenes.register(key, scene)
+        self.python_games.append(key)
+    
+    def active_scene(self):
+        """Registry key of the scene that owns the screen"""
+        if self.state == GameState.PYTHON_GAME_PLAYING:
+            return self.current_python_game
+        if self.state == GameState.EDUCATION_GAME_PLAYING:
+            return self.current_education_game
+        return self.state
+    
+    def handle_input(self, pending: Sequence = ()):
+        """Handle keyboard input: events already taken off the queue, then the rest"""
+        for event in itertools.chain(pending, pygame.event.get()):
             if event.type == pygame.QUIT:
                 return False
                 
             if event.type == pygame.KEYDOWN:
-                if self.state == GameState.MENU:
-                    if event.key == pygame.K_SPACE:
-                        self.start_game()
-                    elif event.key == pygame.K_l:
-                        # Toggle language
-                        self.language = "tamil" if self.language == "english" else "english"
-                        
-                elif self.state == GameState.PLAYING:
-                    if event.key == pygame.K_UP and self.direction != Direction.DOWN:
-                        self.next_direction = Direction.UP
-                    elif event.key == pygame.K_DOWN and self.direction != Direction.UP:
-                        self.next_direction = Direction.DOWN
-                    elif event.key == pygame.K_LEFT and self.direction != Direction.RIGHT:
-                        self.next_direction = Direction.LEFT
-                    elif event.key == pygame.K_RIGHT and self.direction != Direction.LEFT:
-                        self.next_direction = Direction.RIGHT
-                    elif event.key == pygame.K_p:
-                        self.state = GameState.PAUSED
-                        
-                elif self.state == GameState.CATEGORY_SELECT:
-                    if event.key == pygame.K_1:
-                        self.selected_category = "education"
-                        self.state = GameState.EDUCATION_GAME_SELECT
-                    elif event.key == pygame.K_2:
-                        self.selected_category = "python"
-                        self.state = GameState.PYTHON_GAME_SELECT
-                        
-                elif self.state == GameState.EDUCATION_GAME_SELECT:
-                    if event.key == pygame.K_1:
-                        self.current_education_game = "math_wizard"
-                        self.start_education_game()
-                    elif event.key == pygame.K_2:
-                        self.current_education_game = "science_lab"
-                        self.start_education_game()
-                    elif event.key == pygame.K_3:
-                        self.current_education_game = "geography_quest"
-                        self.start_education_game()
-                    elif event.key == pygame.K_4:
-                        self.current_education_game = "history_hunter"
-                        self.start_education_game()
-                    elif event.key == pygame.K_5:
-                        self.current_education_game = "word_master"
-                        self.start_education_game()
-                    elif event.key == pygame.K_b:
-                        self.state = GameState.CATEGORY_SELECT
-                        
-                elif self.state == GameState.PYTHON_GAME_SELECT:
-                    if event.key == pygame.K_1:
-                        self.current_python_game = "tic_tac_toe"
-                        self.start_python_game()
-                    elif event.key == pygame.K_2:
-                        self.current_python_game = "space_shooter"
-                        self.start_python_game()
-                    elif event.key == pygame.K_3:
-                        self.current_python_game = "car_racing"
-                        self.start_python_game()
-                    elif event.key == pygame.K_4:
-                        self.current_python_game = "zombie_dash"
-                        self.start_python_game()
-                    elif event.key == pygame.K_5:
-                        self.current_python_game = "ball_run"
-                        self.start_python_game()
-                    elif event.key == pygame.K_b:
-                        self.state = GameState.CATEGORY_SELECT
-                        
+                if event.key == pygame.K_F3:
+                    self.toggle_profiler()
                 elif self.state == GameState.EDUCATION_GAME_PLAYING:
-                    # Handle education game controls
                     self.handle_education_game_input(event)
-                        
                 elif self.state == GameState.PYTHON_GAME_PLAYING:
-                    # Handle python game controls
                     self.handle_python_game_input(event)
-                        
-                elif self.state == GameState.PAUSED:
-                    if event.key == pygame.K_p:
-                        self.state = GameState.PLAYING
-                        
-                elif self.state == GameState.GAME_OVER:
-                    if event.key == pygame.K_r:
-                        self.restart_game()
-                    elif event.key == pygame.K_q:
-                        return False
+                elif not self.scenes.handle_event(self.state, event):
+                    return False
                         
         return True
     
+    def handle_menu_input(self, event):
+        """Handle main menu input"""
+        if event.key == pygame.K_SPACE:
+            self.start_game()
+        elif event.key == pygame.K_l:
+            self.toggle_language()
+    
+    def handle_playing_input(self, event):
+        """Handle snake controls"""
+        if event.key in ARROW_KEYS:
+            self.buffer_turn(ARROW_KEYS[event.key])
+        elif event.key == pygame.K_p:
+            self.state = GameState.PAUSED
+    
+    def handle_category_input(self, event):
+        """Handle category selection input"""
+        if event.key == pygame.K_1:
+            self.selected_category = "education"
+            self.state = GameState.EDUCATION_GAME_SELECT
+        elif event.key == pygame.K_2:
+            self.selected_category = "python"
+            self.state = GameState.PYTHON_GAME_SELECT
+    
+    def handle_education_select_input(self, event):
+        """Handle education game selection input"""
+        index = event.key - pygame.K_1
+        if 0 <= index < len(self.education_games):
+            self.current_education_game = self.education_games[index]
+            self.start_education_game()
+        elif event.key == pygame.K_b:
+            self.state = GameState.CATEGORY_SELECT
+    
+    def handle_python_select_input(self, event):
+        """Handle Python game selection input"""
+        index = event.key - pygame.K_1
+        if 0 <= index < len(self.python_games):
+            self.current_python_game = self.python_games[index]
+            self.start_python_game()
+        elif event.key == pygame.K_b:
+            self.state = GameState.CATEGORY_SELECT
+    
+    def handle_paused_input(self, event):
+        """Handle input while paused"""
+        if event.key == pygame.K_p:
+            self.state = GameState.PLAYING
+    
+    def handle_game_over_input(self, event):
+        """Handle game over input; Q quits"""
+        if event.key == pygame.K_r:
+            self.restart_game()
+        elif event.key == pygame.K_q:
+            return False
+    
     def start_game(self):
         """Start a new game"""
         self.state = GameState.PLAYING
-        self.snake = [(GRID_WIDTH // 2, GRID_HEIGHT // 2)]
-        self.direction = Direction.RIGHT
-        self.next_direction = Direction.RIGHT
-        self.score = 0
-        self.level = 1
-        self.questions_correct = 0
-        self.questions_total = 0
-        self.streak = 0
+        if self.record_path and self.recorder is None:
+            # Reseeds the engine so the session can be replayed exactly
+            self.recorder = ReplayRecorder()
+            self.recorder.start(self.engine)
+        else:
+            self.engine.reset()
         self.selected_category = None
         self.current_education_game = None
         self.current_python_game = None
-        self.generate_food()
     
     def restart_game(self):
         """Restart the game"""
@@ -527,207 +532,226 @@ class SnakeGame:
     
     def answer_question(self, option_index: int):
         """Handle question answer"""
-        if not self.current_question or option_index >= len(self.current_question.options):
-            return
-            
-        selected_answer = self.current_question.options[option_index]
-        self.questions_total += 1
-        
-        # For string answers, compare directly; for numeric answers, convert
-        correct_answer = self.current_question.answer
-        if isinstance(correct_answer, str):
-            is_correct = selected_answer == correct_answer
-        else:
-            is_correct = selected_answer == correct_answer
+        events = self.engine.answer_question(option_index)
         
-        if is_correct:
-            # Correct answer
-            self.questions_correct += 1
-            self.streak += 1
-            self.best_streak = max(self.best_streak, self.streak)
-            
-            # Bonus points for streak
-            bonus = min(self.streak * 2, 20)
-            self.score += 10 + bonus
-            
-            # Grow snake
-            self.grow_snake()
-            self.generate_food()
+        if Event.BOARD_FULL in events:
+            self.game_over()
+        elif Event.CORRECT in events:
             self.question_answered = True
             self.state = GameState.PLAYING
-            
-            # Level up every 5 correct answers
-            if self.questions_correct % 5 == 0:
-                self.level += 1
-                self.move_delay = max(100, self.move_delay - 10)  # Increase speed
-                
-        else:
-            # Wrong answer
-            self.streak = 0
-            # Allow retry - stay in question state
-            
-        self.current_question = None
+    
+    def steer(self, direction: Direction):
+        """Turn the snake before the next move (autopilot)"""
+        self.engine.turn(direction)
+    
+    def buffer_turn(self, direction: Direction):
+        """Queue a keyboard turn; quick presses apply on successive moves instead of overwriting each other"""
+        self.engine.queue_turn(direction, self.profiler.clock())
     
     def grow_snake(self):
         """Add segment to snake"""
-        tail = self.snake[-1]
-        self.snake.append(tail)
+        self.engine.grow_snake()
     
     def update_snake(self):
-        """Update snake position"""
-        current_time = pygame.time.get_ticks()
-        if current_time - self.last_move_time < self.move_delay:
-            return
-            
-        self.last_move_time = current_time
-        self.direction = self.next_direction
-        
-        # Calculate new head position
-        head_x, head_y = self.snake[0]
-        dx, dy = self.direction.value
-        new_head = (head_x + dx, head_y + dy)
+        """Advance the snake by however many fixed move_delay steps are due"""
+        self.scheduler.step_ms = self.move_delay
+        for _ in range(self.scheduler.advance()):
+            if self.autopilot is not None:
+                self.steer(self.autopilot.decide(self.engine))
+            self.step_snake()
+            if self.state != GameState.PLAYING:
+                break
+    
+    def step_snake(self):
+        """Move the snake one cell"""
+        events = self.engine.step()
+        if self.engine.turned_at is not None:
+            # Keypress to move, for the profiler's input line
+            self.profiler.input_latency((self.profiler.clock() - self.engine.turned_at) * 1000)
         
-        # Check wall collision
-        if (new_head[0] < 0 or new_head[0] >= GRID_WIDTH or
-            new_head[1] < 0 or new_head[1] >= GRID_HEIGHT):
-            self.game_over()
-            return
-            
-        # Check self collision
-        if new_head in self.snake:
+        if Event.DIED in events or Event.BOARD_FULL in events:
             self.game_over()
-            return
-            
-        # Move snake
-        self.snake.insert(0, new_head)
-        
-        # Check food collision
-        if new_head == self.food_pos:
+        elif Event.ATE_FOOD in events:
+            if self.autopilot is not None:
+                self.autopilot_answer()
+                return
             # Show category selection instead of immediately generating question
             self.state = GameState.CATEGORY_SELECT
-        else:
-            # Remove tail if no food eaten
-            self.snake.pop()
+            # Turns meant for before the question would fire after it
+            self.engine.turn_queue.clear()
+    
+    def autopilot_answer(self):
+        """Let the autopilot answer a question and keep playing"""
+        self.engine.ask(self.generate_education_question(self.level))
+        self.answer_question(self.autopilot.choose_answer(self.current_question))
+        if self.state != GameState.GAME_OVER:
+            self.state = GameState.PLAYING
     
     def game_over(self):
         """Handle game over"""
         self.state = GameState.GAME_OVER
+        self.save_recording()
+        if self.autopilot is not None:
+            # Attract mode: start the next round straight away
+            self.start_game()
+    
+    def make_renderer(self, engine: SnakeEngine) -> PlayfieldRenderer:
+        """Dirty-rect renderer if the board fits the window, camera and chunks if not"""
+        if engine.width * GRID_SIZE <= WINDOW_WIDTH and engine.height * GRID_SIZE <= WINDOW_HEIGHT:
+            return PlayfieldRenderer(self.screen, engine, GRID_SIZE, self.font, self.draw_ui,
+                                     self.hud_values, dirty_rects=DIRTY_RECTS, atlas=self.atlas)
+        return ChunkedRenderer(self.screen, engine, GRID_SIZE, self.font, self.draw_ui, self.hud_values,
+                               atlas=self.atlas)
+    
+    def save_recording(self):
+        """Write the session replay so far, if recording"""
+        if self.recorder:
+            self.recorder.save(self.record_path)
+    
+    def play_replay(self, path: str, speed: float = 1.0):
+        """Watch a recorded session at the given speed multiplier"""
+        player = ReplayPlayer.load(path)
+        self.engine = player.start()
+        self.renderer = self.make_renderer(self.engine)
+        self.state = GameState.PLAYING
+        self.scheduler.resync()
+        
+        running = True
+        while running:
+            for event in pygame.event.get():
+                if event.type == pygame.QUIT:
+                    running = False
+                elif event.type == pygame.KEYDOWN and event.key in (pygame.K_ESCAPE, pygame.K_q):
+                    running = False
+            
+            self.scheduler.step_ms = self.move_delay / speed
+            for _ in range(self.scheduler.advance()):
+                if player.step() is None:
+                    running = False
+                    break
+            
+            self.renderer.present(self.scheduler.alpha)
+            self.clock.tick(RENDER_FPS)
     
     def draw_menu(self):
         """Draw main menu"""
         self.screen.fill(BLACK)
         
         # Title
-        title = self.large_font.render(self.get_text("title"), True, GREEN)
+        title = self.render_text(self.large_font, self.get_text("title"), True, GREEN)
         title_rect = title.get_rect(center=(WINDOW_WIDTH // 2, 150))
         self.screen.blit(title, title_rect)
         
         # Subtitle
-        subtitle = self.font.render(self.get_text("subtitle"), True, WHITE)
+        subtitle = self.render_text(self.font, self.get_text("subtitle"), True, WHITE)
         subtitle_rect = subtitle.get_rect(center=(WINDOW_WIDTH // 2, 200))
         self.screen.blit(subtitle, subtitle_rect)
         
         # Instructions
-        start_text = self.font.render(self.get_text("start"), True, YELLOW)
+        start_text = self.render_text(self.font, self.get_text("start"), True, YELLOW)
         start_rect = start_text.get_rect(center=(WINDOW_WIDTH // 2, 300))
         self.screen.blit(start_text, start_rect)
         
         # Language toggle
-        lang_text = self.small_font.render("Press L to toggle language", True, CYAN)
+        lang_text = self.render_text(self.small_font, "Press L to toggle language", True, CYAN)
         lang_rect = lang_text.get_rect(center=(WINDOW_WIDTH // 2, 350))
         self.screen.blit(lang_text, lang_rect)
         
         # Current language
-        current_lang = self.small_font.render(f"Language: {self.language.title()}", True, WHITE)
+        current_lang = self.render_text(self.small_font, f"Language: {self.language.title()}", True, WHITE)
         current_lang_rect = current_lang.get_rect(center=(WINDOW_WIDTH // 2, 380))
         self.screen.blit(current_lang, current_lang_rect)
     
     def draw_game(self):
         """Draw game screen"""
-        self.screen.fill(BLACK)
-        
-        # Draw snake
-        for i, segment in enumerate(self.snake):
-            x, y = segment
-            color = GREEN if i == 0 else (0, 200, 0)  # Head is brighter
-            pygame.draw.rect(self.screen, color, 
-                           (x * GRID_SIZE, y * GRID_SIZE, GRID_SIZE, GRID_SIZE))
-            
-            # Draw eyes on head
-            if i == 0:
-                eye_size = 3
-                pygame.draw.circle(self.screen, WHITE, 
-                                 (x * GRID_SIZE + 5, y * GRID_SIZE + 5), eye_size)
-                pygame.draw.circle(self.screen, WHITE, 
-                                 (x * GRID_SIZE + 15, y * GRID_SIZE + 5), eye_size)
-        
-        # Draw food
-        if self.food_pos:
-            x, y = self.food_pos
-            # Draw a more prominent question mark food
-            pygame.draw.circle(self.screen, RED, 
-                             (x * GRID_SIZE + GRID_SIZE // 2, 
-                              y * GRID_SIZE + GRID_SIZE // 2), 
-                             GRID_SIZE // 2)
-            
-            # Draw question mark on food
-            q_text = self.font.render("?", True, WHITE)
-            q_rect = q_text.get_rect(center=(x * GRID_SIZE + GRID_SIZE // 2,
-                                           y * GRID_SIZE + GRID_SIZE // 2))
-            self.screen.blit(q_text, q_rect)
-            
-            # Add pulsing effect
-            pulse = abs(pygame.time.get_ticks() % 1000 - 500) / 500.0
-            glow_color = (255, int(255 * pulse), int(255 * pulse))
-            pygame.draw.circle(self.screen, glow_color, 
-                             (x * GRID_SIZE + GRID_SIZE // 2, 
-                              y * GRID_SIZE + GRID_SIZE // 2), 
-                             GRID_SIZE // 2 + 2, 2)
-        
-        # Draw UI
-        self.draw_ui()
+        self.renderer.draw_full()
+    
+    def draw_scene(self, scene):
+        """Draw a screen or mini-game into self.screen without presenting it"""
+        if scene == GameState.PLAYING:
+            self.draw_game()
+        else:
+            self.scenes.draw(scene)
+    
+    @contextmanager
+    def drawing_to(self, surface: pygame.Surface):
+        """Send every draw_* call to another surface, e.g. an off-screen one, for the duration"""
+        screen, self.screen = self.screen, surface
+        self.renderer.screen = surface
+        self.renderer.invalidate()
+        try:
+            yield surface
+        finally:
+            self.screen = self.renderer.screen = screen
+            self.renderer.invalidate()
+    
+    def present_playfield(self):
+        """Push the playfield, interpolated between moves"""
+        self.renderer.present(self.scheduler.alpha)
+    
+    def toggle_profiler(self):
+        """Show or hide the frame profiler overlay"""
+        self.show_profiler = not self.show_profiler
+        self.profiler_panel = None
+        # The panel covered part of the board
+        self.renderer.invalidate()
+    
+    def draw_profiler_overlay(self, scene) -> Optional[pygame.Rect]:
+        """Draw the profiler panel in the top-right corner; returns its rect"""
+        if not self.show_profiler:
+            return None
+        if self.profiler_panel is None or self.profiler.frames % PROFILER_REFRESH == 0:
+            # Rendered straight from the font: the numbers change too often for the text cache
+            lines = [self.small_font.render(line, True, GREEN) for line in self.profiler.lines(scene)]
+            width = max(line.get_width() for line in lines) + 12
+            panel = pygame.Surface((width, len(lines) * 18 + 10))
+            panel.fill(BLACK)
+            for i, line in enumerate(lines):
+                panel.blit(line, (6, 5 + i * 18))
+            self.profiler_panel = panel
+        return self.screen.blit(self.profiler_panel, (WINDOW_WIDTH - self.profiler_panel.get_width() - 5, 5))
     
     def draw_category_select(self):
         """Draw category selection screen"""
         self.screen.fill(BLACK)
         
         # Title
-        title = self.large_font.render(self.get_text("category_select"), True, YELLOW)
+        title = self.render_text(self.large_font, self.get_text("category_select"), True, YELLOW)
         title_rect = title.get_rect(center=(WINDOW_WIDTH // 2, 100))
         self.screen.blit(title, title_rect)
         
         # Education Games Option
-        edu_title = self.font.render("1. " + self.get_text("education_games"), True, CYAN)
+        edu_title = self.render_text(self.font, "1. " + self.get_text("education_games"), True, CYAN)
         edu_rect = edu_title.get_rect(center=(WINDOW_WIDTH // 2, 200))
         self.screen.blit(edu_title, edu_rect)
         
-        edu_desc = self.small_font.render(self.get_text("education_desc"), True, WHITE)
+        edu_desc = self.render_text(self.small_font, self.get_text("education_desc"), True, WHITE)
         edu_desc_rect = edu_desc.get_rect(center=(WINDOW_WIDTH // 2, 230))
         self.screen.blit(edu_desc, edu_desc_rect)
         
         # Education games list
         edu_games = ["🧮 Math Wizard", "🧪 Science Lab", "🌍 Geography Quest", "📚 History Hunter", "🔤 Word Master"]
         for i, game in enumerate(edu_games):
-            game_text = self.small_font.render(f"  • {game}", True, (150, 255, 150))
+            game_text = self.render_text(self.small_font, f"  • {game}", True, (150, 255, 150))
             self.screen.blit(game_text, (200, 260 + i * 25))
         
         # Python Games Option
-        python_title = self.font.render("2. " + self.get_text("python_games"), True, ORANGE)
+        python_title = self.render_text(self.font, "2. " + self.get_text("python_games"), True, ORANGE)
         python_rect = python_title.get_rect(center=(WINDOW_WIDTH // 2, 400))
         self.screen.blit(python_title, python_rect)
         
-        python_desc = self.small_font.render(self.get_text("python_desc"), True, WHITE)
+        python_desc = self.render_text(self.small_font, self.get_text("python_desc"), True, WHITE)
         python_desc_rect = python_desc.get_rect(center=(WINDOW_WIDTH // 2, 430))
         self.screen.blit(python_desc, python_desc_rect)
         
         # Python games list
         python_games = ["⭕ Tic-Tac-Toe", "🚀 Space Shooter", "🏎️ Car Racing", "🎮 2D Platformer", "🎯 3D Adventure"]
         for i, game in enumerate(python_games):
-            game_text = self.small_font.render(f"  • {game}", True, (255, 200, 100))
+            game_text = self.render_text(self.small_font, f"  • {game}", True, (255, 200, 100))
             self.screen.blit(game_text, (200, 460 + i * 25))
         
         # Instructions
-        instruction = self.font.render(self.get_text("select_instruction"), True, YELLOW)
+        instruction = self.render_text(self.font, self.get_text("select_instruction"), True, YELLOW)
         instruction_rect = instruction.get_rect(center=(WINDOW_WIDTH // 2, 570))
         self.screen.blit(instruction, instruction_rect)
     
@@ -736,7 +760,7 @@ class SnakeGame:
         self.screen.fill(BLACK)
         
         # Title
-        title = self.large_font.render(self.get_text("education_game_select"), True, YELLOW)
+        title = self.render_text(self.large_font, self.get_text("education_game_select"), True, YELLOW)
         title_rect = title.get_rect(center=(WINDOW_WIDTH // 2, 80))
         self.screen.blit(title, title_rect)
         
@@ -754,13 +778,13 @@ class SnakeGame:
         for i, (key, game_key, icon) in enumerate(games):
             color = colors[i]
             game_text = f"{key}. {icon} {self.get_text(game_key)}"
-            text = self.font.render(game_text, True, color)
+            text = self.render_text(self.font, game_text, True, color)
             y_pos = 150 + i * 60
             text_rect = text.get_rect(center=(WINDOW_WIDTH // 2, y_pos))
             self.screen.blit(text, text_rect)
         
         # Back instruction
-        back_text = self.small_font.render(self.get_text("back"), True, WHITE)
+        back_text = self.render_text(self.small_font, self.get_text("back"), True, WHITE)
         back_rect = back_text.get_rect(center=(WINDOW_WIDTH // 2, 550))
         self.screen.blit(back_text, back_rect)
     
@@ -769,7 +793,7 @@ class SnakeGame:
         self.screen.fill(BLACK)
         
         # Title
-        title = self.large_font.render(self.get_text("python_game_select"), True, YELLOW)
+        title = self.render_text(self.large_font, self.get_text("python_game_select"), True, YELLOW)
         title_rect = title.get_rect(center=(WINDOW_WIDTH // 2, 80))
         self.screen.blit(title, title_rect)
         
@@ -779,21 +803,22 @@ class SnakeGame:
             ("2", "space_shooter", "🚀"),
             ("3", "car_racing", "🏎️"),
             ("4", "zombie_dash", "🧟"),
-            ("5", "ball_run", "⚽")
+            ("5", "ball_run", "⚽"),
+            ("6", "snake_arena", "🐍")
         ]
         
-        colors = [CYAN, RED, GREEN, ORANGE, PURPLE]
+        colors = [CYAN, RED, GREEN, ORANGE, PURPLE, YELLOW]
         
         for i, (key, game_key, icon) in enumerate(games):
             color = colors[i]
             game_text = f"{key}. {icon} {self.get_text(game_key)}"
-            text = self.font.render(game_text, True, color)
+            text = self.render_text(self.font, game_text, True, color)
             y_pos = 150 + i * 60
             text_rect = text.get_rect(center=(WINDOW_WIDTH // 2, y_pos))
             self.screen.blit(text, text_rect)
         
         # Back instruction
-        back_text = self.small_font.render(self.get_text("back"), True, WHITE)
+        back_text = self.render_text(self.small_font, self.get_text("back"), True, WHITE)
         back_rect = back_text.get_rect(center=(WINDOW_WIDTH // 2, 550))
         self.screen.blit(back_text, back_rect)
     
@@ -805,19 +830,19 @@ class SnakeGame:
             return
             
         # Question title
-        q_title = self.font.render(self.get_text("question"), True, YELLOW)
+        q_title = self.render_text(self.font, self.get_text("question"), True, YELLOW)
         q_title_rect = q_title.get_rect(center=(WINDOW_WIDTH // 2, 100))
         self.screen.blit(q_title, q_title_rect)
         
         # Category indicator
         category_text = f"Category: {self.selected_category.title()}" if self.selected_category else ""
         if category_text:
-            cat_text = self.small_font.render(category_text, True, CYAN)
+            cat_text = self.render_text(self.small_font, category_text, True, CYAN)
             cat_rect = cat_text.get_rect(center=(WINDOW_WIDTH // 2, 130))
             self.screen.blit(cat_text, cat_rect)
         
         # Question text
-        question_text = self.large_font.render(self.current_question.question, True, WHITE)
+        question_text = self.render_text(self.large_font, self.current_question.question, True, WHITE)
         question_rect = question_text.get_rect(center=(WINDOW_WIDTH // 2, 200))
         self.screen.blit(question_text, question_rect)
         
@@ -825,13 +850,13 @@ class SnakeGame:
         colors = [CYAN, YELLOW, ORANGE, PURPLE]
         for i, option in enumerate(self.current_question.options):
             color = colors[i % len(colors)]
-            option_text = self.font.render(f"{i+1}. {option}", True, color)
+            option_text = self.render_text(self.font, f"{i+1}. {option}", True, color)
             y_pos = 300 + i * 50
             option_rect = option_text.get_rect(center=(WINDOW_WIDTH // 2, y_pos))
             self.screen.blit(option_text, option_rect)
         
         # Instructions
-        instruction = self.small_font.render("Press 1-4 to select answer", True, WHITE)
+        instruction = self.render_text(self.small_font, "Press 1-4 to select answer", True, WHITE)
         instruction_rect = instruction.get_rect(center=(WINDOW_WIDTH // 2, 550))
         self.screen.blit(instruction, instruction_rect)
         """Draw question screen"""
@@ -841,12 +866,12 @@ class SnakeGame:
             return
             
         # Question title
-        q_title = self.font.render(self.get_text("question"), True, YELLOW)
+        q_title = self.render_text(self.font, self.get_text("question"), True, YELLOW)
         q_title_rect = q_title.get_rect(center=(WINDOW_WIDTH // 2, 100))
         self.screen.blit(q_title, q_title_rect)
         
         # Question text
-        question_text = self.large_font.render(self.current_question.question, True, WHITE)
+        question_text = self.render_text(self.large_font, self.current_question.question, True, WHITE)
         question_rect = question_text.get_rect(center=(WINDOW_WIDTH // 2, 200))
         self.screen.blit(question_text, question_rect)
         
@@ -854,13 +879,13 @@ class SnakeGame:
         colors = [CYAN, YELLOW, ORANGE, PURPLE]
         for i, option in enumerate(self.current_question.options):
             color = colors[i % len(colors)]
-            option_text = self.font.render(f"{i+1}. {option}", True, color)
+            option_text = self.render_text(self.font, f"{i+1}. {option}", True, color)
             y_pos = 300 + i * 50
             option_rect = option_text.get_rect(center=(WINDOW_WIDTH // 2, y_pos))
             self.screen.blit(option_text, option_rect)
         
         # Instructions
-        instruction = self.small_font.render("Press 1-4 to select answer", True, WHITE)
+        instruction = self.render_text(self.small_font, "Press 1-4 to select answer", True, WHITE)
         instruction_rect = instruction.get_rect(center=(WINDOW_WIDTH // 2, 550))
         self.screen.blit(instruction, instruction_rect)
     
@@ -869,7 +894,7 @@ class SnakeGame:
         self.screen.fill(BLACK)
         
         # Game Over title
-        game_over_text = self.large_font.render(self.get_text("game_over"), True, RED)
+        game_over_text = self.render_text(self.large_font, self.get_text("game_over"), True, RED)
         game_over_rect = game_over_text.get_rect(center=(WINDOW_WIDTH // 2, 150))
         self.screen.blit(game_over_text, game_over_rect)
         
@@ -885,16 +910,16 @@ class SnakeGame:
             stats.append(f"{self.get_text('accuracy')}: {accuracy:.1f}%")
         
         for i, stat in enumerate(stats):
-            stat_text = self.font.render(stat, True, WHITE)
+            stat_text = self.render_text(self.font, stat, True, WHITE)
             stat_rect = stat_text.get_rect(center=(WINDOW_WIDTH // 2, 250 + i * 40))
             self.screen.blit(stat_text, stat_rect)
         
         # Instructions
-        play_again = self.font.render(self.get_text("play_again"), True, GREEN)
+        play_again = self.render_text(self.font, self.get_text("play_again"), True, GREEN)
         play_again_rect = play_again.get_rect(center=(WINDOW_WIDTH // 2, 450))
         self.screen.blit(play_again, play_again_rect)
         
-        quit_text = self.font.render(self.get_text("quit"), True, RED)
+        quit_text = self.render_text(self.font, self.get_text("quit"), True, RED)
         quit_rect = quit_text.get_rect(center=(WINDOW_WIDTH // 2, 500))
         self.screen.blit(quit_text, quit_rect)
     
@@ -909,84 +934,69 @@ class SnakeGame:
         self.screen.blit(overlay, (0, 0))
         
         # Paused text
-        paused_text = self.large_font.render(self.get_text("paused"), True, YELLOW)
+        paused_text = self.render_text(self.large_font, self.get_text("paused"), True, YELLOW)
         paused_rect = paused_text.get_rect(center=(WINDOW_WIDTH // 2, WINDOW_HEIGHT // 2))
         self.screen.blit(paused_text, paused_rect)
     
+    def hud_values(self) -> tuple:
+        """Everything the HUD shows, so the renderer can tell when it changed"""
+        return (self.language, self.score, self.level, self.streak,
+                self.questions_correct, self.questions_total)
+    
     def draw_ui(self):
         """Draw game UI elements"""
         # Score
-        score_text = self.font.render(f"{self.get_text('score')}: {self.score}", True, WHITE)
+        score_text = self.render_text(self.font, f"{self.get_text('score')}: {self.score}", True, WHITE)
         self.screen.blit(score_text, (10, 10))
         
         # Level
-        level_text = self.font.render(f"{self.get_text('level')}: {self.level}", True, WHITE)
+        level_text = self.render_text(self.font, f"{self.get_text('level')}: {self.level}", True, WHITE)
         self.screen.blit(level_text, (10, 50))
         
         # Streak
-        streak_text = self.font.render(f"{self.get_text('streak')}: {self.streak}", True, YELLOW)
+        streak_text = self.render_text(self.font, f"{self.get_text('streak')}: {self.streak}", True, YELLOW)
         self.screen.blit(streak_text, (10, 90))
         
         # Accuracy
         if self.questions_total > 0:
             accuracy = (self.questions_correct / self.questions_total) * 100
-            accuracy_text = self.small_font.render(f"{self.get_text('accuracy')}: {accuracy:.1f}%", True, CYAN)
+            accuracy_text = self.render_text(self.small_font, f"{self.get_text('accuracy')}: {accuracy:.1f}%", True, CYAN)
             self.screen.blit(accuracy_text, (10, 130))
     
     def start_python_game(self):
         """Start the selected Python game"""
         self.state = GameState.PYTHON_GAME_PLAYING
-        
-        # Initialize game-specific variables
-        if self.current_python_game == "tic_tac_toe":
-            self.init_tic_tac_toe()
-        elif self.current_python_game == "space_shooter":
-            self.init_space_shooter()
-        elif self.current_python_game == "car_racing":
-            self.init_car_racing()
-        elif self.current_python_game == "zombie_dash":
-            self.init_zombie_dash()
-        elif self.current_python_game == "ball_run":
-            self.init_ball_run()
+        self.scenes.enter(self.current_python_game)
     
     def start_education_game(self):
         """Start the selected education game"""
         self.state = GameState.EDUCATION_GAME_PLAYING
-        
-        # Initialize game-specific variables
-        if self.current_education_game == "math_wizard":
-            self.init_math_wizard()
-        elif self.current_education_game == "science_lab":
-            self.init_science_lab()
-        elif self.current_education_game == "geography_quest":
-            self.init_geography_quest()
-        elif self.current_education_game == "history_hunter":
-            self.init_history_hunter()
-        elif self.current_education_game == "word_master":
-            self.init_word_master()
+        self.scenes.enter(self.current_education_game)
     
     def init_tic_tac_toe(self):
         """Initialize Tic-Tac-Toe game"""
-        self.ttt_board = [' ' for _ in range(9)]
-        self.ttt_current_player = 'X'
-        self.ttt_game_over = False
-        self.ttt_winner = None
+        size, k = TTT_VARIANTS[self.ttt_variant]
+        self.ttt = TicTacToe(size, k)
+        self.ttt_ai = AlphaBetaAI(None if size * size <= 9 else TTT_AI_DEPTH)
+        self.ttt_cursor = (size * size) // 2
     
     def init_space_shooter(self):
         """Initialize Space Shooter game"""
         self.player_x = WINDOW_WIDTH // 2
         self.player_y = WINDOW_HEIGHT - 50
-        self.bullets = []
-        self.enemies = []
+        self.bullets.clear()
+        self.enemies.clear()
         self.shooter_score = 0
         self.enemy_spawn_timer = 0
+        self.shooter_grid = SpatialHash(SHOOTER_GRID_CELL)
+        self.shooter_stress = False
     
     def init_car_racing(self):
         """Initialize Car Racing game"""
         self.car_x = WINDOW_WIDTH // 2
         self.car_y = WINDOW_HEIGHT - 100
         self.car_speed = 5
-        self.obstacles = []
+        self.obstacles.clear()
         self.racing_score = 0
         self.road_offset = 0
     
@@ -1012,21 +1022,59 @@ class SnakeGame:
         """Initialize Zombie Dash game"""
         self.player_dash_x = WINDOW_WIDTH // 2
         self.player_dash_y = WINDOW_HEIGHT - 50
-        self.zombies = []
+        self.zombies.clear()
         self.dash_score = 0
         self.zombie_spawn_timer = 0
         self.player_health = 100
+        self.horde = None  # NumPy horde, created when horde mode is switched on
+    
+    @staticmethod
+    def make_zombie_sprite() -> pygame.Surface:
+        """Zombie body and eyes, drawn once; colorkeyed with RLE for fast blits"""
+        sprite = pygame.Surface((24, 24))
+        sprite.fill(MAGENTA)
+        sprite.set_colorkey(MAGENTA, pygame.RLEACCEL)
+        pygame.draw.circle(sprite, GREEN, (12, 12), 12)
+        pygame.draw.circle(sprite, RED, (7, 9), 2)
+        pygame.draw.circle(sprite, RED, (17, 9), 2)
+        return sprite
+    
+    @staticmethod
+    def paint_road(surface: pygame.Surface, offset: int = 0) -> int:
+        """Road and centre line from primitives, scrolled down by offset; returns the draw calls"""
+        width, height = surface.get_size()
+        surface.fill(ROAD_COLOR)
+        calls = 1
+        for top in range(offset - ROAD_TILE, height, ROAD_TILE):
+            pygame.draw.rect(surface, WHITE, (width // 2 - 5, top, 10, 30))
+            calls += 1
+        return calls
+    
+    @classmethod
+    def make_road_surface(cls) -> pygame.Surface:
+        """One screen of road plus one extra tile, so any scroll offset is a single blit"""
+        road = pygame.Surface((WINDOW_WIDTH, WINDOW_HEIGHT + ROAD_TILE))
+        cls.paint_road(road)
+        return road
+    
+    @staticmethod
+    def make_car_sprite(color) -> pygame.Surface:
+        """30x50 car seen from above, drawn once"""
+        sprite = pygame.Surface((30, 50))
+        sprite.fill(color)
+        return sprite
     
     def init_ball_run(self):
         """Initialize Ball Run game"""
-        self.ball_x = WINDOW_WIDTH // 2
-        self.ball_y = WINDOW_HEIGHT // 2
-        self.ball_vel_x = 0
-        self.ball_vel_y = 0
-        self.obstacles_ball = []
+        self.ball_world.clear()
+        self.ball = self.ball_world.add_body(WINDOW_WIDTH // 2, WINDOW_HEIGHT // 2, BALL_RADIUS)
         self.ball_score = 0
         self.ball_speed = 5
     
+    def init_snake_arena(self):
+        """Initialize Snake Arena: the player plus the ARENA_BOTS"""
+        self.arena = Arena((None,) + ARENA_BOTS, GRID_WIDTH, (WINDOW_HEIGHT - ARENA_TOP) // GRID_SIZE)
+    
     def init_math_wizard(self):
         """Initialize Math Wizard game"""
         self.math_score = 0
@@ -1141,16 +1189,7 @@ class SnakeGame:
     
     def handle_python_game_input(self, event):
         """Handle input for Python games"""
-        if self.current_python_game == "tic_tac_toe":
-            self.handle_ttt_input(event)
-        elif self.current_python_game == "space_shooter":
-            self.handle_shooter_input(event)
-        elif self.current_python_game == "car_racing":
-            self.handle_racing_input(event)
-        elif self.current_python_game == "zombie_dash":
-            self.handle_zombie_dash_input(event)
-        elif self.current_python_game == "ball_run":
-            self.handle_ball_run_input(event)
+        self.scenes.handle_event(self.current_python_game, event)
         
         # Common controls
         if event.key == pygame.K_ESCAPE:
@@ -1158,16 +1197,7 @@ class SnakeGame:
     
     def handle_education_game_input(self, event):
         """Handle input for education games"""
-        if self.current_education_game == "math_wizard":
-            self.handle_math_input(event)
-        elif self.current_education_game == "science_lab":
-            self.handle_science_input(event)
-        elif self.current_education_game == "geography_quest":
-            self.handle_geography_input(event)
-        elif self.current_education_game == "history_hunter":
-            self.handle_history_input(event)
-        elif self.current_education_game == "word_master":
-            self.handle_word_input(event)
+        self.scenes.handle_event(self.current_education_game, event)
         
         # Common controls
         if event.key == pygame.K_ESCAPE:
@@ -1175,40 +1205,43 @@ class SnakeGame:
     
     def handle_ttt_input(self, event):
         """Handle Tic-Tac-Toe input"""
-        if event.key >= pygame.K_1 and event.key <= pygame.K_9:
-            pos = event.key - pygame.K_1
-            if self.ttt_board[pos] == ' ' and not self.ttt_game_over:
-                self.ttt_board[pos] = self.ttt_current_player
-                if self.check_ttt_winner():
-                    self.ttt_game_over = True
-                    self.ttt_winner = self.ttt_current_player
-                elif ' ' not in self.ttt_board:
-                    self.ttt_game_over = True
-                    self.ttt_winner = 'Tie'
-                else:
-                    self.ttt_current_player = 'O' if self.ttt_current_player == 'X' else 'X'
-        elif event.key == pygame.K_r and self.ttt_game_over:
+        size = self.ttt.size
+        row, col = divmod(self.ttt_cursor, size)
+        if size == 3 and pygame.K_1 <= event.key <= pygame.K_9:
+            self.ttt_move(event.key - pygame.K_1)
+        elif event.key in (pygame.K_SPACE, pygame.K_RETURN):
+            self.ttt_move(self.ttt_cursor)
+        elif event.key in ARROW_KEYS:
+            dx, dy = ARROW_KEYS[event.key].value
+            self.ttt_cursor = (row + dy) % size * size + (col + dx) % size
+        elif event.key == pygame.K_c:
+            self.ttt_vs_computer = not self.ttt_vs_computer
+            self.ttt_reply()
+        elif event.key == pygame.K_v:
+            self.ttt_variant = (self.ttt_variant + 1) % len(TTT_VARIANTS)
+            self.init_tic_tac_toe()
+        elif event.key == pygame.K_r:
             self.init_tic_tac_toe()
     
-    def check_ttt_winner(self):
-        """Check if there's a winner in Tic-Tac-Toe"""
-        # Check rows, columns, and diagonals
-        lines = [
-            [0, 1, 2], [3, 4, 5], [6, 7, 8],  # rows
-            [0, 3, 6], [1, 4, 7], [2, 5, 8],  # columns
-            [0, 4, 8], [2, 4, 6]              # diagonals
-        ]
-        
-        for line in lines:
-            if (self.ttt_board[line[0]] == self.ttt_board[line[1]] == self.ttt_board[line[2]] != ' '):
-                return True
-        return False
+    def ttt_move(self, cell: int):
+        """Play a human move, then let the computer answer"""
+        if self.ttt.legal(cell):
+            self.ttt.play(cell)
+            self.ttt_reply()
+    
+    def ttt_reply(self):
+        """Computer plays O when it is its turn"""
+        if self.ttt_vs_computer and not self.ttt.over and self.ttt.current == 'O':
+            self.ttt.play(self.ttt_ai.choose(self.ttt))
     
     def handle_shooter_input(self, event):
         """Handle Space Shooter input"""
         if event.key == pygame.K_SPACE:
             # Shoot bullet
-            self.bullets.append([self.player_x, self.player_y])
+            self.bullets.spawn(self.player_x, self.player_y, vy=-SHOOTER_BULLET_SPEED)
+        elif event.key == pygame.K_s:
+            # Stress mode: keep thousands of enemies and bullets on screen
+            self.shooter_stress = not self.shooter_stress
     
     def handle_racing_input(self, event):
         """Handle Car Racing input"""
@@ -1229,11 +1262,30 @@ class SnakeGame:
         if event.key == pygame.K_SPACE:
             # Dash/attack
             pass
+        elif event.key == pygame.K_h:
+            self.toggle_horde_mode()
+    
+    def toggle_horde_mode(self):
+        """Switch Zombie Dash between the classic zombies and a NumPy horde"""
+        if self.horde is not None:
+            self.horde = None
+            return
+        from snake_core.horde import Horde
+        self.horde = Horde(HORDE_SIZE, WINDOW_WIDTH, WINDOW_HEIGHT)
+        # The classic zombies stop updating in horde mode, so take them off the board
+        self.zombies.clear()
     
     def handle_ball_run_input(self, event):
         """Handle Ball Run input"""
         pass  # Continuous key handling in update method
     
+    def handle_arena_input(self, event):
+        """Handle Snake Arena input"""
+        if event.key in ARROW_KEYS:
+            self.arena.snakes[0].turn(ARROW_KEYS[event.key])
+        elif event.key == pygame.K_r:
+            self.init_snake_arena()
+    
     def handle_math_input(self, event):
         """Handle Math Wizard input"""
         if event.key == pygame.K_RETURN:
@@ -1326,19 +1378,12 @@ class SnakeGame:
     
     def update_python_games(self):
         """Update Python games"""
-        if self.current_python_game == "space_shooter":
-            self.update_space_shooter()
-        elif self.current_python_game == "car_racing":
-            self.update_car_racing()
-        elif self.current_python_game == "zombie_dash":
-            self.update_zombie_dash()
-        elif self.current_python_game == "ball_run":
-            self.update_ball_run()
+        self.scenes.update(self.current_python_game)
     
     def update_education_games(self):
         """Update education games"""
         # Education games are mostly input-driven, minimal updates needed
-        pass
+        self.scenes.update(self.current_education_game)
     
     def update_space_shooter(self):
         """Update Space Shooter game"""
@@ -1350,31 +1395,51 @@ class SnakeGame:
             self.player_x += 5
         
         # Update bullets
-        for bullet in self.bullets[:]:
-            bullet[1] -= 10
-            if bullet[1] < 0:
-                self.bullets.remove(bullet)
+        bullets = self.bullets
+        bullets.move()
+        bullets.cull(-SHOOTER_HIT_RADIUS, 0, WINDOW_WIDTH + SHOOTER_HIT_RADIUS, WINDOW_HEIGHT)
         
         # Spawn enemies
         self.enemy_spawn_timer += 1
         if self.enemy_spawn_timer > 60:  # Spawn every second
-            self.enemies.append([random.randint(0, WINDOW_WIDTH), 0])
+            self.enemies.spawn(random.randint(0, WINDOW_WIDTH), 0, vy=SHOOTER_ENEMY_SPEED)
             self.enemy_spawn_timer = 0
+        if self.shooter_stress:
+            self.spawn_shooter_stress()
         
         # Update enemies
-        for enemy in self.enemies[:]:
-            enemy[1] += 3
-            if enemy[1] > WINDOW_HEIGHT:
-                self.enemies.remove(enemy)
-        
-        # Check collisions
-        for bullet in self.bullets[:]:
-            for enemy in self.enemies[:]:
-                if (abs(bullet[0] - enemy[0]) < 20 and abs(bullet[1] - enemy[1]) < 20):
-                    self.bullets.remove(bullet)
-                    self.enemies.remove(enemy)
-                    self.shooter_score += 10
-                    break
+        enemies = self.enemies
+        enemies.move()
+        enemies.cull(-SHOOTER_HIT_RADIUS, -SHOOTER_HIT_RADIUS, WINDOW_WIDTH + SHOOTER_HIT_RADIUS, WINDOW_HEIGHT)
+        
+        # Check collisions against the enemies near each bullet only
+        grid = self.shooter_grid
+        ex, ey, enemy_alive = enemies.x, enemies.y, enemies.alive
+        grid.build_columns(enemies, ex, ey)
+        bullet_x, bullet_y, bullet_alive = bullets.x, bullets.y, bullets.alive
+        reach = SHOOTER_HIT_RADIUS
+        for i in range(bullets.high):
+            if not bullet_alive[i]:
+                continue
+            bx, by = bullet_x[i], bullet_y[i]
+            for bucket in grid.query(bx, by, reach):
+                for j in bucket:
+                    if enemy_alive[j] and abs(bx - ex[j]) < reach and abs(by - ey[j]) < reach:
+                        break
+                else:
+                    continue
+                enemies.kill(j)
+                bullets.kill(i)
+                self.shooter_score += 10
+                break
+    
+    def spawn_shooter_stress(self):
+        """Top the shooter up to thousands of enemies and bullets"""
+        rand = random.random
+        for _ in range(SHOOTER_STRESS_ENEMIES - len(self.enemies)):
+            self.enemies.spawn(int(rand() * WINDOW_WIDTH), int(rand() * WINDOW_HEIGHT), vy=SHOOTER_ENEMY_SPEED)
+        for _ in range(SHOOTER_STRESS_BULLETS - len(self.bullets)):
+            self.bullets.spawn(int(rand() * WINDOW_WIDTH), int(rand() * WINDOW_HEIGHT), vy=-SHOOTER_BULLET_SPEED)
     
     def update_car_racing(self):
         """Update Car Racing game"""
@@ -1384,21 +1449,16 @@ class SnakeGame:
         if keys[pygame.K_RIGHT] and self.car_x < WINDOW_WIDTH - 50:
             self.car_x += self.car_speed
         
-        # Update road
-        self.road_offset += 5
-        if self.road_offset > 50:
-            self.road_offset = 0
+        # Update road; the markings repeat every tile, so the offset wraps
+        self.road_offset = (self.road_offset + ROAD_SCROLL_SPEED) % ROAD_TILE
         
         # Spawn obstacles
         if random.randint(1, 100) < 3:
-            self.obstacles.append([random.randint(100, WINDOW_WIDTH-100), -50])
+            self.obstacles.spawn(random.randint(100, WINDOW_WIDTH-100), -50, vy=8)
         
-        # Update obstacles
-        for obstacle in self.obstacles[:]:
-            obstacle[1] += 8
-            if obstacle[1] > WINDOW_HEIGHT:
-                self.obstacles.remove(obstacle)
-                self.racing_score += 1
+        # Update obstacles; each one that leaves the screen scores
+        self.obstacles.move()
+        self.racing_score += self.obstacles.cull(0, -50, WINDOW_WIDTH, WINDOW_HEIGHT)
     
     def update_platformer_2d(self):
         """Update 2D Platformer game"""
@@ -1444,31 +1504,29 @@ class SnakeGame:
         if keys[pygame.K_DOWN] and self.player_dash_y < WINDOW_HEIGHT - 50:
             self.player_dash_y += 5
         
+        if self.horde is not None:
+            # Horde mode: thousands of zombies, a few array operations per frame
+            self.horde.spawn(HORDE_SPAWN_PER_FRAME)
+            self.player_health -= self.horde.update(self.player_dash_x, self.player_dash_y)
+            self.dash_score += 1
+            return
+        
         # Spawn zombies
         self.zombie_spawn_timer += 1
         if self.zombie_spawn_timer > 120:  # Spawn every 2 seconds
-            self.zombies.append([random.randint(0, WINDOW_WIDTH), random.randint(0, WINDOW_HEIGHT)])
+            self.zombies.spawn(random.randint(0, WINDOW_WIDTH), random.randint(0, WINDOW_HEIGHT))
             self.zombie_spawn_timer = 0
         
         # Update zombies (move towards player)
-        for zombie in self.zombies[:]:
-            if zombie[0] < self.player_dash_x:
-                zombie[0] += 1
-            elif zombie[0] > self.player_dash_x:
-                zombie[0] -= 1
-            
-            if zombie[1] < self.player_dash_y:
-                zombie[1] += 1
-            elif zombie[1] > self.player_dash_y:
-                zombie[1] -= 1
-            
-            # Check collision with player
-            if abs(zombie[0] - self.player_dash_x) < 30 and abs(zombie[1] - self.player_dash_y) < 30:
-                self.player_health -= 1
-                self.zombies.remove(zombie)
-                if self.player_health <= 0:
-                    # Game over
-                    pass
+        self.zombies.seek(self.player_dash_x, self.player_dash_y, 1)
+        
+        # Check collision with player
+        for zombie in self.zombies.near(self.player_dash_x, self.player_dash_y, 30):
+            self.player_health -= 1
+            self.zombies.kill(zombie)
+            if self.player_health <= 0:
+                # Game over
+                pass
         
         self.dash_score += 1
     
@@ -1476,83 +1534,57 @@ class SnakeGame:
         """Update Ball Run game"""
         keys = pygame.key.get_pressed()
         
-        # Apply physics to ball
-        if keys[pygame.K_LEFT]:
-            self.ball_vel_x -= 0.5
-        if keys[pygame.K_RIGHT]:
-            self.ball_vel_x += 0.5
-        if keys[pygame.K_UP]:
-            self.ball_vel_y -= 0.5
-        if keys[pygame.K_DOWN]:
-            self.ball_vel_y += 0.5
-        
-        # Apply friction
-        self.ball_vel_x *= 0.95
-        self.ball_vel_y *= 0.95
-        
-        # Update position
-        self.ball_x += self.ball_vel_x
-        self.ball_y += self.ball_vel_y
+        # Arrow keys accelerate the ball; the world handles friction and bounces
+        ball = self.ball
+        ball.ax = (keys[pygame.K_RIGHT] - keys[pygame.K_LEFT]) * BALL_ACCELERATION
+        ball.ay = (keys[pygame.K_DOWN] - keys[pygame.K_UP]) * BALL_ACCELERATION
         
-        # Boundary collision
-        if self.ball_x < 20 or self.ball_x > WINDOW_WIDTH - 20:
-            self.ball_vel_x *= -0.8
-            self.ball_x = max(20, min(WINDOW_WIDTH - 20, self.ball_x))
-        
-        if self.ball_y < 20 or self.ball_y > WINDOW_HEIGHT - 20:
-            self.ball_vel_y *= -0.8
-            self.ball_y = max(20, min(WINDOW_HEIGHT - 20, self.ball_y))
-        
-        # Spawn obstacles
+        # Spawn obstacles, never right on top of the ball
         if random.randint(1, 200) < 3:
-            self.obstacles_ball.append([random.randint(50, WINDOW_WIDTH-50), random.randint(50, WINDOW_HEIGHT-50)])
+            x, y = random.randint(50, WINDOW_WIDTH-50), random.randint(50, WINDOW_HEIGHT-50)
+            if abs(x - ball.x) > 60 or abs(y - ball.y) > 60:
+                self.ball_world.add_obstacle(x, y, BALL_OBSTACLE_RADIUS, BALL_OBSTACLE_LIFETIME)
         
-        # Update score
-        self.ball_score += 1
+        # Fixed-substep physics for one game frame
+        result = self.ball_world.step(1 / FPS)
+        
+        # Update score: one point for every obstacle outlived without touching it
+        self.ball_score += result.dodged
+    
+    def update_snake_arena(self):
+        """Move every snake one cell per frame until one is left"""
+        if not self.arena.over:
+            self.arena.step()
     
     def draw_python_games(self):
         """Draw Python games"""
-        if self.current_python_game == "tic_tac_toe":
-            self.draw_tic_tac_toe()
-        elif self.current_python_game == "space_shooter":
-            self.draw_space_shooter()
-        elif self.current_python_game == "car_racing":
-            self.draw_car_racing()
-        elif self.current_python_game == "zombie_dash":
-            self.draw_zombie_dash()
-        elif self.current_python_game == "ball_run":
-            self.draw_ball_run()
+        self.scenes.draw(self.current_python_game)
     
     def draw_education_games(self):
         """Draw education games"""
-        if self.current_education_game == "math_wizard":
-            self.draw_math_wizard()
-        elif self.current_education_game == "science_lab":
-            self.draw_science_lab()
-        elif self.current_education_game == "geography_quest":
-            self.draw_geography_quest()
-        elif self.current_education_game == "history_hunter":
-            self.draw_history_hunter()
-        elif self.current_education_game == "word_master":
-            self.draw_word_master()
+        self.scenes.draw(self.current_education_game)
     
     def draw_tic_tac_toe(self):
         """Draw Tic-Tac-Toe game"""
         self.screen.fill(BLACK)
         
         # Title
-        title = self.large_font.render("⭕ Tic-Tac-Toe", True, YELLOW)
+        title = self.render_text(self.large_font, "⭕ Tic-Tac-Toe", True, YELLOW)
         title_rect = title.get_rect(center=(WINDOW_WIDTH // 2, 50))
         self.screen.blit(title, title_rect)
         
         # Draw grid
-        grid_size = 300
+        game = self.ttt
+        size = game.size
+        cell_size = min(100, 340 // size)
+        grid_size = cell_size * size
         start_x = (WINDOW_WIDTH - grid_size) // 2
-        start_y = 150
-        cell_size = grid_size // 3
+        start_y = 150 if size == 3 else 120
+        mark = cell_size * 3 // 10
+        width = max(2, cell_size // 20)
         
         # Draw grid lines
-        for i in range(4):
+        for i in range(size + 1):
             # Vertical lines
             pygame.draw.line(self.screen, WHITE, 
                            (start_x + i * cell_size, start_y), 
@@ -1562,55 +1594,55 @@ class SnakeGame:
                            (start_x, start_y + i * cell_size), 
                            (start_x + grid_size, start_y + i * cell_size), 3)
         
-        # Draw X's and O's
-        for i in range(9):
-            row = i // 3
-            col = i % 3
+        # Draw X's, O's, and numbers for empty cells on the 3x3 board
+        for i in range(size * size):
+            row = i // size
+            col = i % size
             x = start_x + col * cell_size + cell_size // 2
             y = start_y + row * cell_size + cell_size // 2
             
-            if self.ttt_board[i] == 'X':
+            cell = game.cell(i)
+            if cell == 'X':
                 # Draw X
                 pygame.draw.line(self.screen, RED, 
-                               (x - 30, y - 30), (x + 30, y + 30), 5)
+                               (x - mark, y - mark), (x + mark, y + mark), width)
                 pygame.draw.line(self.screen, RED, 
-                               (x + 30, y - 30), (x - 30, y + 30), 5)
-            elif self.ttt_board[i] == 'O':
+                               (x + mark, y - mark), (x - mark, y + mark), width)
+            elif cell == 'O':
                 # Draw O
-                pygame.draw.circle(self.screen, BLUE, (x, y), 30, 5)
-        
-        # Draw numbers for empty cells
-        for i in range(9):
-            if self.ttt_board[i] == ' ':
-                row = i // 3
-                col = i % 3
-                x = start_x + col * cell_size + cell_size // 2
-                y = start_y + row * cell_size + cell_size // 2
-                
-                num_text = self.font.render(str(i + 1), True, WHITE)
+                pygame.draw.circle(self.screen, BLUE, (x, y), mark, width)
+            elif size == 3:
+                num_text = self.render_text(self.font, str(i + 1), True, WHITE)
                 num_rect = num_text.get_rect(center=(x, y))
                 self.screen.blit(num_text, num_rect)
         
+        # Cursor
+        if not game.over:
+            row, col = divmod(self.ttt_cursor, size)
+            pygame.draw.rect(self.screen, YELLOW, (start_x + col * cell_size + 3, start_y + row * cell_size + 3,
+                                                   cell_size - 5, cell_size - 5), 2)
+        
         # Game status
-        if self.ttt_game_over:
-            if self.ttt_winner == 'Tie':
+        if game.over:
+            if game.winner == TIE:
                 status = "It's a Tie!"
             else:
-                status = f"Player {self.ttt_winner} Wins!"
-            status_text = self.font.render(status, True, YELLOW)
+                status = f"Player {game.winner} Wins!"
+            status_text = self.render_text(self.font, status, True, YELLOW)
             status_rect = status_text.get_rect(center=(WINDOW_WIDTH // 2, 500))
             self.screen.blit(status_text, status_rect)
             
-            restart_text = self.small_font.render("Press R to restart", True, WHITE)
+            restart_text = self.render_text(self.small_font, "Press R to restart", True, WHITE)
             restart_rect = restart_text.get_rect(center=(WINDOW_WIDTH // 2, 530))
             self.screen.blit(restart_text, restart_rect)
         else:
-            current_text = self.font.render(f"Current Player: {self.ttt_current_player}", True, CYAN)
+            opponent = "computer" if self.ttt_vs_computer else "2 players"
+            current_text = self.render_text(self.font, f"Current Player: {game.current}  ({size}x{size}, {game.k} in a row, {opponent})", True, CYAN)
             current_rect = current_text.get_rect(center=(WINDOW_WIDTH // 2, 500))
             self.screen.blit(current_text, current_rect)
         
         # Instructions
-        inst_text = self.small_font.render("Press 1-9 to place, ESC to exit", True, WHITE)
+        inst_text = self.render_text(self.small_font, "1-9 or arrows + SPACE to place, C computer, V board size, ESC to exit", True, WHITE)
         inst_rect = inst_text.get_rect(center=(WINDOW_WIDTH // 2, 560))
         self.screen.blit(inst_text, inst_rect)
     
@@ -1619,10 +1651,10 @@ class SnakeGame:
         self.screen.fill(BLACK)
         
         # Title and score
-        title = self.font.render("🚀 Space Shooter", True, YELLOW)
+        title = self.render_text(self.font, "🚀 Space Shooter", True, YELLOW)
         self.screen.blit(title, (10, 10))
         
-        score_text = self.font.render(f"Score: {self.shooter_score}", True, WHITE)
+        score_text = self.render_text(self.font, f"Score: {self.shooter_score}", True, WHITE)
         self.screen.blit(score_text, (10, 50))
         
         # Draw player
@@ -1633,42 +1665,44 @@ class SnakeGame:
         ])
         
         # Draw bullets
-        for bullet in self.bullets:
-            pygame.draw.circle(self.screen, YELLOW, bullet, 3)
+        bullets = self.bullets
+        for i in bullets:
+            pygame.draw.circle(self.screen, YELLOW, (bullets.x[i], bullets.y[i]), 3)
         
         # Draw enemies
-        for enemy in self.enemies:
-            pygame.draw.rect(self.screen, RED, (enemy[0] - 10, enemy[1] - 10, 20, 20))
+        enemies = self.enemies
+        for i in enemies:
+            pygame.draw.rect(self.screen, RED, (enemies.x[i] - 10, enemies.y[i] - 10, 20, 20))
+        
+        if self.shooter_stress:
+            stress_text = self.render_text(self.small_font, f"Stress: {len(self.enemies)} enemies, {len(self.bullets)} bullets", True, ORANGE)
+            self.screen.blit(stress_text, (10, 90))
         
         # Instructions
-        inst_text = self.small_font.render("Arrow keys to move, SPACE to shoot, ESC to exit", True, WHITE)
+        inst_text = self.render_text(self.small_font, "Arrow keys to move, SPACE to shoot, S for stress mode, ESC to exit", True, WHITE)
         self.screen.blit(inst_text, (10, WINDOW_HEIGHT - 30))
     
     def draw_car_racing(self):
         """Draw Car Racing game"""
-        self.screen.fill((50, 50, 50))  # Dark gray road
-        
-        # Draw road lines
-        for i in range(-1, WINDOW_HEIGHT // 50 + 2):
-            y = i * 50 + self.road_offset
-            pygame.draw.rect(self.screen, WHITE, (WINDOW_WIDTH // 2 - 5, y, 10, 30))
+        # Scrolling road: one blit of the pre-rendered strip
+        self.screen.blit(self.road_surface, (0, self.road_offset - ROAD_TILE))
         
         # Title and score
-        title = self.font.render("🏎️ Car Racing", True, YELLOW)
+        title = self.render_text(self.font, "🏎️ Car Racing", True, YELLOW)
         self.screen.blit(title, (10, 10))
         
-        score_text = self.font.render(f"Score: {self.racing_score}", True, WHITE)
+        score_text = self.render_text(self.font, f"Score: {self.racing_score}", True, WHITE)
         self.screen.blit(score_text, (10, 50))
         
         # Draw player car
-        pygame.draw.rect(self.screen, BLUE, (self.car_x - 15, self.car_y - 25, 30, 50))
+        self.screen.blit(self.car_sprite, (self.car_x - 15, self.car_y - 25))
         
-        # Draw obstacles
-        for obstacle in self.obstacles:
-            pygame.draw.rect(self.screen, RED, (obstacle[0] - 15, obstacle[1] - 25, 30, 50))
+        # Draw obstacles, all in one blits() call
+        obstacles, sprite = self.obstacles, self.rival_sprite
+        self.screen.blits([(sprite, (obstacles.x[i] - 15, obstacles.y[i] - 25)) for i in obstacles], False)
         
         # Instructions
-        inst_text = self.small_font.render("Left/Right arrows to steer, ESC to exit", True, WHITE)
+        inst_text = self.render_text(self.small_font, "Left/Right arrows to steer, ESC to exit", True, WHITE)
         self.screen.blit(inst_text, (10, WINDOW_HEIGHT - 30))
     
     def draw_platformer_2d(self):
@@ -1676,10 +1710,10 @@ class SnakeGame:
         self.screen.fill((135, 206, 235))  # Sky blue
         
         # Title and score
-        title = self.font.render("🎮 2D Platformer", True, YELLOW)
+        title = self.render_text(self.font, "🎮 2D Platformer", True, YELLOW)
         self.screen.blit(title, (10, 10))
         
-        score_text = self.font.render(f"Score: {self.platformer_score}", True, WHITE)
+        score_text = self.render_text(self.font, f"Score: {self.platformer_score}", True, WHITE)
         self.screen.blit(score_text, (10, 50))
         
         # Draw platforms
@@ -1690,7 +1724,7 @@ class SnakeGame:
         pygame.draw.rect(self.screen, RED, (self.player_2d_x, self.player_2d_y, 20, 20))
         
         # Instructions
-        inst_text = self.small_font.render("Arrow keys to move, SPACE to jump, ESC to exit", True, BLACK)
+        inst_text = self.render_text(self.small_font, "Arrow keys to move, SPACE to jump, ESC to exit", True, BLACK)
         self.screen.blit(inst_text, (10, WINDOW_HEIGHT - 30))
     
     def draw_adventure_3d(self):
@@ -1698,10 +1732,10 @@ class SnakeGame:
         self.screen.fill(BLACK)
         
         # Title and score
-        title = self.font.render("🎯 3D Adventure", True, YELLOW)
+        title = self.render_text(self.font, "🎯 3D Adventure", True, YELLOW)
         self.screen.blit(title, (10, 10))
         
-        score_text = self.font.render(f"Score: {self.adventure_score}", True, WHITE)
+        score_text = self.render_text(self.font, f"Score: {self.adventure_score}", True, WHITE)
         self.screen.blit(score_text, (10, 50))
         
         # Simple 3D effect - draw rotating squares
@@ -1725,11 +1759,11 @@ class SnakeGame:
             pygame.draw.polygon(self.screen, color, corners, 2)
         
         # Player position indicator
-        pos_text = self.small_font.render(f"Position: ({self.player_3d_x}, {self.player_3d_y}, {self.player_3d_z})", True, WHITE)
+        pos_text = self.render_text(self.small_font, f"Position: ({self.player_3d_x}, {self.player_3d_y}, {self.player_3d_z})", True, WHITE)
         self.screen.blit(pos_text, (10, 90))
         
         # Instructions
-        inst_text = self.small_font.render("Arrow keys to rotate/move, ESC to exit", True, WHITE)
+        inst_text = self.render_text(self.small_font, "Arrow keys to rotate/move, ESC to exit", True, WHITE)
         self.screen.blit(inst_text, (10, WINDOW_HEIGHT - 30))
     
     def draw_zombie_dash(self):
@@ -1737,82 +1771,144 @@ class SnakeGame:
         self.screen.fill((20, 20, 20))  # Dark background
         
         # Title and score
-        title = self.font.render("🧟 Zombie Dash", True, YELLOW)
+        title = self.render_text(self.font, "🧟 Zombie Dash", True, YELLOW)
         self.screen.blit(title, (10, 10))
         
-        score_text = self.font.render(f"Score: {self.dash_score}", True, WHITE)
+        score_text = self.render_text(self.font, f"Score: {self.dash_score}", True, WHITE)
         self.screen.blit(score_text, (10, 50))
         
-        health_text = self.font.render(f"Health: {self.player_health}", True, RED if self.player_health < 30 else GREEN)
+        health_text = self.render_text(self.font, f"Health: {self.player_health}", True, RED if self.player_health < 30 else GREEN)
         self.screen.blit(health_text, (10, 90))
         
         # Draw player
         pygame.draw.circle(self.screen, BLUE, (int(self.player_dash_x), int(self.player_dash_y)), 15)
         
         # Draw zombies
-        for zombie in self.zombies:
-            pygame.draw.circle(self.screen, GREEN, (int(zombie[0]), int(zombie[1])), 12)
-            # Draw zombie eyes
-            pygame.draw.circle(self.screen, RED, (int(zombie[0] - 5), int(zombie[1] - 3)), 2)
-            pygame.draw.circle(self.screen, RED, (int(zombie[0] + 5), int(zombie[1] - 3)), 2)
+        if self.horde is not None:
+            self.draw_horde()
+        else:
+            zombies = self.zombies
+            for i in zombies:
+                zx, zy = int(zombies.x[i]), int(zombies.y[i])
+                pygame.draw.circle(self.screen, GREEN, (zx, zy), 12)
+                # Draw zombie eyes
+                pygame.draw.circle(self.screen, RED, (zx - 5, zy - 3), 2)
+                pygame.draw.circle(self.screen, RED, (zx + 5, zy - 3), 2)
         
         # Instructions
-        inst_text = self.small_font.render("Arrow keys to move, avoid zombies, ESC to exit", True, WHITE)
+        inst_text = self.render_text(self.small_font, "Arrow keys to move, avoid zombies, H for horde mode, ESC to exit", True, WHITE)
         self.screen.blit(inst_text, (10, WINDOW_HEIGHT - 30))
     
+    def draw_horde(self):
+        """Draw every horde zombie from one pre-rendered sprite in a single blits() call"""
+        sprite = self.zombie_sprite
+        half = sprite.get_width() // 2
+        corners = (self.horde.positions - half).astype(int).tolist()
+        self.screen.blits([(sprite, corner) for corner in corners], doreturn=False)
+        count_text = self.render_text(self.small_font, f"Horde: {len(self.horde)}", True, ORANGE)
+        self.screen.blit(count_text, (10, 130))
+    
     def draw_ball_run(self):
         """Draw Ball Run game"""
         self.screen.fill((0, 100, 0))  # Green field
         
         # Title and score
-        title = self.font.render("⚽ Ball Run", True, YELLOW)
+        title = self.render_text(self.font, "⚽ Ball Run", True, YELLOW)
         self.screen.blit(title, (10, 10))
         
-        score_text = self.font.render(f"Score: {self.ball_score}", True, WHITE)
+        score_text = self.render_text(self.font, f"Score: {self.ball_score}", True, WHITE)
         self.screen.blit(score_text, (10, 50))
         
         # Draw ball
-        pygame.draw.circle(self.screen, WHITE, (int(self.ball_x), int(self.ball_y)), 15)
-        pygame.draw.circle(self.screen, BLACK, (int(self.ball_x), int(self.ball_y)), 15, 2)
+        ball = self.ball
+        pygame.draw.circle(self.screen, WHITE, (int(ball.x), int(ball.y)), BALL_RADIUS)
+        pygame.draw.circle(self.screen, BLACK, (int(ball.x), int(ball.y)), BALL_RADIUS, 2)
         
         # Draw obstacles
-        for obstacle in self.obstacles_ball:
-            pygame.draw.rect(self.screen, RED, (obstacle[0] - 20, obstacle[1] - 20, 40, 40))
+        obstacles = self.obstacles_ball
+        for i in obstacles:
+            pygame.draw.circle(self.screen, RED, (int(obstacles.x[i]), int(obstacles.y[i])), BALL_OBSTACLE_RADIUS)
         
         # Draw velocity indicator
-        vel_text = self.small_font.render(f"Velocity: ({self.ball_vel_x:.1f}, {self.ball_vel_y:.1f})", True, WHITE)
+        vel_text = self.render_text(self.small_font, f"Velocity: ({ball.vx:.0f}, {ball.vy:.0f}) px/s", True, WHITE)
         self.screen.blit(vel_text, (10, 90))
         
         # Instructions
-        inst_text = self.small_font.render("Arrow keys to control ball, ESC to exit", True, WHITE)
+        inst_text = self.render_text(self.small_font, "Arrow keys to control ball, dodge the red bumpers, ESC to exit", True, WHITE)
         self.screen.blit(inst_text, (10, WINDOW_HEIGHT - 30))
     
+    def draw_snake_arena(self):
+        """Draw Snake Arena game"""
+        self.screen.fill(BLACK)
+        arena = self.arena
+        
+        # Header: who is still in and how long they are
+        title = self.render_text(self.font, "🐍 Snake Arena", True, YELLOW)
+        self.screen.blit(title, (10, 15))
+        x = 250
+        for snake, color in zip(arena.snakes, ARENA_COLORS):
+            name = "You" if snake.bot is None else snake.bot.strategy
+            label = f"{name}: {len(snake.snake)}" if snake.alive else f"{name}: out"
+            text = self.render_text(self.small_font, label, True, color if snake.alive else WHITE)
+            self.screen.blit(text, (x, 22))
+            x += text.get_width() + 25
+        pygame.draw.rect(self.screen, WHITE, (0, ARENA_TOP - 2, WINDOW_WIDTH, 2))
+        
+        # Food and snakes
+        for fx, fy in arena.foods:
+            center = (fx * GRID_SIZE + GRID_SIZE // 2, ARENA_TOP + fy * GRID_SIZE + GRID_SIZE // 2)
+            pygame.draw.circle(self.screen, RED, center, GRID_SIZE // 2 - 2)
+        for snake, color in zip(arena.snakes, ARENA_COLORS):
+            if not snake.alive:
+                continue
+            for sx, sy in snake.snake:
+                pygame.draw.rect(self.screen, color, (sx * GRID_SIZE + 1, ARENA_TOP + sy * GRID_SIZE + 1,
+                                                      GRID_SIZE - 2, GRID_SIZE - 2))
+            hx, hy = snake.snake[0]
+            pygame.draw.rect(self.screen, WHITE, (hx * GRID_SIZE, ARENA_TOP + hy * GRID_SIZE,
+                                                  GRID_SIZE, GRID_SIZE), 2)
+        
+        # Result
+        if arena.over:
+            winner = arena.winner()
+            if winner is None:
+                status = "Draw!"
+            elif winner.bot is None:
+                status = "You Win!"
+            else:
+                status = f"{winner.bot.strategy} bot wins"
+            status_text = self.render_text(self.large_font, status, True, YELLOW)
+            self.screen.blit(status_text, status_text.get_rect(center=(WINDOW_WIDTH // 2, WINDOW_HEIGHT // 2)))
+        
+        inst_text = self.render_text(self.small_font, "Arrow keys to steer, R to restart, ESC to exit", True, WHITE)
+        self.screen.blit(inst_text, (10, WINDOW_HEIGHT - 25))
+    
     def draw_math_wizard(self):
         """Draw Math Wizard game"""
         self.screen.fill((25, 25, 112))  # Midnight blue
         
         # Title and score
-        title = self.large_font.render("🧮 Math Wizard", True, YELLOW)
+        title = self.render_text(self.large_font, "🧮 Math Wizard", True, YELLOW)
         title_rect = title.get_rect(center=(WINDOW_WIDTH // 2, 80))
         self.screen.blit(title, title_rect)
         
-        score_text = self.font.render(f"Score: {self.math_score}", True, WHITE)
+        score_text = self.render_text(self.font, f"Score: {self.math_score}", True, WHITE)
         self.screen.blit(score_text, (10, 10))
         
         if self.current_problem:
             # Draw problem
-            problem_text = self.large_font.render(self.current_problem['question'], True, WHITE)
+            problem_text = self.render_text(self.large_font, self.current_problem['question'], True, WHITE)
             problem_rect = problem_text.get_rect(center=(WINDOW_WIDTH // 2, 200))
             self.screen.blit(problem_text, problem_rect)
             
             # Draw answer input
             answer_text = f"Your answer: {self.current_problem['user_answer']}"
-            answer_display = self.font.render(answer_text, True, CYAN)
+            answer_display = self.render_text(self.font, answer_text, True, CYAN)
             answer_rect = answer_display.get_rect(center=(WINDOW_WIDTH // 2, 300))
             self.screen.blit(answer_display, answer_rect)
             
             # Instructions
-            inst_text = self.small_font.render("Type your answer and press ENTER, ESC to exit", True, WHITE)
+            inst_text = self.render_text(self.small_font, "Type your answer and press ENTER, ESC to exit", True, WHITE)
             inst_rect = inst_text.get_rect(center=(WINDOW_WIDTH // 2, 500))
             self.screen.blit(inst_text, inst_rect)
     
@@ -1821,27 +1917,27 @@ class SnakeGame:
         self.screen.fill((0, 50, 0))  # Dark green
         
         # Title and score
-        title = self.large_font.render("🧪 Science Lab", True, YELLOW)
+        title = self.render_text(self.large_font, "🧪 Science Lab", True, YELLOW)
         title_rect = title.get_rect(center=(WINDOW_WIDTH // 2, 80))
         self.screen.blit(title, title_rect)
         
-        score_text = self.font.render(f"Score: {self.science_score}", True, WHITE)
+        score_text = self.render_text(self.font, f"Score: {self.science_score}", True, WHITE)
         self.screen.blit(score_text, (10, 10))
         
         if self.current_experiment:
             # Draw question
-            question_text = self.font.render(self.current_experiment['question'], True, WHITE)
+            question_text = self.render_text(self.font, self.current_experiment['question'], True, WHITE)
             question_rect = question_text.get_rect(center=(WINDOW_WIDTH // 2, 200))
             self.screen.blit(question_text, question_rect)
             
             # Draw answer input
             answer_text = f"Your answer: {self.current_experiment['user_answer']}"
-            answer_display = self.font.render(answer_text, True, CYAN)
+            answer_display = self.render_text(self.font, answer_text, True, CYAN)
             answer_rect = answer_display.get_rect(center=(WINDOW_WIDTH // 2, 300))
             self.screen.blit(answer_display, answer_rect)
             
             # Instructions
-            inst_text = self.small_font.render("Type your answer and press ENTER, ESC to exit", True, WHITE)
+            inst_text = self.render_text(self.small_font, "Type your answer and press ENTER, ESC to exit", True, WHITE)
             inst_rect = inst_text.get_rect(center=(WINDOW_WIDTH // 2, 500))
             self.screen.blit(inst_text, inst_rect)
     
@@ -1850,27 +1946,27 @@ class SnakeGame:
         self.screen.fill((0, 0, 139))  # Dark blue
         
         # Title and score
-        title = self.large_font.render("🌍 Geography Quest", True, YELLOW)
+        title = self.render_text(self.large_font, "🌍 Geography Quest", True, YELLOW)
         title_rect = title.get_rect(center=(WINDOW_WIDTH // 2, 80))
         self.screen.blit(title, title_rect)
         
-        score_text = self.font.render(f"Score: {self.geo_score}", True, WHITE)
+        score_text = self.render_text(self.font, f"Score: {self.geo_score}", True, WHITE)
         self.screen.blit(score_text, (10, 10))
         
         if self.current_country:
             # Draw question
-            question_text = self.font.render(self.current_country['question'], True, WHITE)
+            question_text = self.render_text(self.font, self.current_country['question'], True, WHITE)
             question_rect = question_text.get_rect(center=(WINDOW_WIDTH // 2, 200))
             self.screen.blit(question_text, question_rect)
             
             # Draw answer input
             answer_text = f"Your answer: {self.current_country['user_answer']}"
-            answer_display = self.font.render(answer_text, True, CYAN)
+            answer_display = self.render_text(self.font, answer_text, True, CYAN)
             answer_rect = answer_display.get_rect(center=(WINDOW_WIDTH // 2, 300))
             self.screen.blit(answer_display, answer_rect)
             
             # Instructions
-            inst_text = self.small_font.render("Type your answer and press ENTER, ESC to exit", True, WHITE)
+            inst_text = self.render_text(self.small_font, "Type your answer and press ENTER, ESC to exit", True, WHITE)
             inst_rect = inst_text.get_rect(center=(WINDOW_WIDTH // 2, 500))
             self.screen.blit(inst_text, inst_rect)
     
@@ -1879,27 +1975,27 @@ class SnakeGame:
         self.screen.fill((139, 69, 19))  # Saddle brown
         
         # Title and score
-        title = self.large_font.render("📚 History Hunter", True, YELLOW)
+        title = self.render_text(self.large_font, "📚 History Hunter", True, YELLOW)
         title_rect = title.get_rect(center=(WINDOW_WIDTH // 2, 80))
         self.screen.blit(title, title_rect)
         
-        score_text = self.font.render(f"Score: {self.history_score}", True, WHITE)
+        score_text = self.render_text(self.font, f"Score: {self.history_score}", True, WHITE)
         self.screen.blit(score_text, (10, 10))
         
         if self.current_event:
             # Draw question
-            question_text = self.font.render(self.current_event['question'], True, WHITE)
+            question_text = self.render_text(self.font, self.current_event['question'], True, WHITE)
             question_rect = question_text.get_rect(center=(WINDOW_WIDTH // 2, 200))
             self.screen.blit(question_text, question_rect)
             
             # Draw answer input
             answer_text = f"Your answer: {self.current_event['user_answer']}"
-            answer_display = self.font.render(answer_text, True, CYAN)
+            answer_display = self.render_text(self.font, answer_text, True, CYAN)
             answer_rect = answer_display.get_rect(center=(WINDOW_WIDTH // 2, 300))
             self.screen.blit(answer_display, answer_rect)
             
             # Instructions
-            inst_text = self.small_font.render("Type your answer and press ENTER, ESC to exit", True, WHITE)
+            inst_text = self.render_text(self.small_font, "Type your answer and press ENTER, ESC to exit", True, WHITE)
             inst_rect = inst_text.get_rect(center=(WINDOW_WIDTH // 2, 500))
             self.screen.blit(inst_text, inst_rect)
     
@@ -1908,74 +2004,179 @@ class SnakeGame:
         self.screen.fill((75, 0, 130))  # Indigo
         
         # Title and score
-        title = self.large_font.render("🔤 Word Master", True, YELLOW)
+        title = self.render_text(self.large_font, "🔤 Word Master", True, YELLOW)
         title_rect = title.get_rect(center=(WINDOW_WIDTH // 2, 80))
         self.screen.blit(title, title_rect)
         
-        score_text = self.font.render(f"Score: {self.word_score}", True, WHITE)
+        score_text = self.render_text(self.font, f"Score: {self.word_score}", True, WHITE)
         self.screen.blit(score_text, (10, 10))
         
         if self.current_word:
             # Draw question
-            question_text = self.font.render(self.current_word['question'], True, WHITE)
+            question_text = self.render_text(self.font, self.current_word['question'], True, WHITE)
             question_rect = question_text.get_rect(center=(WINDOW_WIDTH // 2, 200))
             self.screen.blit(question_text, question_rect)
             
             # Draw answer input
             answer_text = f"Your answer: {self.current_word['user_answer']}"
-            answer_display = self.font.render(answer_text, True, CYAN)
+            answer_display = self.render_text(self.font, answer_text, True, CYAN)
             answer_rect = answer_display.get_rect(center=(WINDOW_WIDTH // 2, 300))
             self.screen.blit(answer_display, answer_rect)
             
             # Instructions
-            inst_text = self.small_font.render("Type your answer and press ENTER, ESC to exit", True, WHITE)
+            inst_text = self.render_text(self.small_font, "Type your answer and press ENTER, ESC to exit", True, WHITE)
             inst_rect = inst_text.get_rect(center=(WINDOW_WIDTH // 2, 500))
             self.screen.blit(inst_text, inst_rect)
     
-    def run(self):
-        """Main game loop"""
-        running = True
-        
-        while running:
-            running = self.handle_input()
-            
-            if self.state == GameState.PLAYING:
-                self.update_snake()
-                self.draw_game()
-            elif self.state == GameState.MENU:
-                self.draw_menu()
-            elif self.state == GameState.CATEGORY_SELECT:
-                self.draw_category_select()
-            elif self.state == GameState.EDUCATION_GAME_SELECT:
-                self.draw_education_game_select()
-            elif self.state == GameState.EDUCATION_GAME_PLAYING:
-                self.update_education_games()
-                self.draw_education_games()
-            elif self.state == GameState.PYTHON_GAME_SELECT:
-                self.draw_python_game_select()
-            elif self.state == GameState.PYTHON_GAME_PLAYING:
-                self.update_python_games()
-                self.draw_python_games()
-            elif self.state == GameState.GAME_OVER:
-                self.draw_game_over()
-            elif self.state == GameState.PAUSED:
-                self.draw_paused()
+    def wait_for_input(self, timeout_ms: int) -> list:
+        """Sleep until events arrive or timeout_ms passes; returns the events, if any"""
+        # pygame.event.wait(timeout) re-polls SDL every millisecond, which burns
+        # more CPU than the redraws it saves; sleep in IDLE_POLL_MS slices instead
+        deadline = pygame.time.get_ticks() + timeout_ms
+        while True:
+            events = pygame.event.get()
+            remaining = deadline - pygame.time.get_ticks()
+            if events or remaining <= 0:
+                return events
+            pygame.time.wait(min(IDLE_POLL_MS, remaining))
+    
+    def frame(self) -> bool:
+        """One pass of the main loop; False once the game should quit"""
+        profiler = self.profiler
+        profiler.start_frame()
+        pending = []
+        redraw_ms = IDLE_REDRAW_MS.get(self.state) if self.idle_waits else None
+        if redraw_ms is not None:
+            # Nothing moves on this screen: sleep until a key or the next animation tick
+            pending = self.wait_for_input(redraw_ms)
+            profiler.lap("wait")
+        running = self.handle_input(pending)
+        profiler.lap("event")
+        
+        if self.state == GameState.PLAYING:
+            scene = GameState.PLAYING
+            self.scenes.update(scene)
+            profiler.lap("update")
+            # The renderer pushes its own dirty rects as part of draw
+            self.scenes.draw(scene)
+            panel = self.draw_profiler_overlay(scene)
+            profiler.lap("draw")
+            if panel:
+                pygame.display.update(panel)
+                profiler.lap("flip")
+            self.clock.tick(RENDER_FPS)
+        else:
+            # The snake is frozen; don't bank the time for later
+            self.scheduler.resync()
+            scene = self.active_scene()
+            self.scenes.update(scene)
+            profiler.lap("update")
+            self.scenes.draw(scene)
+            self.draw_profiler_overlay(scene)
+            profiler.lap("draw")
             
+            # Anything but the playfield was drawn over the board
+            self.renderer.invalidate()
             pygame.display.flip()
+            profiler.lap("flip")
             self.clock.tick(FPS)
+        profiler.lap("wait")
+        profiler.end_frame(scene)
+        return running
+    
+    def run(self):
+        """Main game loop"""
+        while self.frame():
+            pass
         
+        profiler = self.profiler
+        self.save_recording()
+        self.question_bank.close()
+        profiler.close()
+        if self.show_scene_stats:
+            print("\n".join(self.scenes.report()))
         pygame.quit()
         sys.exit()
 
+def board_size(text: str) -> Tuple[int, int]:
+    """Parse a WIDTHxHEIGHT board size argument"""
+    import argparse
+    try:
+        width, height = (int(part) for part in text.lower().split("x"))
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"expected WIDTHxHEIGHT, got {text!r}")
+    if not (2 <= width <= MAX_BOARD_SIZE and 2 <= height <= MAX_BOARD_SIZE):
+        raise argparse.ArgumentTypeError(f"board sides must be between 2 and {MAX_BOARD_SIZE}")
+    return width, height
+
+def bot_list(text: str) -> List[str]:
+    """Parse a comma-separated --bots argument"""
+    import argparse
+    from snake_core.tournament import check_strategies
+    bots = [name.strip() for name in text.split(",") if name.strip()]
+    try:
+        check_strategies(bots)
+    except ValueError as error:
+        raise argparse.ArgumentTypeError(str(error))
+    return bots
+
+def replay_headless(path: str):
+    """Replay a recorded session at full speed without a window"""
+    player = ReplayPlayer.load(path)
+    start = time.perf_counter()
+    engine = player.run()
+    elapsed = time.perf_counter() - start
+    print(f"🎬 Replayed {path}")
+    print(f"   Final score: {engine.score}  Level: {engine.level}  Length: {len(engine.snake)}")
+    print(f"   {engine.ticks} ticks in {elapsed * 1000:.1f} ms")
+
 def main():
     """Main function"""
+    import argparse  # Only the command line needs it; keeps `import snake_evolution` fast
+    parser = argparse.ArgumentParser(description="Snake Evolution - EduVerse")
+    parser.add_argument("--record", metavar="FILE", help="record this session to a replay file")
+    parser.add_argument("--replay", metavar="FILE", help="watch a recorded session")
+    parser.add_argument("--speed", type=float, default=1.0, help="replay speed multiplier")
+    parser.add_argument("--scene-stats", action="store_true", help="print per-scene frame timings on exit")
+    parser.add_argument("--board", type=board_size, default=(GRID_WIDTH, GRID_HEIGHT), metavar="WxH",
+                        help="board size in cells, e.g. 1000x1000 for marathon mode (camera follows the head)")
+    parser.add_argument("--profile", action="store_true", help="show the frame profiler overlay (F3 toggles)")
+    parser.add_argument("--trace", metavar="FILE", help="write per-frame timings to FILE (.csv or .jsonl)")
+    parser.add_argument("--autopilot", choices=STRATEGIES, help="let the computer play (attract mode)")
+    parser.add_argument("--accuracy", type=float, default=0.8, help="autopilot share of correct answers")
+    parser.add_argument("--headless", action="store_true", help="replay at full speed without a window")
+    parser.add_argument("--tournament", type=int, metavar="MATCHES",
+                        help="play MATCHES headless bot-vs-bot arena matches and print win rates")
+    parser.add_argument("--bots", type=bot_list, default=list(STRATEGIES), metavar="LIST",
+                        help="comma-separated autopilot strategies for --tournament")
+    parser.add_argument("--workers", type=int, help="tournament worker processes (default: one per core)")
+    parser.add_argument("--seed", type=int, default=0, help="tournament base seed")
+    args = parser.parse_args()
+    
+    if args.replay and args.headless:
+        replay_headless(args.replay)
+        return
+    if args.tournament:
+        from snake_core.tournament import run_tournament
+        result = run_tournament(args.bots, args.tournament, args.workers, args.seed)
+        print("\n".join(result.lines()))
+        return
+    
     print("🐍 Starting Snake Evolution...")
     print("Part of EduVerse: The 10 Realms of Genius")
     print("Learn math while playing the classic Snake game!")
     print()
     
     try:
-        game = SnakeGame()
+        autopilot = Autopilot(args.autopilot, args.accuracy) if args.autopilot else None
+        game = SnakeGame(record_path=args.record, show_scene_stats=args.scene_stats, autopilot=autopilot,
+                         show_profiler=args.profile, trace_path=args.trace, board_size=args.board)
+        if args.replay:
+            game.play_replay(args.replay, args.speed)
+            pygame.quit()
+            return
+        if autopilot is not None:
+            game.start_game()
         game.run()
     except Exception as e:
         print(f"Error starting game: {e}")
@@ -0,0 +1,139 @@
+#!/usr/bin/env python3
+"""
+Test script for the prefetching question bank
+- Generators produce well-formed questions
+- Buffers are refilled in the background and underruns are counted
+- New subjects can appear while the worker is refilling
+- The worker and get() never generate at the same time
+- SnakeGame's per-subject question methods are served by the bank
+"""
+
+import os
+import random
+import sys
+import threading
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from snake_core import questions
+from snake_core.questions import QuestionBank
+
+
+def test_generators_are_well_formed():
+    """Every subject and level yields four distinct options including the answer"""
+    rng = random.Random(0)
+    for subject, generate in questions.GENERATORS.items():
+        for level in range(1, 10):
+            for _ in range(50):
+                question = generate(level, rng)
+                assert question.subject == subject
+                assert question.answer in question.options
+                assert len(set(question.options)) == len(question.options) == 4
+    print("✅ generators well formed")
+
+
+def test_bank_serves_from_buffer():
+    """Prefetched questions are served without generating on demand"""
+    bank = QuestionBank(capacity=8, low_water=2, background=False, seed=1)
+    bank.prefetch([("math", 1), ("science", 1)])
+    for _ in range(20):
+        question = bank.get("math", 1)
+        assert question.answer in question.options
+    stats = bank.stats()
+    assert stats['served'] == 20
+    assert stats['underruns'] == 0
+    print(f"✅ bank served from buffer: {stats}")
+
+
+def test_background_refill_and_underruns():
+    """A cold key underruns once, then the worker keeps it stocked"""
+    bank = QuestionBank(capacity=8, low_water=4, seed=2)
+    try:
+        bank.get("history", 2)
+        assert bank.underruns == 1
+        deadline = time.time() + 2
+        while bank.stats()['buffered'] < 8 and time.time() < deadline:
+            time.sleep(0.01)
+        assert bank.stats()['buffered'] == 8
+        for _ in range(4):
+            bank.get("history", 2)
+        assert bank.underruns == 1
+    finally:
+        bank.close()
+    print("✅ background refill works")
+
+
+def test_recent_repeats_avoided():
+    """The same question does not come up twice in a row"""
+    bank = QuestionBank(capacity=4, low_water=1, recent=2, background=False, seed=3)
+    served = [bank.get("geography", 1).question for _ in range(60)]
+    assert all(a != b for a, b in zip(served, served[1:]))
+    print("✅ no back-to-back repeats")
+
+
+def test_new_keys_while_worker_refills():
+    """get() adding buffers mid-refill does not break the background worker"""
+    errors = []
+    hook, threading.excepthook = threading.excepthook, errors.append
+    bank = QuestionBank(capacity=8, low_water=4, seed=5)
+    try:
+        for level in range(1, 400):
+            for subject in questions.GENERATORS:
+                bank.get(subject, level)
+        assert bank._worker.is_alive()
+    finally:
+        bank.close()
+        threading.excepthook = hook
+    assert not errors, [error.exc_value for error in errors]
+    print("✅ worker survives new keys")
+
+
+def test_generation_is_serialized():
+    """Underruns in get() and worker refills take turns on the shared rng and counters"""
+    active, overlaps = [0], []
+
+    def slow_math(difficulty, rng):
+        active[0] += 1
+        if active[0] > 1:
+            overlaps.append(active[0])
+        time.sleep(0.0005)
+        active[0] -= 1
+        return questions.generate_math_question(difficulty, rng)
+
+    bank = QuestionBank({"math": slow_math}, capacity=4, low_water=3, seed=6)
+    try:
+        for level in range(1, 60):
+            bank.get("math", level)
+    finally:
+        bank.close()
+    assert not overlaps, overlaps
+    print(f"✅ generation serialized ({bank.generated} generated)")
+
+
+def test_game_subject_questions_use_bank():
+    """generate_<subject>_question goes through the bank, not straight to the generator"""
+    from snake_evolution import SnakeGame
+
+    game = SnakeGame()
+    try:
+        for subject in questions.GENERATORS:
+            served = game.question_bank.served
+            question = getattr(game, f"generate_{subject}_question")(2)
+            assert question.subject == subject
+            assert game.question_bank.served == served + 1
+    finally:
+        game.question_bank.close()
+    print("✅ subject questions come from the bank")
+
+
+if __name__ == "__main__":
+    test_generators_are_well_formed()
+    test_bank_serves_from_buffer()
+    test_background_refill_and_underruns()
+    test_recent_repeats_avoided()
+    test_new_keys_while_worker_refills()
+    test_generation_is_serialized()
+    test_game_subject_questions_use_bank()
+    print("\n🎉 All question bank tests passed!")
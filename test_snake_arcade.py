@@ -0,0 +1,274 @@
+#!/usr/bin/env python3
+"""
+Test script for the Snake Evolution arcade mini-games
+- Spatial hash finds the same collisions as checking every pair
+- Entity pools reuse slots and keep memory bounded
+- The NumPy zombie horde seeks, separates and despawns
+- The Ball Run physics world bounces, substeps and expires obstacles
+- The baked Car Racing road scrolls like the road drawn from primitives
+- Runs under the SDL dummy video driver
+"""
+
+import os
+import random
+import sys
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from snake_core.physics import PhysicsWorld
+from snake_core.pool import EntityPool
+from snake_core.spatial import SpatialHash
+
+
+def test_spatial_hash_matches_brute_force():
+    """Every point within the radius is in the queried buckets"""
+    rng = random.Random(1)
+    points = [(rng.uniform(-50, 850), rng.uniform(-50, 650)) for _ in range(2000)]
+    grid = SpatialHash(40)
+    xs, ys = [x for x, _ in points], [y for _, y in points]
+    grid.build_columns(range(len(points)), xs, ys)
+    for _ in range(300):
+        x, y = rng.uniform(0, 800), rng.uniform(0, 600)
+        near = {i for bucket in grid.query(x, y, 20) for i in bucket}
+        expected = {i for i, (px, py) in enumerate(points) if abs(px - x) < 20 and abs(py - y) < 20}
+        assert expected <= near
+    print("✅ spatial hash finds every nearby point")
+
+
+def test_shooter_collisions():
+    """Each bullet destroys at most one overlapping enemy and scores"""
+    from snake_evolution import SnakeGame
+
+    game = SnakeGame()
+    game.init_space_shooter()
+    game.enemy_spawn_timer = -1000
+    for x, y in [(100, 97), (105, 97), (400, 297), (700, 47)]:
+        game.enemies.spawn(x, y, vy=3)
+    for x, y in [(100, 110), (400, 310), (600, 310)]:
+        game.bullets.spawn(x, y, vy=-10)
+    game.update_space_shooter()
+
+    assert game.shooter_score == 20
+    enemies = sorted((game.enemies.x[i], game.enemies.y[i]) for i in game.enemies)
+    assert enemies == [(105, 100), (700, 50)]
+    assert [(game.bullets.x[i], game.bullets.y[i]) for i in game.bullets] == [(600, 300)]
+
+    # Stress mode tops both pools up every frame
+    game.shooter_stress = True
+    game.update_space_shooter()
+    destroyed = (game.shooter_score - 20) // 10
+    assert destroyed > 0
+    assert len(game.enemies) + destroyed <= 1000
+    game.update_space_shooter()
+    assert len(game.bullets) <= 1000
+    game.question_bank.close()
+    print("✅ shooter collisions resolved through the grid")
+
+
+def test_entity_pool_reuses_slots():
+    """Freed slots are handed out again before fresh ones, and capacity is a hard limit"""
+    pool = EntityPool(4)
+    slots = [pool.spawn(i, 0) for i in range(4)]
+    assert slots == [0, 1, 2, 3]
+    assert pool.spawn(9, 9) == -1
+    pool.kill(2)
+    pool.kill(0)
+    assert list(pool) == [1, 3]
+    assert pool.spawn(5, 5) == 0
+    pool.kill(3)
+    assert pool.high == 2
+    assert len(pool) == 2
+    print("✅ entity pool reuses slots")
+
+
+def test_entity_pool_bulk_updates():
+    """move, cull, seek and near act on every live entity"""
+    pool = EntityPool(8)
+    pool.spawn(0, 0, vx=1, vy=2)
+    pool.spawn(10, 10, vy=-20)
+    pool.move()
+    assert (pool.x[0], pool.y[0]) == (1, 2)
+    assert pool.cull(0, 0, 100, 100) == 1
+    assert list(pool) == [0]
+    pool.seek(5, 0, 1)
+    assert (pool.x[0], pool.y[0]) == (2, 1)
+    assert pool.near(2, 2, 2) == [0]
+    assert pool.near(9, 9, 2) == []
+    print("✅ entity pool bulk updates")
+
+
+def test_mini_games_stay_bounded():
+    """Long sessions never grow the entity pools past their capacity"""
+    from snake_evolution import SnakeGame
+
+    game = SnakeGame()
+    game.init_ball_run()
+    game.init_car_racing()
+    game.init_zombie_dash()
+    for _ in range(5000):
+        game.update_ball_run()
+        game.update_car_racing()
+        game.update_zombie_dash()
+    assert len(game.obstacles_ball) <= game.obstacles_ball.capacity
+    assert len(game.obstacles) < game.obstacles.capacity
+    assert game.racing_score > 0
+    assert len(game.zombies) <= game.zombies.capacity
+    game.question_bank.close()
+    print("✅ mini-game pools stay bounded")
+
+
+def test_horde_seek_collide_despawn():
+    """Zombies step towards the player, and those reaching it are removed and counted"""
+    import numpy as np
+    from snake_core.horde import Horde
+
+    horde = Horde(8, 800, 600, spacing=1000.0, push=0.0)
+    horde.spawn(3)
+    horde.pos[:3] = [[100, 100], [410, 310], [790, 10]]
+    hits = horde.update(400, 300)
+    assert hits == 1
+    assert len(horde) == 2
+    assert np.allclose(horde.positions, [[101, 101], [789, 11]])
+
+    # Anything pushed off the arena disappears
+    horde.pos[0] = [-5, 50]
+    horde.update(400, 300)
+    assert len(horde) == 1
+    print("✅ horde seek, collision and despawn")
+
+
+def test_horde_separation_spreads_crowd():
+    """Zombies sharing a cell are pushed apart"""
+    import numpy as np
+    from snake_core.horde import Horde
+
+    horde = Horde(4, 800, 600, speed=0.0, spacing=32.0, push=0.5, reach=0.0)
+    horde.spawn(2)
+    horde.pos[:2] = [[100, 100], [104, 100]]
+    horde.update(400, 300)
+    assert np.allclose(horde.positions, [[99, 100], [105, 100]])
+    print("✅ horde separation")
+
+
+def test_zombie_dash_horde_mode():
+    """Horde mode replaces the classic zombies, fills up to thousands and draws them"""
+    from snake_evolution import HORDE_SPAWN_PER_FRAME, SnakeGame
+
+    game = SnakeGame()
+    game.init_zombie_dash()
+    game.zombies.spawn(100, 100)
+    game.toggle_horde_mode()
+    assert len(game.zombies) == 0
+    for _ in range(30):
+        game.update_zombie_dash()
+    assert len(game.horde) > 20 * HORDE_SPAWN_PER_FRAME
+    assert game.player_health <= 100
+    game.draw_zombie_dash()
+    game.toggle_horde_mode()
+    assert game.horde is None
+    game.question_bank.close()
+    print("✅ Zombie Dash horde mode")
+
+
+def test_physics_wall_and_obstacle_bounce():
+    """Bodies stay inside the walls and are pushed out of obstacles, losing speed on impact"""
+    world = PhysicsWorld(200, 100, restitution=0.5)
+    ball = world.add_body(190, 50, 5)
+    ball.vx = 600.0
+    world.step(0.1)
+    assert ball.radius <= ball.x <= 200 - ball.radius
+    assert -300 - 1e-9 <= ball.vx < 0
+
+    world.clear()
+    ball = world.add_body(50, 50, 5)
+    ball.vx = 100.0
+    slot = world.add_obstacle(70, 50, 10, lifetime=5.0)
+    result = world.step(0.2)
+    assert result.hits == [slot]
+    assert world.step(0.1).hits == []
+    assert ball.vx < 0
+    assert ball.x <= 70 - 15 + 1e-9
+    print("✅ physics walls and obstacles bounce")
+
+
+def test_physics_bodies_exchange_momentum():
+    """Equal bodies colliding head-on with restitution 1 swap velocities"""
+    world = PhysicsWorld(400, 100, restitution=1.0)
+    a = world.add_body(100, 50, 10)
+    b = world.add_body(200, 50, 10)
+    a.vx, b.vx = 100.0, -100.0
+    for _ in range(10):
+        world.step(0.1)
+    assert a.vx < 0 < b.vx
+    assert abs(a.vx + 100) < 1e-6 and abs(b.vx - 100) < 1e-6
+    print("✅ physics bodies exchange momentum")
+
+
+def test_physics_substeps_are_frame_rate_independent():
+    """The same elapsed time gives the same state however it is split into frames"""
+    def run(frames):
+        world = PhysicsWorld(300, 300, damping=0.5)
+        ball = world.add_body(150, 150, 10)
+        ball.vx, ball.vy = 700.0, -400.0
+        ball.ay = 200.0
+        world.add_obstacle(220, 100, 15, lifetime=10.0)
+        for _ in range(frames):
+            world.step(2.0 / frames)
+        return ball.x, ball.y, ball.vx, ball.vy
+
+    assert run(20) == run(60) == run(240)
+    print("✅ physics substeps independent of frame rate")
+
+
+def test_physics_obstacles_expire():
+    """Obstacles vanish when their lifetime runs out; untouched ones count as dodged"""
+    world = PhysicsWorld(800, 600, max_obstacles=4)
+    world.add_body(10, 10, 5)
+    for x in (200, 300, 400, 500):
+        assert world.add_obstacle(x, 300, 20, lifetime=1.0) >= 0
+    assert world.add_obstacle(600, 300, 20, lifetime=1.0) == -1
+    assert sum(world.step(0.1).dodged for _ in range(5)) == 0
+    assert len(world.obstacles) == 4
+    assert sum(world.step(0.1).dodged for _ in range(6)) == 4
+    assert len(world.obstacles) == 0
+    print("✅ physics obstacles expire")
+
+
+def test_baked_road_matches_primitives():
+    """Every scroll offset of the pre-rendered road equals painting the road at that offset"""
+    import pygame
+    from snake_evolution import SnakeGame, ROAD_TILE, ROAD_SCROLL_SPEED
+
+    game = SnakeGame()
+    game.init_car_racing()
+    width, height = game.screen.get_size()
+    painted = pygame.Surface((width, height))
+    for offset in range(0, ROAD_TILE, ROAD_SCROLL_SPEED):
+        game.road_offset = offset
+        game.screen.blit(game.road_surface, (0, offset - ROAD_TILE))
+        game.paint_road(painted, offset)
+        assert pygame.image.tostring(game.screen, "RGB") == pygame.image.tostring(painted, "RGB"), offset
+    for _ in range(25):
+        game.update_car_racing()
+        assert 0 <= game.road_offset < ROAD_TILE
+    game.draw_car_racing()
+    game.question_bank.close()
+    print("✅ baked road matches the primitive road")
+
+
+if __name__ == "__main__":
+    test_spatial_hash_matches_brute_force()
+    test_shooter_collisions()
+    test_entity_pool_reuses_slots()
+    test_entity_pool_bulk_updates()
+    test_mini_games_stay_bounded()
+    test_horde_seek_collide_despawn()
+    test_horde_separation_spreads_crowd()
+    test_zombie_dash_horde_mode()
+    test_physics_wall_and_obstacle_bounce()
+    test_physics_bodies_exchange_momentum()
+    test_physics_substeps_are_frame_rate_independent()
+    test_physics_obstacles_expire()
+    test_baked_road_matches_primitives()
+    print("\n🎉 All arcade tests passed!")
@@ -0,0 +1,155 @@
+#!/usr/bin/env python3
+"""
+Test script for the Snake Evolution multi-snake arena
+- Walls, bodies and head-to-head meetings kill by the arena rules
+- Starting bodies must fit inside the board
+- Bots share the occupancy grid and matches replay exactly from their seed
+- Tournaments give the same results in one process or across a pool
+- Too few, repeated or unknown strategies are rejected before any match
+- The arena mini-game plays in SnakeGame
+"""
+
+import os
+import sys
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from snake_core.arena import Arena, play_match
+from snake_core.engine import Direction
+from snake_core.tournament import check_strategies, lineups, match_seed, run_tournament
+
+
+def place(arena, index, segments, direction):
+    """Move a snake to new cells, head first"""
+    snake = arena.snakes[index]
+    for x, y in snake.snake:
+        arena.occupancy[y * arena.width + x] = 0
+    snake.snake.clear()
+    snake.snake.extend(segments)
+    for x, y in segments:
+        arena.occupancy[y * arena.width + x] = snake.number
+    snake.direction = snake.next_direction = direction
+
+
+def test_body_and_wall_collisions():
+    """Running into another snake's body or a wall is fatal; dead snakes leave the board"""
+    arena = Arena([None, None, None], width=12, height=9, seed=1, food=0)
+    place(arena, 0, [(5, 2), (4, 2), (3, 2)], Direction.DOWN)
+    place(arena, 1, [(6, 3), (5, 3), (4, 3)], Direction.RIGHT)
+    place(arena, 2, [(11, 7), (10, 7), (9, 7)], Direction.RIGHT)
+    died = arena.step()
+    assert died == [arena.snakes[0], arena.snakes[2]]
+    assert arena.over and arena.winner() is arena.snakes[1]
+    assert sum(1 for cell in arena.occupancy if cell) == 3
+    print("✅ body and wall collisions")
+
+
+def test_head_to_head():
+    """Heads meeting in one cell: the longer snake survives, equal lengths both die"""
+    arena = Arena([None, None], width=12, height=9, seed=1, food=0)
+    place(arena, 0, [(4, 4), (3, 4), (2, 4), (1, 4)], Direction.RIGHT)
+    place(arena, 1, [(6, 4), (7, 4), (8, 4)], Direction.LEFT)
+    assert arena.step() == [arena.snakes[1]]
+    assert arena.snakes[0].snake[0] == (5, 4)
+
+    arena = Arena([None, None], width=12, height=9, seed=1, food=0)
+    place(arena, 0, [(4, 4), (3, 4), (2, 4)], Direction.RIGHT)
+    place(arena, 1, [(6, 4), (7, 4), (8, 4)], Direction.LEFT)
+    assert len(arena.step()) == 2
+    assert arena.over and arena.winner() is None
+    print("✅ head-to-head rules")
+
+
+def test_start_must_fit_the_board():
+    """Boards too narrow for the starting bodies are refused; the tightest fit places cleanly"""
+    for width, start_length in ((12, 5), (7, 3), (11, 4)):
+        try:
+            Arena([None, None], width=width, height=10, start_length=start_length)
+        except ValueError:
+            pass
+        else:
+            raise AssertionError(f"{width} wide accepted {start_length}-cell snakes")
+    for width, start_length in ((12, 4), (8, 3)):
+        arena = Arena([None, None], width=width, height=10, start_length=start_length, food=0)
+        for snake in arena.snakes:
+            assert all(0 <= x < width for x, _ in snake.snake)
+        assert sum(1 for cell in arena.occupancy if cell) == 2 * start_length
+    print("✅ starting snakes fit the board")
+
+
+def test_eating_grows_and_respawns_food():
+    """Food leaves the tail in place and a new one appears"""
+    arena = Arena([None, None], width=12, height=9, seed=4, food=0)
+    arena.foods.append((arena.snakes[0].snake[0][0] + 1, arena.snakes[0].snake[0][1]))
+    arena.step()
+    assert len(arena.snakes[0].snake) == 4 and arena.snakes[0].eaten == 1
+    assert len(arena.foods) == 1
+    print("✅ eating grows the snake")
+
+
+def test_matches_are_deterministic():
+    """The same seed plays out the same match"""
+    first = play_match(("astar", "greedy"), seed=11, width=20, height=15, max_ticks=300)
+    again = play_match(("astar", "greedy"), seed=11, width=20, height=15, max_ticks=300)
+    assert first == again
+    assert first.ticks <= 300 and len(first.lengths) == 2
+    assert match_seed(0, 5) == match_seed(0, 5) != match_seed(0, 6)
+    print(f"✅ match replays from its seed ({first.ticks} ticks)")
+
+
+def test_tournament_matches_across_workers():
+    """A process pool gives the same results and win rates as playing in-process"""
+    strategies = ["greedy", "astar", "hamiltonian"]
+    assert lineups(strategies, 7)[6] == ("greedy", "astar")
+    local = run_tournament(strategies, matches=12, workers=1, base_seed=3, width=16, height=12, max_ticks=150)
+    pooled = run_tournament(strategies, matches=12, workers=2, base_seed=3, width=16, height=12, max_ticks=150)
+    assert local.results == pooled.results
+    tally = local.tally()
+    assert all(row["played"] == 8 for row in tally.values())
+    assert sum(row["won"] for row in tally.values()) + sum(r.winner is None for r in local.results) == 12
+    assert local.lines()[1].startswith("strategy")
+    print("✅ tournament is deterministic across workers")
+
+
+def test_tournament_rejects_bad_lineups():
+    """A single bot, a repeated bot or an unknown name fails up front with ValueError"""
+    for strategies in (["astar"], ["astar", "astar"], ["astar", "nosuchbot"], []):
+        try:
+            run_tournament(strategies, matches=2, workers=2)
+        except ValueError:
+            pass
+        else:
+            raise AssertionError(f"{strategies} was accepted")
+    check_strategies(["greedy", "astar"])
+    print("✅ bad tournament lineups rejected")
+
+
+def test_arena_in_snake_game():
+    """The arena mini-game steps bots and steers the player with the arrows"""
+    import pygame
+    from snake_evolution import SnakeGame
+
+    game = SnakeGame()
+    game.current_python_game = "snake_arena"
+    game.start_python_game()
+    assert game.arena.snakes[0].bot is None
+    game.handle_arena_input(pygame.event.Event(pygame.KEYDOWN, key=pygame.K_UP))
+    assert game.arena.snakes[0].next_direction == Direction.UP
+    for _ in range(5):
+        game.scenes.frame("snake_arena")
+    assert game.arena.ticks == 5
+    game.question_bank.close()
+    print("✅ arena mini-game runs")
+
+
+if __name__ == "__main__":
+    test_body_and_wall_collisions()
+    test_head_to_head()
+    test_start_must_fit_the_board()
+    test_eating_grows_and_respawns_food()
+    test_matches_are_deterministic()
+    test_tournament_matches_across_workers()
+    test_tournament_rejects_bad_lineups()
+    test_arena_in_snake_game()
+    print("\n🎉 All arena tests passed!")
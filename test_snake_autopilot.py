@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+"""
+Test script for the Snake Evolution autopilot
+- Every strategy plays legal games on the headless engine
+- A* only counts the tail as reachable through a free cell, and outlives greedy
+- The Hamiltonian strategy fills the board
+- Answer accuracy is configurable
+"""
+
+import os
+import sys
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from snake_core.autopilot import Autopilot, STRATEGIES, hamiltonian_cycle, neighbor_table
+from snake_core.engine import SnakeEngine, Event, Question
+
+
+def test_hamiltonian_cycle_is_a_tour():
+    """Consecutive cells are adjacent and every cell is visited once"""
+    for width, height in [(2, 2), (6, 4), (5, 4), (4, 7), (40, 30)]:
+        cycle = hamiltonian_cycle(width, height)
+        assert sorted(cycle) == list(range(width * height))
+        for a, b in zip(cycle, cycle[1:] + cycle[:1]):
+            assert abs(a % width - b % width) + abs(a // width - b // width) == 1
+    assert hamiltonian_cycle(5, 5) is None
+    print("✅ Hamiltonian cycles are closed tours")
+
+
+def test_strategies_grow_the_snake():
+    """Each strategy eats a good amount of food before anything goes wrong"""
+    for strategy in STRATEGIES:
+        lengths = []
+        for seed in range(3):
+            engine = SnakeEngine(12, 10, seed=seed)
+            Autopilot(strategy, seed=seed).play(engine, max_ticks=3000)
+            lengths.append(len(engine.snake))
+        assert min(lengths) >= 10, (strategy, lengths)
+        print(f"✅ {strategy} reaches lengths {lengths}")
+
+
+def test_tail_needs_a_free_cell_in_between():
+    """The head cannot step straight onto its tail, so adjacency alone is not reachable"""
+    autopilot = Autopilot("astar")
+    autopilot.neighbors = neighbor_table(2, 2)
+    # Tail in cell 0, head in cell 1; cell 3 under the head is free
+    assert autopilot._reachable(bytearray([1, 1, 0, 0]), 1, 0)
+    assert not autopilot._reachable(bytearray([1, 1, 1, 0]), 1, 0)
+    print("✅ tail reachability needs a free cell")
+
+
+def test_astar_outlives_greedy():
+    """With the tail check taking growth into account, A* fills a small board greedy dies on"""
+    for seed in range(2):
+        lengths = {}
+        for strategy in ("greedy", "astar"):
+            engine = SnakeEngine(10, 10, seed=seed)
+            Autopilot(strategy, seed=seed).play(engine, max_ticks=20000)
+            lengths[strategy] = len(engine.snake)
+        assert lengths["astar"] >= 90 and lengths["astar"] > lengths["greedy"], (seed, lengths)
+        print(f"✅ seed {seed}: astar reaches {lengths['astar']}, greedy {lengths['greedy']}")
+
+
+def test_hamiltonian_fills_board():
+    """Following the tour never dies and ends with a full board"""
+    engine = SnakeEngine(8, 6, seed=4)
+    events = Autopilot("hamiltonian").play(engine)
+    assert Event.BOARD_FULL in events
+    assert len(engine.snake) == 8 * 6
+    print("✅ Hamiltonian autopilot fills the board")
+
+
+def test_answer_accuracy():
+    """Accuracy 1 always answers right, accuracy 0 never does"""
+    question = Question(question="2 + 2 = ?", answer=4, options=[3, 4, 5, 6], difficulty=1, subject="math")
+    assert all(Autopilot(accuracy=1.0, seed=1).choose_answer(question) == 1 for _ in range(50))
+    wrong = Autopilot(accuracy=0.0, seed=1)
+    assert all(wrong.choose_answer(question) != 1 for _ in range(50))
+    print("✅ answer accuracy respected")
+
+
+def test_autopilot_drives_snake_game():
+    """In SnakeGame the autopilot steers through the normal input path and answers questions"""
+    from snake_evolution import GameState, SnakeGame
+
+    game = SnakeGame(autopilot=Autopilot("astar", accuracy=1.0, seed=0))
+    game.start_game()
+    for _ in range(400):
+        game.steer(game.autopilot.decide(game.engine))
+        game.step_snake()
+        assert game.state == GameState.PLAYING
+    assert game.questions_correct > 0
+    assert game.questions_correct == game.questions_total
+    game.question_bank.close()
+    print(f"✅ autopilot played SnakeGame to score {game.score}")
+
+
+if __name__ == "__main__":
+    test_hamiltonian_cycle_is_a_tour()
+    test_strategies_grow_the_snake()
+    test_tail_needs_a_free_cell_in_between()
+    test_astar_outlives_greedy()
+    test_hamiltonian_fills_board()
+    test_answer_accuracy()
+    test_autopilot_drives_snake_game()
+    print("\n🎉 All autopilot tests passed!")
@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+"""
+Test script for the batched NumPy Snake boards
+- Rules must match the single-board SnakeEngine
+- Board state stays consistent across thousands of boards
+"""
+
+import os
+import sys
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+import numpy as np
+
+from snake_core.batch import BatchSnakeEnv, DIRECTIONS, KEEP
+from snake_core.engine import SnakeEngine, Direction, Event, Question
+
+
+def test_batch_matches_engine():
+    """One batched board follows the same trajectory as SnakeEngine"""
+    rng = np.random.default_rng(5)
+    width, height = 12, 9
+    question = Question(question="?", answer=1, options=[1, 2], difficulty=1, subject="math")
+
+    for game in range(20):
+        engine = SnakeEngine(width, height, question_source=lambda level: question, seed=game)
+        env = BatchSnakeEnv(1, width, height, questions=True, seed=game)
+        env.food[0] = engine.food_pos[1] * width + engine.food_pos[0]
+
+        for _ in range(300):
+            if engine.current_question is not None:
+                correct = bool(rng.integers(0, 2))
+                events = engine.answer_question(0 if correct else 1)
+                level_up = env.answer(np.array([correct]))
+                assert level_up[0] == (Event.LEVEL_UP in events)
+            else:
+                action = int(rng.integers(-1, 4))
+                events = engine.step(None if action == KEEP else DIRECTIONS[action])
+                batch = env.step(np.array([action]))
+                assert batch.died[0] == (Event.DIED in events)
+                assert batch.ate_food[0] == (Event.ATE_FOOD in events)
+
+            # Share the food position so both boards see the same game
+            if engine.food_pos is not None:
+                env.food[0] = engine.food_pos[1] * width + engine.food_pos[0]
+
+            assert env.alive[0] == engine.alive
+            if not engine.alive:
+                break
+            head_x, head_y = engine.snake[0]
+            assert env.heads[0] == head_y * width + head_x
+            assert env.length[0] == len(engine.snake)
+            assert env.score[0] == engine.score
+            assert env.level[0] == engine.level
+            assert env.move_delay[0] == engine.move_delay
+    print("✅ batched rules match SnakeEngine")
+
+
+def test_many_boards_stay_consistent():
+    """Occupancy, lengths and observations agree on every board"""
+    env = BatchSnakeEnv(2000, 10, 8, seed=1)
+    rng = np.random.default_rng(2)
+    for _ in range(200):
+        env.step(rng.integers(-1, 4, size=env.num_boards))
+        env.reset(env.done & ~env.won)
+
+    assert (env.occupancy.sum(axis=1) == env.length).all()
+    live = env.alive
+    assert (env.occupancy[live, env.food[live]] == 0).all()
+
+    obs = env.observe()
+    assert obs.shape == (2000, 3, 8, 10)
+    assert (obs[:, 1].reshape(2000, -1).sum(axis=1) == 1).all()
+    print("✅ 2000 boards stay consistent")
+
+
+def test_full_board_is_reported():
+    """A board with no free cell left reports board_full and stops"""
+    env = BatchSnakeEnv(1, 2, 1, seed=0)
+    assert env.food[0] == 0
+    env.direction[0] = DIRECTIONS.index(Direction.LEFT)
+    events = env.step()
+    assert env.won[0]
+    assert events.board_full[0]
+    print("✅ full board reported")
+
+
+if __name__ == "__main__":
+    test_batch_matches_engine()
+    test_many_boards_stay_consistent()
+    test_full_board_is_reported()
+    print("\n🎉 All batch tests passed!")
@@ -0,0 +1,247 @@
+#!/usr/bin/env python3
+"""
+Test script for the headless Snake Evolution engine
+- Runs without pygame or a display
+- step() API, events and question flow
+- Buffered turns apply one per step
+"""
+
+import os
+import subprocess
+import sys
+import time
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from snake_core.engine import SnakeEngine, Direction, Event, Question
+from snake_core.scheduler import FixedStepScheduler
+
+
+def make_question():
+    return Question(question="2 + 2 = ?", answer=4, options=[3, 4, 5, 6],
+                    difficulty=1, subject="math")
+
+
+def test_engine_is_headless():
+    """Importing the engine must not pull in pygame"""
+    code = "import sys, snake_core.engine; sys.exit('pygame' in sys.modules)"
+    result = subprocess.run([sys.executable, "-c", code],
+                            cwd=os.path.dirname(os.path.abspath(__file__)))
+    assert result.returncode == 0
+    print("✅ snake_core.engine imports without pygame")
+
+
+def test_step_moves_and_dies_at_wall():
+    """The snake moves one cell per step and dies on the wall"""
+    engine = SnakeEngine(10, 10, seed=1)
+    engine.food_pos = (0, 0)
+    start_x, start_y = engine.snake[0]
+
+    assert engine.step() == [Event.MOVED]
+    assert engine.snake[0] == (start_x + 1, start_y)
+
+    events = []
+    while engine.alive:
+        events = engine.step()
+    assert events == [Event.DIED]
+    assert engine.step() == []
+    print("✅ step() moves and reports wall death")
+
+
+def test_reversal_is_ignored():
+    """Turning straight back onto the neck is rejected"""
+    engine = SnakeEngine(10, 10, seed=1)
+    assert not engine.turn(Direction.LEFT)
+    assert engine.turn(Direction.UP)
+    engine.step()
+    assert engine.direction == Direction.UP
+    print("✅ reversals are ignored")
+
+
+def test_buffered_turns_apply_one_per_step():
+    """UP then LEFT within one tick makes a U-turn over two steps; the queue is bounded"""
+    engine = SnakeEngine(10, 10, seed=1)
+    engine.food_pos = (0, 0)
+    x, y = engine.snake[0]
+    assert engine.queue_turn(Direction.UP, stamp=1.0)
+    assert engine.queue_turn(Direction.LEFT, stamp=2.0)
+    assert not engine.queue_turn(Direction.RIGHT)  # Reversal of the queued LEFT
+    assert not engine.queue_turn(Direction.LEFT)  # Already queued last
+
+    engine.step()
+    assert engine.snake[0] == (x, y - 1) and engine.turned_at == 1.0
+    engine.step()
+    assert engine.snake[0] == (x - 1, y - 1) and engine.turned_at == 2.0
+    engine.step()
+    assert engine.turned_at is None
+
+    for direction in (Direction.DOWN, Direction.RIGHT, Direction.UP, Direction.RIGHT):
+        engine.queue_turn(direction)
+    assert len(engine.turn_queue) == 3
+    engine.reset()
+    assert not engine.turn_queue
+    print("✅ buffered turns apply one per step")
+
+
+def test_eating_food_poses_question():
+    """Eating food with a question source freezes the snake until answered"""
+    engine = SnakeEngine(10, 10, question_source=lambda level: make_question(), seed=1)
+    head_x, head_y = engine.snake[0]
+    engine.food_pos = (head_x + 1, head_y)
+
+    events = engine.step()
+    assert Event.ATE_FOOD in events and Event.QUESTION in events
+    assert len(engine.snake) == 2
+    assert engine.step() == []
+
+    assert engine.answer_question(1) == [Event.CORRECT]
+    assert engine.score == 12
+    assert engine.food_pos is not None
+    assert engine.step() == [Event.MOVED]
+    print("✅ food -> question -> answer flow works")
+
+
+def test_occupancy_tracks_body():
+    """Growth adds a real segment and the occupancy grid mirrors the body"""
+    engine = SnakeEngine(10, 10, seed=1)
+    engine.food_pos = (0, 0)
+    engine.grow_snake()
+    engine.grow_snake()
+    for _ in range(3):
+        engine.step()
+
+    assert len(engine.snake) == 3
+    assert len(set(engine.snake)) == 3
+    assert sum(engine.occupancy) == 3
+    assert all(engine.is_occupied(cell) for cell in engine.snake)
+    print("✅ occupancy grid matches the body")
+
+
+def test_self_collision():
+    """Running into the body ends the game"""
+    engine = SnakeEngine(10, 10, seed=1)
+    engine.place_snake([(5, 5), (4, 5), (4, 6), (5, 6), (6, 6)])
+    engine.food_pos = (0, 0)
+    assert engine.step(Direction.DOWN) == [Event.DIED]
+    print("✅ self collision detected")
+
+
+def test_food_never_lands_on_snake():
+    """Food placement always picks a free cell, even on a crowded board"""
+    engine = SnakeEngine(20, 20, seed=3)
+    body = [(x, y) for y in range(20) for x in range(20)][:399]
+    engine.place_snake(reversed(body))
+    engine.generate_food()
+    assert engine.food_pos == (19, 19)
+    assert len(engine.free_cells) == 1
+    print("✅ food lands on the last free cell")
+
+
+def test_full_board_wins():
+    """Filling the board reports BOARD_FULL instead of hanging"""
+    engine = SnakeEngine(4, 1, seed=1)
+    engine.place_snake([(1, 0), (0, 0)])
+    engine.generate_food()
+
+    events = []
+    while engine.alive:
+        events = engine.step(Direction.RIGHT)
+    assert Event.BOARD_FULL in events
+    assert engine.food_pos is None
+    assert len(engine.snake) == 4
+    print("✅ full board ends the round with BOARD_FULL")
+
+
+def test_level_up_every_five_answers():
+    """Five correct answers raise the level and the speed"""
+    engine = SnakeEngine(10, 10, seed=1)
+    delay = engine.move_delay
+    for _ in range(5):
+        engine.ask(make_question())
+        events = engine.answer_question(1)
+    assert Event.LEVEL_UP in events
+    assert engine.level == 2
+    assert engine.move_delay < delay
+    print("✅ level and speed rules match the game")
+
+
+def test_tick_source_controls_update():
+    """update() only steps once the injected clock passes the move delay"""
+    now = [0]
+    engine = SnakeEngine(10, 10, tick_source=lambda: now[0], seed=1)
+    engine.food_pos = (0, 0)
+
+    now[0] = engine.move_delay - 1
+    assert engine.update() == []
+    now[0] = engine.move_delay
+    assert engine.update() == [Event.MOVED]
+    print("✅ injected tick source drives real-time updates")
+
+
+def test_fixed_step_scheduler():
+    """Steps come in exact quanta regardless of frame length; overruns are counted"""
+    scheduler = FixedStepScheduler(100, max_steps_per_frame=3, late_ms=50)
+    scheduler.resync(0)
+
+    steps = [scheduler.advance(now) for now in range(16, 1001, 16)]
+    assert sum(steps) == 9
+    assert abs(scheduler.alpha - 0.92) < 1e-9
+    assert scheduler.late_frames == 0
+
+    # A 1 second hitch: 3 steps run, the rest are dropped
+    assert scheduler.advance(1992) == 3
+    assert scheduler.dropped_ticks == 7
+    assert scheduler.late_frames == 1
+
+    scheduler.resync(5000)
+    assert scheduler.advance(5050) == 0
+    print("✅ fixed-step scheduler counts steps, late frames and drops")
+
+
+def test_seeded_runs_are_identical():
+    """The same seed produces the same game"""
+    def play(seed):
+        engine = SnakeEngine(20, 20, seed=seed)
+        trail = []
+        for i in range(200):
+            engine.step(Direction.UP if i % 7 == 0 else Direction.RIGHT)
+            if not engine.alive:
+                engine.reset()
+            trail.append((engine.snake[0], engine.food_pos))
+        return trail
+
+    assert play(42) == play(42)
+    print("✅ seeded runs are deterministic")
+
+
+def test_headless_throughput():
+    """The engine steps far faster than wall-clock"""
+    engine = SnakeEngine(seed=1)
+    turns = [Direction.UP, Direction.LEFT, Direction.DOWN, Direction.RIGHT]
+    steps = 20000
+    start = time.perf_counter()
+    for i in range(steps):
+        engine.step(turns[(i // 3) % 4])
+        if not engine.alive:
+            engine.reset()
+    elapsed = time.perf_counter() - start
+    print(f"✅ {steps / elapsed:,.0f} ticks/second headless")
+    assert steps / elapsed > 10000
+
+
+if __name__ == "__main__":
+    test_engine_is_headless()
+    test_step_moves_and_dies_at_wall()
+    test_reversal_is_ignored()
+    test_buffered_turns_apply_one_per_step()
+    test_eating_food_poses_question()
+    test_occupancy_tracks_body()
+    test_self_collision()
+    test_food_never_lands_on_snake()
+    test_full_board_wins()
+    test_level_up_every_five_answers()
+    test_tick_source_controls_update()
+    test_fixed_step_scheduler()
+    test_seeded_runs_are_identical()
+    test_headless_throughput()
+    print("\n🎉 All engine tests passed!")
@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+"""
+Test script for Snake Evolution offscreen rendering
+- Any screen draws to an off-screen Surface and exports as a NumPy array
+- Every screen and mini-game matches its golden image in golden/
+- The comparison tolerates small colour noise but not changed content
+- Runs under the SDL dummy video driver; refresh images with render_snake.py --update
+"""
+
+import os
+import sys
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+import numpy as np
+
+from snake_core.offscreen import MAX_MISMATCH, RenderTarget, matches, mismatch
+
+
+def test_drawing_to_offscreen_target():
+    """draw_* calls land on the target, and the window gets its surface back"""
+    import pygame
+    from snake_evolution import SnakeGame, GameState, WINDOW_WIDTH, WINDOW_HEIGHT
+
+    game = SnakeGame()
+    window = game.screen
+    window.fill((0, 0, 0))
+    target = RenderTarget.offscreen((WINDOW_WIDTH, WINDOW_HEIGHT))
+    with game.drawing_to(target.surface):
+        assert game.screen is target.surface and game.renderer.screen is target.surface
+        game.draw_scene(GameState.MENU)
+    assert game.screen is window and game.renderer.screen is window
+    assert pygame.surfarray.array3d(window).max() == 0
+
+    pixels = target.array()
+    assert pixels.shape == (WINDOW_WIDTH, WINDOW_HEIGHT, 3) and pixels.dtype == np.uint8
+    assert pixels.any()
+    game.question_bank.close()
+    print("✅ screens draw off-screen and export to NumPy")
+
+
+def test_mismatch_tolerance():
+    """Noise within the channel tolerance passes; a new shape or a resize does not"""
+    rng = np.random.default_rng(1)
+    image = rng.integers(0, 200, size=(80, 60, 3), dtype=np.uint8)
+    noisy = (image + rng.integers(0, 10, size=image.shape)).astype(np.uint8)
+    assert mismatch(image, image) == 0.0
+    assert matches(noisy, image)
+
+    changed = image.copy()
+    changed[10:20, 10:20] = 255
+    assert mismatch(changed, image) > MAX_MISMATCH
+    assert not matches(changed, image)
+    assert mismatch(image, image[:40]) == 1.0 and mismatch(image, None) == 1.0
+    print("✅ image comparison tolerance")
+
+
+def test_every_screen_matches_golden():
+    """Each GameState screen and mini-game renders like its stored golden image"""
+    import render_snake
+
+    results = render_snake.run(repeats=3)
+    assert len(results) >= 18
+    failed = [(result.name, result.status, f"{result.mismatch:.3%}") for result in results
+              if result.status != "ok"]
+    assert not failed, failed
+    slowest = max(results, key=lambda result: result.draw_ms)
+    print(f"✅ {len(results)} screens match their golden images (slowest: {slowest.name} "
+          f"{slowest.draw_ms:.2f} ms)")
+
+
+if __name__ == "__main__":
+    test_drawing_to_offscreen_target()
+    test_mismatch_tolerance()
+    test_every_screen_matches_golden()
+    print("\n🎉 All offscreen rendering tests passed!")
@@ -0,0 +1,79 @@
+#!/usr/bin/env python3
+"""
+Test script for Snake Evolution start-up cost
+- Importing snake_evolution stays within a millisecond budget and does not load pygame
+- The headless engine and replays run without pygame
+- Opening the game starts only the display and font subsystems
+"""
+
+import json
+import os
+import subprocess
+import sys
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+
+IMPORT_BUDGET_MS = 150  # `import pygame` alone takes ~250-300 ms
+
+
+def run_python(code):
+    """Run code in a fresh interpreter and return its last output line, parsed as JSON"""
+    env = dict(os.environ, SDL_VIDEODRIVER="dummy", SDL_AUDIODRIVER="dummy",
+               PYGAME_HIDE_SUPPORT_PROMPT="1")
+    result = subprocess.run([sys.executable, "-c", code], cwd=HERE, env=env,
+                            capture_output=True, text=True, timeout=60)
+    assert result.returncode == 0, result.stderr
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+def test_import_budget():
+    """The game module imports in milliseconds, leaving pygame unloaded"""
+    timings = []
+    for _ in range(3):
+        report = run_python(
+            "import json, sys, time\n"
+            "start = time.perf_counter()\n"
+            "import snake_evolution\n"
+            "elapsed = (time.perf_counter() - start) * 1000\n"
+            "print(json.dumps({'ms': elapsed, 'pygame': 'pygame.base' in sys.modules}))\n")
+        assert not report["pygame"], "importing snake_evolution loaded pygame"
+        timings.append(report["ms"])
+    assert min(timings) < IMPORT_BUDGET_MS, timings
+    print(f"✅ import snake_evolution: {min(timings):.1f} ms (budget {IMPORT_BUDGET_MS} ms)")
+
+
+def test_headless_use_without_pygame():
+    """Constants, the engine and the CLI board parser work with pygame never loaded"""
+    report = run_python(
+        "import json, sys\n"
+        "import snake_evolution as game\n"
+        "engine = game.SnakeEngine(game.GRID_WIDTH, game.GRID_HEIGHT, seed=1)\n"
+        "for _ in range(10):\n"
+        "    engine.step()\n"
+        "board = game.board_size('1000x1000')\n"
+        "print(json.dumps({'ticks': engine.ticks, 'board': board, 'pygame': 'pygame.base' in sys.modules}))\n")
+    assert report == {"ticks": 10, "board": [1000, 1000], "pygame": False}
+    print("✅ headless engine runs without pygame")
+
+
+def test_window_starts_display_and_font_only():
+    """SnakeGame initializes display and font, not audio or joysticks"""
+    report = run_python(
+        "import json\n"
+        "import snake_evolution\n"
+        "game = snake_evolution.SnakeGame()\n"
+        "pygame = snake_evolution.pygame\n"
+        "print(json.dumps({'display': pygame.display.get_init(), 'font': pygame.font.get_init(),\n"
+        "                  'mixer': pygame.mixer.get_init() is not None,\n"
+        "                  'joystick': pygame.joystick.get_init(),\n"
+        "                  'arrows': len(snake_evolution.ARROW_KEYS)}))\n"
+        "game.question_bank.close()\n")
+    assert report == {"display": True, "font": True, "mixer": False, "joystick": False, "arrows": 4}
+    print("✅ only display and font subsystems started")
+
+
+if __name__ == "__main__":
+    test_import_budget()
+    test_headless_use_without_pygame()
+    test_window_starts_display_and_font_only()
+    print("\n🎉 All import tests passed!")
@@ -0,0 +1,166 @@
+#!/usr/bin/env python3
+"""
+Test script for the Snake Evolution frame profiler
+- Laps are charged to the right phase and frames are summarized per scene
+- FPS percentiles come from the slowest frames
+- Traces are written as CSV or JSON lines
+- Keypress-to-move latency is summarized per scene
+- The overlay draws in SnakeGame and F3 toggles it
+"""
+
+import csv
+import json
+import os
+import sys
+import tempfile
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from snake_core.profiler import FrameProfiler, PROFILE_PHASES, percentile
+
+
+class FakeClock:
+    """Clock advanced by hand"""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def run_frames(profiler, clock, scene, durations):
+    """One frame per entry; each entry maps phase -> seconds"""
+    for phases in durations:
+        profiler.start_frame()
+        for phase in PROFILE_PHASES:
+            clock.now += phases.get(phase, 0.0)
+            profiler.lap(phase)
+        profiler.end_frame(scene)
+
+
+def test_phases_and_percentiles():
+    """Per-phase means, and 1% low FPS set by the slowest frame"""
+    clock = FakeClock()
+    profiler = FrameProfiler(window=100, clock=clock)
+    frames = [{"event": 0.001, "update": 0.002, "draw": 0.003, "flip": 0.001, "wait": 0.003}] * 98
+    frames += [{"update": 0.050}] * 2
+    run_frames(profiler, clock, "space_shooter", frames)
+
+    stats = profiler.summary("space_shooter")
+    assert stats["frames"] == 100
+    assert abs(stats["draw_ms"] - 2.94) < 1e-6
+    assert round(stats["fps_p50"]) == 100
+    assert round(stats["fps_p1"]) == 20
+    assert profiler.summary("menu") == {}
+    assert percentile([1.0, 2.0, 3.0], 0.5) == 2.0
+    print("✅ phase means and FPS percentiles")
+
+
+def test_window_is_rolling_per_scene():
+    """Only the last `window` samples of each scene are kept"""
+    clock = FakeClock()
+    profiler = FrameProfiler(window=10, clock=clock)
+    run_frames(profiler, clock, "car_racing", [{"draw": 0.001}] * 25)
+    run_frames(profiler, clock, "menu", [{"draw": 0.002}] * 3)
+    assert len(profiler.samples["car_racing"]) == 10
+    assert len(profiler.samples["menu"]) == 3
+    assert profiler.frames == 28
+    assert profiler.lines("menu")[0] == "menu  (3 frames)"
+    print("✅ rolling window per scene")
+
+
+def test_trace_export():
+    """Every frame is written to CSV or JSONL"""
+    with tempfile.TemporaryDirectory() as folder:
+        for name in ("trace.csv", "trace.jsonl"):
+            path = os.path.join(folder, name)
+            clock = FakeClock()
+            profiler = FrameProfiler(clock=clock, trace_path=path)
+            run_frames(profiler, clock, "playing", [{"update": 0.004, "wait": 0.012}] * 5)
+            profiler.close()
+            with open(path, encoding="utf-8") as trace:
+                if name.endswith(".csv"):
+                    rows = list(csv.DictReader(trace))
+                else:
+                    rows = [json.loads(line) for line in trace]
+            assert len(rows) == 5
+            assert rows[-1]["scene"] == "playing"
+            assert float(rows[-1]["frame_ms"]) == 16.0
+            assert int(rows[-1]["frame"]) == 4
+    print("✅ CSV and JSONL traces")
+
+
+def test_input_latency():
+    """Latencies land in the frame they were measured in and in the scene summary"""
+    clock = FakeClock()
+    profiler = FrameProfiler(clock=clock)
+    run_frames(profiler, clock, "playing", [{"update": 0.001}] * 3)
+    assert profiler.samples["playing"][-1]["input_ms"] is None
+    assert "input_ms" not in profiler.summary("playing")
+
+    profiler.input_latency(40.0)
+    profiler.input_latency(90.0)
+    run_frames(profiler, clock, "playing", [{"update": 0.001}])
+    assert profiler.samples["playing"][-1]["input_ms"] == 90.0
+    stats = profiler.summary("playing")
+    assert stats["turns"] == 2 and stats["input_ms"] == 65.0 and stats["input_p95_ms"] == 90.0
+    assert profiler.lines("playing")[-1].startswith("input 65.0 ms")
+    print("✅ input latency per scene")
+
+
+def test_buffered_turns_in_snake_game():
+    """Two arrow presses before a move both happen, and their latency reaches the profiler"""
+    import pygame
+    from snake_evolution import SnakeGame, GameState
+    from snake_core.engine import Direction
+
+    game = SnakeGame()
+    game.start_game()
+    game.engine.food_pos = (0, 0)
+    x, y = game.engine.snake[0]
+    for key in (pygame.K_UP, pygame.K_LEFT):
+        pygame.event.post(pygame.event.Event(pygame.KEYDOWN, key=key))
+    assert game.handle_input()
+    game.step_snake()
+    game.step_snake()
+    assert game.engine.snake[0] == (x - 1, y - 1)
+    assert game.engine.direction == Direction.LEFT
+    game.profiler.end_frame(GameState.PLAYING)
+    assert game.profiler.summary(GameState.PLAYING)["turns"] == 2
+    game.question_bank.close()
+    print("✅ quick turns are buffered, not overwritten")
+
+
+def test_overlay_in_snake_game():
+    """F3 shows the panel for the active scene"""
+    import pygame
+    from snake_evolution import SnakeGame, GameState
+
+    game = SnakeGame()
+    assert game.draw_profiler_overlay(GameState.MENU) is None
+    pygame.event.post(pygame.event.Event(pygame.KEYDOWN, key=pygame.K_F3))
+    assert game.handle_input()
+    assert game.show_profiler
+
+    for _ in range(3):
+        game.profiler.start_frame()
+        game.scenes.draw(GameState.MENU)
+        game.profiler.lap("draw")
+        game.profiler.end_frame(GameState.MENU)
+    rect = game.draw_profiler_overlay(GameState.MENU)
+    assert rect is not None and rect.right <= game.screen.get_width()
+    assert game.profiler.summary(GameState.MENU)["frames"] == 3
+    game.question_bank.close()
+    print("✅ profiler overlay draws")
+
+
+if __name__ == "__main__":
+    test_phases_and_percentiles()
+    test_window_is_rolling_per_scene()
+    test_trace_export()
+    test_input_latency()
+    test_buffered_turns_in_snake_game()
+    test_overlay_in_snake_game()
+    print("\n🎉 All profiler tests passed!")
@@ -0,0 +1,231 @@
+#!/usr/bin/env python3
+"""
+Test script for the Snake Evolution dirty-rectangle renderer
+- Partial updates must leave the screen identical to a full redraw
+- Chunked rendering of large boards matches drawing the whole board
+- The sprite atlas faces the head and tail the right way and pulses the food
+- Runs under the SDL dummy video driver
+"""
+
+import os
+import sys
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+import pygame
+
+from snake_core.atlas import GLOW_PHASES, SpriteAtlas, glow_color
+from snake_core.engine import SnakeEngine, Direction
+from snake_core.render import Camera, ChunkedRenderer, PlayfieldRenderer
+
+
+def snapshot(surface, mask):
+    """Copy the surface with the pulsing food area blanked out"""
+    copy = surface.copy()
+    if mask:
+        copy.fill((0, 0, 0), mask)
+    return pygame.image.tobytes(copy, "RGB")
+
+
+def make_renderer(hud):
+    pygame.display.init()
+    pygame.font.init()
+    screen = pygame.display.set_mode((400, 300))
+    font = pygame.font.Font(None, 36)
+    engine = SnakeEngine(20, 15, seed=7)
+
+    def draw_hud():
+        screen.blit(font.render(f"Score: {hud['score']}", True, (255, 255, 255)), (10, 10))
+
+    renderer = PlayfieldRenderer(screen, engine, 20, font, draw_hud, lambda: (hud['score'],))
+    return screen, engine, renderer
+
+
+def test_dirty_frames_match_full_redraw():
+    """A run of partial updates ends on the same pixels as a full redraw"""
+    hud = {'score': 0}
+    screen, engine, renderer = make_renderer(hud)
+    engine.grow_snake()
+    engine.grow_snake()
+    renderer.present()
+    assert renderer.full_redraws == 1
+
+    turns = [Direction.UP, Direction.UP, Direction.LEFT, Direction.LEFT,
+             Direction.DOWN, Direction.DOWN, Direction.DOWN, Direction.RIGHT]
+    for i, turn in enumerate(turns * 2):
+        engine.step(turn)
+        if i == 5:
+            hud['score'] = 40
+            engine.generate_food()
+        pushed = renderer.present()
+        assert 0 < pushed < 10
+        assert engine.alive
+
+    assert renderer.full_redraws == 1
+    dirty = snapshot(screen, renderer.food_rect())
+    renderer.draw_full()
+    assert snapshot(screen, renderer.food_rect()) == dirty
+    print("✅ dirty-rect frames match a full redraw")
+
+
+def test_interpolated_frames_match_full_redraw():
+    """Sliding the head between cells leaves no stale pixels behind"""
+    hud = {'score': 0}
+    screen, engine, renderer = make_renderer(hud)
+    engine.grow_snake()
+    renderer.present()
+
+    for turn in [Direction.UP, Direction.LEFT, Direction.DOWN, Direction.DOWN]:
+        engine.step(turn)
+        for alpha in (0.0, 0.25, 0.5, 0.75, 1.0):
+            renderer.present(alpha)
+
+    engine.step()
+    renderer.present(0.4)
+    dirty = snapshot(screen, renderer.food_rect())
+    renderer.draw_full()
+    assert snapshot(screen, renderer.food_rect()) == dirty
+    print("✅ interpolated frames match a full redraw")
+
+
+def test_full_redraw_fallback():
+    """Turning dirty rects off redraws everything every frame"""
+    hud = {'score': 0}
+    screen, engine, renderer = make_renderer(hud)
+    renderer.dirty_rects = False
+    for _ in range(3):
+        engine.step()
+        renderer.present()
+    assert renderer.full_redraws == 3
+    assert renderer.partial_updates == 0
+    print("✅ full redraw fallback works")
+
+
+def test_invalidate_forces_full_redraw():
+    """Leaving the playfield forces the next frame to redraw fully"""
+    hud = {'score': 0}
+    screen, engine, renderer = make_renderer(hud)
+    renderer.present()
+    engine.step()
+    renderer.present()
+    renderer.invalidate()
+    renderer.present()
+    assert renderer.full_redraws == 2
+    print("✅ invalidate() forces a full redraw")
+
+
+def test_text_cache_reuses_surfaces():
+    """Static strings are rendered once; switching language clears the cache"""
+    from snake_core.text_cache import TextCache
+
+    pygame.font.init()
+    font = pygame.font.Font(None, 24)
+    cache = TextCache(maxsize=2)
+    first = cache.render(font, "Score", True, (255, 255, 255))
+    assert cache.render(font, "Score", True, (255, 255, 255)) is first
+    assert cache.stats()['hits'] == 1 and cache.stats()['misses'] == 1
+
+    cache.render(font, "Level", True, (255, 255, 255))
+    cache.render(font, "Streak", True, (255, 255, 255))
+    assert len(cache) == 2 and cache.evictions == 1
+
+    cache.set_language("tamil")
+    assert len(cache) == 0
+    print("✅ text cache hits, evicts and clears on language change")
+
+
+def test_sprite_atlas():
+    """Eyes lead the head, the tail rounds off away from the body, the glow cycles"""
+    pygame.font.init()
+    atlas = SpriteAtlas(20, pygame.font.Font(None, 36))
+    sheet = atlas.sheet
+
+    def pixel(area, x, y):
+        return tuple(sheet.get_at((area.x + x, area.y + y)))[:3]
+
+    assert pixel(atlas.head[Direction.UP], 5, 5) == (255, 255, 255)
+    assert pixel(atlas.head[Direction.UP], 5, 15) == (0, 255, 0)
+    assert pixel(atlas.head[Direction.RIGHT], 15, 5) == (255, 255, 255)
+    assert pixel(atlas.head[Direction.RIGHT], 5, 5) == (0, 255, 0)
+    # Body to the right: square on the right edge, transparent top-left corner
+    right = atlas.tail_towards((4, 4), (5, 4))
+    assert right == atlas.tail[Direction.RIGHT]
+    assert pixel(right, 19, 0) == (0, 200, 0)
+    assert sheet.get_at((right.x, right.y)) == sheet.get_colorkey()
+
+    assert len(atlas.food) == GLOW_PHASES
+    assert atlas.food_at(0) == atlas.food[0] and atlas.food_at(1999) == atlas.food[-1]
+    assert glow_color(0)[1] > 200 and glow_color(GLOW_PHASES // 2)[1] < 20
+    print("✅ sprite atlas heads, tails and food phases")
+
+
+def test_camera_clamps_to_board():
+    """The view never leaves the board; boards smaller than the view are centred"""
+    camera = Camera(800, 600, 20000, 20000)
+    camera.follow(10, 10)
+    assert (camera.x, camera.y) == (0, 0)
+    camera.follow(10000, 10000)
+    assert (camera.x, camera.y) == (9600, 9700)
+    camera.follow(19990, 19990)
+    assert camera.visible().bottomright == (20000, 20000)
+    camera.resize(400, 300)
+    camera.follow(200, 150)
+    assert (camera.x, camera.y) == (-200, -150)
+    print("✅ camera clamps and centres")
+
+
+def test_chunked_frames_match_whole_board():
+    """Cached, patched chunks give the same view as drawing the full board and cropping it"""
+    pygame.font.init()
+    screen = pygame.Surface((400, 300))
+    font = pygame.font.Font(None, 36)
+    engine = SnakeEngine(120, 90, seed=3)
+    chunked = ChunkedRenderer(screen, engine, 20, font, lambda: None, lambda: (), cache_size=24)
+    board = pygame.Surface((120 * 20, 90 * 20))
+    reference = PlayfieldRenderer(board, engine, 20, font, lambda: None, lambda: ())
+
+    engine.place_snake([(60 - i, 45) for i in range(40)])
+    moves = [Direction.RIGHT] * 25 + [Direction.DOWN] * 12 + [Direction.LEFT] * 30 + [Direction.UP] * 20
+    for tick, direction in enumerate(moves):
+        engine.food_pos = None  # The food glow pulses with the wall clock
+        engine.step(direction)
+        if tick % 7 == 0:
+            chunked.draw_full()
+            reference.draw_full()
+            view = chunked.camera.visible()
+            expected = board.subsurface(view)
+            assert pygame.image.tobytes(screen, "RGB") == pygame.image.tobytes(expected, "RGB"), tick
+    assert engine.alive
+    assert len(chunked.chunks) <= 24
+    assert chunked.cells_patched > 0
+    print(f"✅ chunked view matches the full board ({chunked.chunks_rendered} chunks painted)")
+
+
+def test_marathon_board():
+    """A 1000x1000 game resets quickly and only paints the chunks in view"""
+    from snake_evolution import SnakeGame
+
+    game = SnakeGame(board_size=(1000, 1000))
+    assert isinstance(game.renderer, ChunkedRenderer)
+    game.start_game()
+    for _ in range(30):
+        game.step_snake()
+        game.present_playfield()
+    assert game.engine.snake[0] == (530, 500)
+    assert game.renderer.chunks_rendered <= 16
+    game.question_bank.close()
+    print("✅ 1000x1000 board plays with a camera")
+
+
+if __name__ == "__main__":
+    test_dirty_frames_match_full_redraw()
+    test_interpolated_frames_match_full_redraw()
+    test_full_redraw_fallback()
+    test_invalidate_forces_full_redraw()
+    test_text_cache_reuses_surfaces()
+    test_sprite_atlas()
+    test_camera_clamps_to_board()
+    test_chunked_frames_match_whole_board()
+    test_marathon_board()
+    print("\n🎉 All renderer tests passed!")
@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+"""
+Test script for Snake Evolution session replays
+- Recorded sessions replay to the identical game state
+- The binary log stays compact
+"""
+
+import os
+import random
+import sys
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from snake_core.engine import SnakeEngine, Direction, Question
+from snake_core.replay import ReplayRecorder, ReplayPlayer
+
+
+def question_source(level):
+    """A question whose content depends on the global RNG, as in the game"""
+    a, b = random.randint(1, 9), random.randint(1, 9)
+    return Question(question=f"{a} + {b} = ?", answer=a + b,
+                    options=[a + b, a + b + 1, a + b - 1, a + b + 2],
+                    difficulty=level, subject="math")
+
+
+def chase_food(engine, rng):
+    """Mostly head for the food, avoiding walls and the body"""
+    head_x, head_y = engine.snake[0]
+    food_x, food_y = engine.food_pos
+    options = list(Direction)
+    rng.shuffle(options)
+    options.sort(key=lambda d: abs(head_x + d.value[0] - food_x) + abs(head_y + d.value[1] - food_y))
+    for direction in options:
+        x, y = head_x + direction.value[0], head_y + direction.value[1]
+        if 0 <= x < engine.width and 0 <= y < engine.height and not engine.is_occupied((x, y)):
+            return direction
+    return engine.direction
+
+
+def play_session(engine, rng, games=3):
+    """Drive the engine like a player would; returns snapshots per tick"""
+    trail = []
+    for game in range(games):
+        if game:
+            engine.reset()
+        while engine.alive and engine.ticks < 2000:
+            if engine.current_question is not None:
+                engine.answer_question(rng.randrange(4))
+            else:
+                # Several key presses may land between two ticks
+                for _ in range(rng.choice([0, 0, 1, 2])):
+                    engine.turn(rng.choice(list(Direction)))
+                engine.turn(chase_food(engine, rng))
+                engine.step()
+            trail.append((tuple(engine.snake), engine.food_pos, engine.score, engine.level))
+    return trail
+
+
+def test_replay_reproduces_session():
+    """Replaying the log gives the same game, tick for tick"""
+    engine = SnakeEngine(15, 12, question_source=question_source)
+    recorder = ReplayRecorder()
+    recorder.start(engine)
+    play_session(engine, random.Random(11))
+    data = recorder.to_bytes()
+
+    player = ReplayPlayer(data)
+    replayed = player.run()
+    assert replayed.ticks == engine.ticks
+    assert list(replayed.snake) == list(engine.snake)
+    assert replayed.food_pos == engine.food_pos
+    assert replayed.score == engine.score
+    assert replayed.questions_total == engine.questions_total
+    assert replayed.best_streak == engine.best_streak
+    print(f"✅ replay matches ({len(data)} bytes for {engine.questions_total} answers)")
+
+
+def test_replay_is_deterministic_per_tick():
+    """Every intermediate tick matches, not just the final state"""
+    engine = SnakeEngine(10, 10)
+    recorder = ReplayRecorder()
+    recorder.start(engine, seed=1234)
+    rng = random.Random(3)
+    expected = []
+    while engine.alive:
+        if rng.random() < 0.3:
+            engine.turn(rng.choice(list(Direction)))
+        engine.step()
+        expected.append(tuple(engine.snake))
+
+    player = ReplayPlayer(recorder.to_bytes())
+    player.start()
+    replayed = [tuple(player.engine.snake) for _ in player.frames()]
+    assert player.seed == 1234
+    assert replayed == expected
+    print("✅ per-tick replay matches")
+
+
+def test_replay_rejects_garbage():
+    """Anything that is not a replay is refused"""
+    try:
+        ReplayPlayer(b"not a replay at all, sorry")
+    except ValueError:
+        print("✅ invalid replay rejected")
+        return
+    assert False, "garbage accepted"
+
+
+if __name__ == "__main__":
+    test_replay_reproduces_session()
+    test_replay_is_deterministic_per_tick()
+    test_replay_rejects_garbage()
+    print("\n🎉 All replay tests passed!")
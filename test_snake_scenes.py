@@ -0,0 +1,148 @@
+#!/usr/bin/env python3
+"""
+Test script for the Snake Evolution scene registry
+- Dispatch goes to the active scene and is timed per scene
+- Every registered screen and mini-game runs a frame
+- Static screens sleep until input instead of redrawing every frame
+- Runs under the SDL dummy video driver
+"""
+
+import os
+import sys
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+import pygame
+
+from snake_core.scenes import CallbackScene, Scene, SceneRegistry
+
+
+class CountingScene(Scene):
+    """Counts calls to each hook"""
+
+    def __init__(self):
+        self.calls = []
+
+    def enter(self):
+        self.calls.append("enter")
+
+    def handle_event(self, event):
+        self.calls.append(("event", event))
+        return event != "quit"
+
+    def update(self):
+        self.calls.append("update")
+
+    def draw(self):
+        self.calls.append("draw")
+
+
+def test_registry_dispatch_and_probes():
+    """Calls reach the scene and every frame lands in its own probe"""
+    now = [0.0]
+
+    def clock():
+        now[0] += 0.001
+        return now[0]
+
+    registry = SceneRegistry(clock=clock)
+    menu, game = CountingScene(), CountingScene()
+    registry.register("menu", menu)
+    registry.register("game", game)
+
+    registry.enter("game")
+    assert registry.handle_event("game", "left")
+    assert not registry.handle_event("game", "quit")
+    for _ in range(3):
+        registry.frame("game")
+
+    assert game.calls == ["enter", ("event", "left"), ("event", "quit")] + ["update", "draw"] * 3
+    assert menu.calls == []
+    stats = registry.stats()
+    assert list(stats) == ["game"]
+    assert stats["game"]["frames"] == 3
+    assert abs(stats["game"]["draw_ms"] - 1.0) < 1e-6
+    assert len(registry.report()) == 2
+    print("✅ registry dispatch and probes work")
+
+
+def test_callback_scene_defaults():
+    """Missing callbacks are no-ops and None from a handler keeps the game running"""
+    scene = CallbackScene(handle_event=lambda event: None)
+    assert scene.handle_event("key")
+    scene.update()
+    scene.draw()
+    scene.enter()
+    print("✅ callback scene defaults")
+
+
+def test_every_game_scene_runs():
+    """Each screen and mini-game handles a key, updates and draws through the registry"""
+    from snake_evolution import GameState, SnakeGame
+
+    game = SnakeGame()
+    key = pygame.event.Event(pygame.KEYDOWN, key=pygame.K_SPACE)
+
+    for state in (GameState.MENU, GameState.CATEGORY_SELECT, GameState.PAUSED, GameState.GAME_OVER):
+        game.state = state
+        game.scenes.frame(game.active_scene())
+
+    for index, name in enumerate(game.python_games):
+        game.state = GameState.PYTHON_GAME_SELECT
+        game.handle_python_select_input(pygame.event.Event(pygame.KEYDOWN, key=pygame.K_1 + index))
+        assert game.state == GameState.PYTHON_GAME_PLAYING
+        assert game.active_scene() == name
+        game.handle_python_game_input(key)
+        game.scenes.frame(game.active_scene())
+
+    for index, name in enumerate(game.education_games):
+        game.state = GameState.EDUCATION_GAME_SELECT
+        game.handle_education_select_input(pygame.event.Event(pygame.KEYDOWN, key=pygame.K_1 + index))
+        assert game.active_scene() == name
+        game.scenes.frame(game.active_scene())
+
+    stats = game.scenes.stats()
+    for name in game.python_games + game.education_games:
+        assert stats[name]["frames"] == 1
+    game.question_bank.close()
+    print(f"✅ {len(stats)} scenes ran through the registry")
+
+
+def test_static_screens_wait_for_input():
+    """Menus block until a key or an animation tick; play never waits"""
+    import time
+    from snake_evolution import SnakeGame, GameState, IDLE_REDRAW_MS
+
+    game = SnakeGame()
+    saved = dict(IDLE_REDRAW_MS)
+    IDLE_REDRAW_MS[GameState.MENU] = 150
+    try:
+        pygame.event.clear()
+        start = time.perf_counter()
+        assert game.frame()
+        idle = time.perf_counter() - start
+        assert idle >= 0.14 and game.profiler.frames == 1
+
+        pygame.event.post(pygame.event.Event(pygame.KEYDOWN, key=pygame.K_l))
+        start = time.perf_counter()
+        assert game.frame()
+        assert time.perf_counter() - start < 0.14
+        assert game.language == "tamil"
+
+        game.start_game()
+        start = time.perf_counter()
+        game.frame()
+        assert time.perf_counter() - start < 0.14
+    finally:
+        IDLE_REDRAW_MS.update(saved)
+    game.question_bank.close()
+    print(f"✅ menu slept {idle * 1000:.0f} ms without input and woke on a key")
+
+
+if __name__ == "__main__":
+    test_registry_dispatch_and_probes()
+    test_callback_scene_defaults()
+    test_every_game_scene_runs()
+    test_static_screens_wait_for_input()
+    print("\n🎉 All scene tests passed!")
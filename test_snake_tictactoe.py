@@ -0,0 +1,123 @@
+#!/usr/bin/env python3
+"""
+Test script for the Snake Evolution Tic-Tac-Toe engine
+- Bitboard win masks for N x N boards, k in a row
+- The alpha-beta AI never loses on 3x3 and finds wins and blocks on 7x7
+- The mini-game plays against the computer
+"""
+
+import os
+import sys
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from snake_core.tictactoe import AlphaBetaAI, TicTacToe, TIE, geometry
+
+
+def test_win_masks():
+    """Line counts match the board geometry, and lines are found in every direction"""
+    assert len(geometry(3, 3).lines) == 8
+    assert len(geometry(7, 5).lines) == 2 * 7 * 3 + 2 * 3 * 3
+    assert geometry(3, 3).order[0] == 4  # Centre first
+
+    for cells in ([0, 1, 2, 3, 4], [6, 13, 20, 27, 34], [8, 16, 24, 32, 40], [4, 10, 16, 22, 28]):
+        game = TicTacToe(7, 5)
+        for cell in cells:
+            assert game.winner is None
+            game.play(cell)
+            if not game.over:
+                game.play(next(other for other in reversed(game.legal_moves()) if other not in cells))
+        assert game.winner == "X", cells
+    print("✅ win masks cover rows, columns and diagonals")
+
+
+def test_play_and_undo():
+    """Moves alternate, illegal moves raise, undo restores the position"""
+    game = TicTacToe()
+    for cell in (0, 3, 1, 4):
+        game.play(cell)
+    assert game.current == "X"
+    try:
+        game.play(0)
+        assert False, "occupied cell accepted"
+    except ValueError:
+        pass
+    assert game.play(2) == "X"
+    game.undo()
+    assert not game.over and game.current == "X" and game.cell(2) == " "
+    print("✅ play and undo")
+
+
+def test_ai_never_loses_3x3():
+    """Against every possible line of play the AI at least draws, as either side"""
+    def explore(game, ai, ai_turn):
+        if game.over:
+            assert game.winner in (TIE, "XO"[ai_turn]), game.history
+            return
+        if game.turn == ai_turn:
+            game.play(ai.choose(game))
+            explore(game, ai, ai_turn)
+            game.undo()
+        else:
+            for cell in game.legal_moves():
+                game.play(cell)
+                explore(game, ai, ai_turn)
+                game.undo()
+
+    for ai_turn in (0, 1):
+        explore(TicTacToe(), AlphaBetaAI(), ai_turn)
+    game, ai = TicTacToe(), AlphaBetaAI()
+    while not game.over:
+        game.play(ai.choose(game))
+    assert game.winner == TIE
+    print("✅ perfect play on 3x3")
+
+
+def test_ai_wins_and_blocks_7x7():
+    """A depth-limited AI completes its own five and blocks the opponent's four"""
+    game, ai = TicTacToe(7, 5), AlphaBetaAI(max_depth=2)
+    for cell in (0, 48, 1, 47, 2, 46, 3, 45):
+        game.play(cell)
+    assert ai.choose(game) == 4  # X to move: win beats blocking
+
+    game.undo()
+    assert ai.choose(game) == 4  # O to move: only the block saves the game
+    print("✅ 7x7 connect-5 wins and blocks")
+
+
+def test_snake_game_tic_tac_toe():
+    """Human moves get computer replies; V changes the board"""
+    import pygame
+    from snake_evolution import SnakeGame
+
+    def press(key):
+        game.handle_ttt_input(pygame.event.Event(pygame.KEYDOWN, key=key))
+
+    game = SnakeGame()
+    game.init_tic_tac_toe()
+    press(pygame.K_1)
+    assert game.ttt.cell(0) == "X" and len(game.ttt.history) == 2
+    assert game.ttt.cell(4) == "O"
+    while not game.ttt.over:
+        press(pygame.K_SPACE) if game.ttt.legal(game.ttt_cursor) else press(pygame.K_RIGHT)
+    assert game.ttt.winner in (TIE, "O")
+    game.draw_tic_tac_toe()
+
+    press(pygame.K_v)
+    assert game.ttt.size == 5 and not game.ttt.history
+    press(pygame.K_c)
+    press(pygame.K_RETURN)
+    assert len(game.ttt.history) == 1
+    game.draw_tic_tac_toe()
+    game.question_bank.close()
+    print("✅ Tic-Tac-Toe mini-game plays the computer")
+
+
+if __name__ == "__main__":
+    test_win_masks()
+    test_play_and_undo()
+    test_ai_never_loses_3x3()
+    test_ai_wins_and_blocks_7x7()
+    test_snake_game_tic_tac_toe()
+    print("\n🎉 All Tic-Tac-Toe tests passed!")